@@ -5,13 +5,19 @@
 
 import os
 import sys
-import json
+import re
 import time
+import sqlite3
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from typing import List, Dict
 from dotenv import load_dotenv
-import hashlib
+from urllib.parse import urljoin
+import httpx
 
 # Selenium imports
 from selenium import webdriver
@@ -19,10 +25,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 
 # Notion imports
-from notion_client import Client
+from notion_client import Client, APIResponseError
+
+# 목록 페이지 HTML 파서 (없으면 Selenium 경로 사용)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# HTTP/2 지원 (h2 패키지가 있을 때만)
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 # 환경변수 로드
 load_dotenv()
@@ -37,12 +56,169 @@ logging.basicConfig(
     ]
 )
 
+# 게시물 ID / 목록 행 / 본문 선택자 (호출마다 재생성하지 않도록 모듈 상수로 유지)
+_ARTICLE_ID_RE = re.compile(r'articleid=(\d+)')
+
+_BOARD_ROW_SELECTORS = (
+    'div.article-board table tbody tr',  # 구형 카페
+    'ul.article-movie-sub li',  # 영화형
+    'div.ArticleListItem',  # 새형 카페
+    'tr[class*="board-list"]',  # 일반 리스트
+    'div.inner_list > a'  # 모바일형
+)
+_BOARD_ROW_SELECTOR_UNION = ', '.join(_BOARD_ROW_SELECTORS)
+
+# 목록 행 내부 필드 선택자 (BOARD_ROWS_JS와 동일한 우선순위)
+_ROW_LINK_SELECTORS = ('a.article', 'td.td_article a', '.inner_list a', 'a')
+_ROW_AUTHOR_SELECTORS = ('td.td_name a', '.td_name', '.nick', '.p-nick')
+_ROW_DATE_SELECTORS = ('td.td_date', '.td_date', '.date')
+_ROW_VIEW_SELECTORS = ('td.td_view', '.td_view', '.view')
+
+_DETAIL_SELECTORS = (
+    '.se-main-container',
+    '.ContentRenderer',
+    '#postViewArea',
+    '.NHN_Writeform_Main',
+    '#content-area',
+    '.post_ct',
+    '#tbody',
+    'td.view',
+    '.view_content',
+    '.board-read-body'
+)
+
+# 본문 정리 시 제외할 줄 (메뉴/내비게이션 텍스트)
+_SKIP_TOKENS = ('로그인', '메뉴', '목록', '이전글', '다음글', '댓글')
+
+# 크롤링에 불필요한 리소스 (CDP Network.setBlockedURLs 패턴)
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp',
+    '*.woff*', '*.mp4', '*.css',
+    '*/ads/*', '*google-analytics*', '*doubleclick*'
+]
+
+# 게시판 목록 일괄 추출 스크립트 (행마다 WebDriver 왕복하지 않도록 한 번에 수집)
+BOARD_ROWS_JS = """
+var selectors = arguments[0];
+var linkSelectors = ['a.article', 'td.td_article a', '.inner_list a', 'a'];
+var authorSelectors = ['td.td_name a', '.td_name', '.nick', '.p-nick'];
+var dateSelectors = ['td.td_date', '.td_date', '.date'];
+var viewSelectors = ['td.td_view', '.td_view', '.view'];
+
+function firstText(row, sels) {
+    for (var i = 0; i < sels.length; i++) {
+        var el = row.querySelector(sels[i]);
+        if (el) {
+            var text = (el.innerText || el.textContent || '').trim();
+            if (text) return text;
+        }
+    }
+    return '';
+}
+
+for (var s = 0; s < selectors.length; s++) {
+    var rows = document.querySelectorAll(selectors[s]);
+    if (!rows.length) continue;
+
+    var result = [];
+    for (var r = 0; r < rows.length; r++) {
+        var row = rows[r];
+        var cls = String(row.className || '');
+        if (cls.toLowerCase().includes('notice') || cls.includes('공지')) continue;
+        if (!(row.innerText || '').trim()) continue;
+
+        var title = '';
+        var link = '';
+        for (var k = 0; k < linkSelectors.length; k++) {
+            var a = row.querySelector(linkSelectors[k]);
+            if (!a) continue;
+            title = (a.innerText || a.textContent || '').trim();
+            link = a.href || '';
+            if (title && link) break;
+        }
+
+        result.push({
+            title: title,
+            link: link,
+            author: firstText(row, authorSelectors),
+            date: firstText(row, dateSelectors),
+            views: firstText(row, viewSelectors)
+        });
+    }
+    return {selector: selectors[s], total: rows.length, rows: result};
+}
+return null;
+"""
+
+# 본문 추출 스크립트: 선택자 순서대로 시도하고 30자 넘는 첫 결과에서 즉시 반환
+# 이미지 src도 같은 호출에서 수집 (execute_script 왕복 1회)
+EXTRACT_JS = """
+var selectors = arguments[0];
+
+function collectImages(elem) {
+    var images = [];
+    var imgs = elem.querySelectorAll('img[src], img[data-src]');
+    for (var j = 0; j < imgs.length; j++) {
+        var src = imgs[j].getAttribute('data-src') || imgs[j].getAttribute('src');
+        if (src && !src.includes('emoticon')) images.push(src);
+    }
+    return images;
+}
+
+for (var i = 0; i < selectors.length; i++) {
+    var elem = document.querySelector(selectors[i]);
+    if (!elem) continue;
+    var text = (elem.innerText || elem.textContent || '').trim();
+    if (text.length <= 30) continue;
+    return {
+        source: i === 0 ? 'se-main' : (i === 1 ? 'cr' : 'fallback'),
+        selector: selectors[i],
+        html_len: elem.innerHTML.length,
+        text: text,
+        images: collectImages(elem)
+    };
+}
+
+// 최후의 수단: 댓글/메뉴를 제외한 가장 긴 div
+var best = null;
+var bestText = '';
+var divs = document.querySelectorAll('div');
+for (var n = 0; n < divs.length; n++) {
+    var cls = String(divs[n].className || '');
+    if (cls.includes('comment') || cls.includes('reply') || cls.includes('menu') || cls.includes('nav')) continue;
+    var t = (divs[n].innerText || divs[n].textContent || '').trim();
+    if (t.length > 100 && t.length > bestText.length) {
+        best = divs[n];
+        bestText = t;
+    }
+}
+if (!best) return null;
+return {source: 'body', selector: 'div', html_len: best.innerHTML.length, text: bestText, images: collectImages(best)};
+"""
+
+# 자동화 탐지 우회 스크립트 (드라이버 생성 시 한 번 등록, 모든 문서에 적용)
+STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+window.chrome = window.chrome || {runtime: {}};
+var originalQuery = window.navigator.permissions && window.navigator.permissions.query;
+if (originalQuery) {
+    window.navigator.permissions.query = function(parameters) {
+        return parameters.name === 'notifications'
+            ? Promise.resolve({state: Notification.permission})
+            : originalQuery(parameters);
+    };
+}
+"""
+
 class NaverCafeCrawler:
     """네이버 카페 크롤러"""
     
     def __init__(self):
         self.driver = None
         self.wait = None
+        self.http = None
         self.setup_driver()
         
     def setup_driver(self):
@@ -55,17 +231,47 @@ class NaverCafeCrawler:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-gpu')
+            # 메모리 절감 (로컬 디버깅 시 불안정할 수 있어 CI에서만)
+            options.add_argument('--single-process')
+            options.add_argument('--no-zygote')
         
         # 기본 옵션
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        # --disable-features는 마지막 값만 적용되므로 한 번에 지정
+        options.add_argument('--disable-features=AutomationControlled,TranslateUI,BlinkGenPropertyTrees')
+        options.add_argument('--no-first-run')
+        options.add_argument('--no-default-browser-check')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disk-cache-size=33554432')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
+        # DOMContentLoaded 시점에 driver.get 반환 (목표 요소는 WebDriverWait로 대기)
+        # window.onload 이후 늦게 주입되는 스크립트는 의도적으로 기다리지 않음
+        options.page_load_strategy = 'eager'
+        
+        # 이미지 로딩 비활성화 (본문 추출에는 img src 문자열만 필요)
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2
+        })
+        
         try:
             self.driver = webdriver.Chrome(options=options)
             self.wait = WebDriverWait(self.driver, 10)
+            
+            # 자동화 탐지 우회 (이후 열리는 모든 페이지에 적용)
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_JS})
+            
+            # 이미지/폰트/CSS/광고 요청 차단으로 페이지 용량 절감
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logging.warning(f"⚠️ 리소스 차단 설정 실패: {e}")
+            
             logging.info("✅ 크롬 드라이버 초기화 성공")
         except Exception as e:
             logging.error(f"❌ 드라이버 초기화 실패: {e}")
@@ -74,21 +280,6 @@ class NaverCafeCrawler:
     def login_naver(self):
         """네이버 로그인 - 자동화 탐지 우회 강화"""
         try:
-            # 자동화 탐지 우회 설정
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['ko-KR', 'ko']
-                    });
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                '''
-            })
-            
             self.driver.get('https://nid.naver.com/nidlogin.login')
             time.sleep(3)
             
@@ -129,203 +320,74 @@ class NaverCafeCrawler:
             current_url = self.driver.current_url
             if any(success_indicator in current_url for success_indicator in ['naver.com', 'main', 'home']):
                 logging.info("✅ 네이버 로그인 성공")
-                return True
             else:
                 logging.warning(f"⚠️ 로그인 후 추가 확인 필요: {current_url}")
-                return True
+            
+            self._init_http_session()
+            return True
             
         except Exception as e:
             logging.error(f"❌ 로그인 실패: {e}")
             return False
     
+    def _init_http_session(self):
+        """로그인 쿠키를 HTTP 세션으로 복사 (JS가 필요 없는 목록 페이지용)"""
+        try:
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+            self.http = httpx.Client(
+                headers={'User-Agent': user_agent, 'Referer': 'https://cafe.naver.com/'},
+                follow_redirects=True,
+                timeout=15
+            )
+            for cookie in self.driver.get_cookies():
+                self.http.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+        except Exception as e:
+            logging.warning(f"⚠️ HTTP 세션 준비 실패, Selenium만 사용: {e}")
+            self.http = None
+    
     def get_article_content(self, url: str) -> str:
         """게시물 상세 내용 가져오기 - 최종 강화 버전"""
         try:
             logging.info(f"📖 게시물 내용 크롤링 시작: {url}")
             
-            # 새 탭에서 열기 (안정성 향상)
-            original_window = self.driver.current_window_handle
-            self.driver.execute_script(f"window.open('{url}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            
-            # 충분한 로딩 시간 (더 길게)
-            time.sleep(12)
+            # 같은 탭에서 이동 (탭마다 렌더러 프로세스가 새로 뜨는 것 방지)
+            self.driver.switch_to.default_content()
+            self.driver.get(url)
             
-            # iframe 전환 필수
-            iframe_switched = False
+            # iframe 전환 필수 (고정 대기 대신 iframe 준비 즉시 진행)
             try:
-                self.driver.switch_to.frame('cafe_main')
-                iframe_switched = True
+                WebDriverWait(self.driver, 15).until(
+                    EC.frame_to_be_available_and_switch_to_it('cafe_main')
+                )
                 logging.info("✅ iframe 전환 성공")
-                time.sleep(2)  # iframe 로드 대기
             except Exception as e:
                 logging.warning(f"⚠️ iframe 전환 실패: {e}")
             
-            # 내용 추출 - 다양한 방법 시도
-            content = ""
+            # 본문 컨테이너 등장 대기
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, '.se-main-container, .ContentRenderer, #postViewArea')
+                    )
+                )
+            except Exception:
+                logging.warning("⚠️ 본문 컨테이너 대기 타임아웃, 그대로 추출 시도")
             
-            # 방법 1: 페이지 소스에서 직접 추출
+            # 이미지 지연 로딩 여유
+            time.sleep(0.5)
+            
+            # 내용 추출 - 선택자 순회와 이미지 수집을 JavaScript 한 번으로 처리
+            content = ""
             try:
-                # 잠시 더 기다리기
-                time.sleep(3)
-                
-                # 페이지 소스 가져오기
-                page_source = self.driver.page_source
-                
-                # se-main-container가 있는지 확인
-                if 'se-main-container' in page_source:
-                    # JavaScript로 추출
-                    js_content = self.driver.execute_script("""
-                        var container = document.querySelector('.se-main-container');
-                        if (!container) return '';
-                        
-                        // 모든 텍스트 수집
-                        var result = [];
-                        
-                        // 방법 1: 전체 텍스트
-                        var fullText = container.innerText || container.textContent;
-                        if (fullText && fullText.length > 10) {
-                            return fullText;
-                        }
-                        
-                        // 방법 2: 개별 요소
-                        var elements = container.querySelectorAll('*');
-                        for (var i = 0; i < elements.length; i++) {
-                            var text = elements[i].innerText || elements[i].textContent;
-                            if (text && text.trim() && text.length > 10) {
-                                result.push(text.trim());
-                            }
-                        }
-                        
-                        return result.join('\\n');
-                    """)
-                    
-                    if js_content and len(js_content) > 10:
-                        content = js_content
-                        logging.info(f"✅ se-main-container에서 내용 추출: {len(content)}자")
-                
-                # ContentRenderer 확인
-                elif 'ContentRenderer' in page_source:
-                    js_content = self.driver.execute_script("""
-                        var container = document.querySelector('.ContentRenderer');
-                        if (container) {
-                            return container.innerText || container.textContent || '';
-                        }
-                        return '';
-                    """)
-                    
-                    if js_content and len(js_content) > 10:
-                        content = js_content
-                        logging.info(f"✅ ContentRenderer에서 내용 추출: {len(content)}자")
-                    
-                    // 2. 다른 에디터들
-                    var other_selectors = [
-                        '.ContentRenderer',
-                        '#postViewArea', 
-                        '.NHN_Writeform_Main',
-                        '#content-area',
-                        '#tbody',
-                        '.post_ct',
-                        '.board-read-body',
-                        '.view_content',
-                        'td.view'
-                    ];
-                    
-                    for (var k = 0; k < other_selectors.length; k++) {
-                        var elem = document.querySelector(other_selectors[k]);
-                        if (elem) {
-                            var content = elem.innerText || elem.textContent;
-                            if (content && content.length > 50) {
-                                console.log('내용 발견:', other_selectors[k]);
-                                
-                                // 이미지 추가
-                                var imgs = elem.querySelectorAll('img');
-                                for (var m = 0; m < imgs.length; m++) {
-                                    var src = imgs[m].src || imgs[m].getAttribute('data-src');
-                                    if (src) content += '\\n[이미지] ' + src;
-                                }
-                                
-                                return content;
-                            }
-                        }
-                    }
-                    
-                    // 3. 최후의 수단: body 전체에서 본문 영역 찾기
-                    console.log('최후의 수단: body 전체 검색');
-                    
-                    // 제목, 댓글 등을 제외한 본문만
-                    var all_divs = document.querySelectorAll('div');
-                    var max_text = '';
-                    var max_length = 0;
-                    
-                    for (var n = 0; n < all_divs.length; n++) {
-                        var div = all_divs[n];
-                        // 댓글, 메뉴 등 제외
-                        if (div.className && (
-                            div.className.includes('comment') || 
-                            div.className.includes('reply') ||
-                            div.className.includes('menu') ||
-                            div.className.includes('nav')
-                        )) continue;
-                        
-                        var text = div.innerText || div.textContent;
-                        if (text && text.length > max_length && text.length > 100) {
-                            max_length = text.length;
-                            max_text = text;
-                        }
-                    }
-                    
-                    return max_text || '';
-                """)
-                
-                if js_content and len(js_content) > 30:
-                    logging.info(f"✅ JavaScript로 내용 추출 성공: {len(js_content)}자")
-                    content = js_content
-                    
+                found = self.driver.execute_script(EXTRACT_JS, _DETAIL_SELECTORS)
+                if found:
+                    content = found['text']
+                    for src in found['images']:
+                        content += f"\n[이미지] {src}"
+                    logging.info(f"✅ {found['selector']}({found['source']})에서 내용 추출: {len(found['text'])}자")
             except Exception as js_error:
                 logging.error(f"JavaScript 추출 오류: {js_error}")
             
-            # 방법 2: JavaScript 실패시 Selenium으로 재시도
-            if not content or len(content) < 30:
-                selectors = [
-                    '.se-main-container',
-                    '.ContentRenderer',
-                    '#postViewArea',
-                    '.NHN_Writeform_Main',
-                    '#content-area',
-                    '.post_ct',
-                    '#tbody',
-                    'td.view',
-                    '.view_content'
-                ]
-                
-                for selector in selectors:
-                    try:
-                        elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        text = elem.text.strip()
-                        if text and len(text) > 30:
-                            logging.info(f"✅ Selenium {selector}에서 내용 발견: {len(text)}자")
-                            
-                            # 이미지도 찾기
-                            try:
-                                images = elem.find_elements(By.CSS_SELECTOR, 'img[src], img[data-src]')
-                                for img in images:
-                                    src = img.get_attribute('data-src') or img.get_attribute('src')
-                                    if src and 'emoticon' not in src:
-                                        text += f"\n[이미지] {src}"
-                            except:
-                                pass
-                            
-                            content = text
-                            break
-                    except:
-                        continue
-            
-            
-            # 탭 닫고 원래 창으로 돌아가기
-            self.driver.close()
-            self.driver.switch_to.window(original_window)
-            
             # 결과 처리
             if content and len(content) > 30:
                 # 불필요한 텍스트 제거
@@ -333,7 +395,7 @@ class NaverCafeCrawler:
                 filtered = []
                 for line in lines:
                     line = line.strip()
-                    if line and not any(skip in line for skip in ['로그인', '메뉴', '목록', '이전글', '다음글', '댓글']):
+                    if line and not any(skip in line for skip in _SKIP_TOKENS):
                         filtered.append(line)
                 
                 content = '\n'.join(filtered)[:2000]
@@ -350,16 +412,23 @@ class NaverCafeCrawler:
                 
         except Exception as e:
             logging.error(f"❌ 내용 크롤링 실패: {e}")
-            # 페이지 소스 일부 출력 (디버깅)
+            # 페이지 소스 일부 출력 (DEBUG일 때만 page_source 요청)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                try:
+                    page_source = self.driver.page_source[:500]
+                    logging.debug("페이지 HTML: %s", page_source)
+                except:
+                    pass
+            return "(본문 내용을 가져올 수 없습니다)"
+        finally:
+            # 실패해도 iframe 밖으로 복귀 (쿠키 유지되므로 목록 재접속 가능)
             try:
-                page_source = self.driver.page_source[:500]
-                logging.debug(f"페이지 HTML: {page_source}")
+                self.driver.switch_to.default_content()
             except:
                 pass
-            return "(본문 내용을 가져올 수 없습니다)"
     
-    def crawl_cafe(self, cafe_config: Dict) -> List[Dict]:
-        """카페 게시물 크롤링"""
+    def crawl_cafe(self, cafe_config: Dict, seen_ids: frozenset = frozenset()) -> List[Dict]:
+        """카페 게시물 크롤링 (seen_ids: 부모 프로세스가 동기화해 넘겨준 저장된 articleid)"""
         results = []
         
         try:
@@ -371,52 +440,20 @@ class NaverCafeCrawler:
             # 카페 게시판 URL로 이동
             board_url = f"{cafe_config['url']}/ArticleList.nhn?search.clubid={cafe_config['club_id']}&search.menuid={cafe_config['board_id']}"
             logging.info(f"📍 URL 접속: {board_url}")
-            self.driver.get(board_url)
-            time.sleep(3)
             
-            # iframe 전환
-            try:
-                self.driver.switch_to.frame('cafe_main')
-                time.sleep(1)
-            except:
-                logging.warning("iframe 전환 실패, 직접 접근 시도")
-            
-            # 게시물 찾기
-            selectors = [
-                'div.article-board table tbody tr',  # 구형 카페
-                'ul.article-movie-sub li',  # 영화형
-                'div.ArticleListItem',  # 새형 카페
-                'tr[class*="board-list"]',  # 일반 리스트
-                'div.inner_list > a'  # 모바일형
-            ]
-            
-            articles = []
-            for selector in selectors:
-                try:
-                    articles = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if articles:
-                        logging.info(f"✅ 게시물 발견: {selector} ({len(articles)}개)")
-                        break
-                except:
-                    continue
+            # 목록은 HTTP로 먼저 시도, 로그인 리다이렉트 등 실패 시 Selenium
+            board = self._fetch_board_http(board_url)
+            if board is None:
+                board = self._fetch_board_selenium(board_url)
             
-            if not articles:
+            if not board or not board['total']:
                 logging.warning("❌ 게시물을 찾을 수 없습니다.")
                 return results
             
-            # 공지사항 제외
-            actual_articles = []
-            for article in articles:
-                try:
-                    class_attr = article.get_attribute('class') or ''
-                    if 'notice' in class_attr.lower() or '공지' in class_attr:
-                        continue
-                    if not article.text.strip():
-                        continue
-                    actual_articles.append(article)
-                except:
-                    actual_articles.append(article)
+            logging.info(f"✅ 게시물 발견: {board['selector']} ({board['total']}개)")
             
+            # 공지사항은 스크립트에서 이미 제외됨
+            actual_articles = board['rows']
             logging.info(f"📊 공지 제외 실제 게시물: {len(actual_articles)}개")
             
             # 최대 4개씩만 처리
@@ -428,76 +465,39 @@ class NaverCafeCrawler:
                     break
                     
                 try:
-                    # 제목과 링크 찾기
-                    title = ""
-                    link = ""
+                    # 링크 -> 게시물 ID -> 중복 체크 순서 (중복이면 나머지 필드는 읽지 않음)
+                    link = article['link']
+                    if not link:
+                        continue
                     
-                    # 여러 방법으로 시도
-                    link_selectors = ['a.article', 'td.td_article a', '.inner_list a', 'a']
-                    for sel in link_selectors:
-                        try:
-                            elem = article.find_element(By.CSS_SELECTOR, sel)
-                            title = elem.text.strip()
-                            link = elem.get_attribute('href')
-                            if title and link:
-                                break
-                        except:
-                            pass
+                    match = _ARTICLE_ID_RE.search(link)
+                    article_id = match.group(1) if match else ""
                     
-                    if not title or not link:
+                    # articleid가 없는 링크는 부모 프로세스가 저장 전에 URL로 확인
+                    if article_id and article_id in seen_ids:
+                        logging.info(f"⏭️ 이미 저장된 게시물: {article_id}")
                         continue
                     
-                    # 공지사항 제외
-                    if '공지' in title:
+                    # 제목 (공지사항 제외)
+                    title = article['title']
+                    if not title or '공지' in title:
                         continue
                     
-                    # 게시물 ID 추출
-                    article_id = link.split('articleid=')[-1].split('&')[0] if 'articleid=' in link else ""
-                    
-                    # 중복 체크
-                    try:
-                        notion_check = NotionDatabase()
-                        if notion_check.check_duplicate(link):
-                            logging.info(f"⏭️ 이미 저장된 게시물: {title[:30]}...")
-                            continue
-                    except:
-                        pass
-                    
                     # 상세 내용 크롤링
                     logging.info(f"📖 내용 크롤링 중: {title[:30]}...")
                     content = self.get_article_content(link)
                     
                     # 작성자
-                    author = "Unknown"
-                    for author_sel in ['td.td_name a', '.td_name', '.nick', '.p-nick']:
-                        try:
-                            author = article.find_element(By.CSS_SELECTOR, author_sel).text.strip()
-                            if author:
-                                break
-                        except:
-                            pass
+                    author = article['author'] or "Unknown"
                     
                     # 작성일
                     date_str = datetime.now().strftime('%Y-%m-%d')
-                    for date_sel in ['td.td_date', '.td_date', '.date']:
-                        try:
-                            date_text = article.find_element(By.CSS_SELECTOR, date_sel).text.strip()
-                            if date_text:
-                                # YYYY.MM.DD. -> YYYY-MM-DD
-                                date_str = date_text.replace('.', '-').rstrip('-')
-                                break
-                        except:
-                            pass
+                    if article['date']:
+                        # YYYY.MM.DD. -> YYYY-MM-DD
+                        date_str = article['date'].replace('.', '-').rstrip('-')
                     
                     # 조회수
-                    views = "0"
-                    for view_sel in ['td.td_view', '.td_view', '.view']:
-                        try:
-                            views = article.find_element(By.CSS_SELECTOR, view_sel).text.strip()
-                            if views:
-                                break
-                        except:
-                            pass
+                    views = article['views'] or "0"
                     
                     # 데이터 구성
                     data = {
@@ -510,16 +510,13 @@ class NaverCafeCrawler:
                         'content': content,
                         'cafe_name': cafe_config['name'],
                         'board_name': cafe_config['board_name'],
-                        'crawled_at': datetime.now().isoformat(),
-                        'hash': hashlib.md5(f"{title}{link}".encode()).hexdigest()
+                        'crawled_at': datetime.now().isoformat()
                     }
                     
                     results.append(data)
                     processed_count += 1
                     logging.info(f"📄 [{processed_count}/{max_articles}] 크롤링 완료: {title[:30]}...")
                     
-                    time.sleep(1)
-                    
                 except Exception as e:
                     logging.error(f"게시물 크롤링 오류: {e}")
                     continue
@@ -531,42 +528,263 @@ class NaverCafeCrawler:
         
         return results
     
+    def _fetch_board_http(self, board_url: str):
+        """HTTP + selectolax로 게시판 목록 추출 (BOARD_ROWS_JS와 같은 형태 반환)"""
+        if not self.http or not SELECTOLAX_AVAILABLE:
+            return None
+        
+        try:
+            response = self.http.get(board_url)
+            if 'nid.naver.com' in str(response.url) or response.status_code != 200:
+                logging.info("HTTP 목록 요청이 로그인으로 리다이렉트됨, Selenium 사용")
+                return None
+            tree = HTMLParser(response.text)
+        except Exception as e:
+            logging.warning(f"HTTP 목록 요청 실패: {e}")
+            return None
+        
+        def first_text(row, selectors):
+            for sel in selectors:
+                node = row.css_first(sel)
+                if node:
+                    text = node.text(strip=True)
+                    if text:
+                        return text
+            return ''
+        
+        for selector in _BOARD_ROW_SELECTORS:
+            nodes = tree.css(selector)
+            if not nodes:
+                continue
+            
+            rows = []
+            for row in nodes:
+                cls = row.attributes.get('class') or ''
+                if 'notice' in cls.lower() or '공지' in cls:
+                    continue
+                if not row.text(strip=True):
+                    continue
+                
+                title = ''
+                link = ''
+                for sel in _ROW_LINK_SELECTORS:
+                    a = row.css_first(sel)
+                    if not a:
+                        continue
+                    title = a.text(strip=True)
+                    href = a.attributes.get('href') or ''
+                    link = urljoin(board_url, href) if href else ''
+                    if title and link:
+                        break
+                
+                rows.append({
+                    'title': title,
+                    'link': link,
+                    'author': first_text(row, _ROW_AUTHOR_SELECTORS),
+                    'date': first_text(row, _ROW_DATE_SELECTORS),
+                    'views': first_text(row, _ROW_VIEW_SELECTORS)
+                })
+            return {'selector': selector, 'total': len(nodes), 'rows': rows}
+        
+        return None
+    
+    def _fetch_board_selenium(self, board_url: str):
+        """브라우저로 게시판 목록 추출 (iframe 전환 + 일괄 JavaScript)"""
+        self.driver.get(board_url)
+        
+        # iframe 전환
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.frame_to_be_available_and_switch_to_it('cafe_main')
+            )
+        except:
+            logging.warning("iframe 전환 실패, 직접 접근 시도")
+        
+        # 게시물 목록 등장 대기
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _BOARD_ROW_SELECTOR_UNION))
+            )
+        except:
+            logging.warning("게시물 목록 대기 타임아웃")
+        
+        # 목록 전체를 한 번의 JavaScript 호출로 수집
+        try:
+            return self.driver.execute_script(BOARD_ROWS_JS, _BOARD_ROW_SELECTORS)
+        except Exception as e:
+            logging.warning(f"게시물 목록 추출 실패: {e}")
+            return None
+    
     def close(self):
         """드라이버 종료"""
+        if self.http:
+            self.http.close()
         if self.driver:
             self.driver.quit()
             logging.info("✅ 드라이버 종료")
 
 
+class _SeenCache:
+    """이미 저장된 articleid 로컬 캐시 (SQLite) - 재시작 시 노션 전체 재조회 방지"""
+    
+    def __init__(self, path: str = 'seen.db', commit_every: int = 16):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('CREATE TABLE IF NOT EXISTS seen(article_id TEXT PRIMARY KEY, ts TEXT)')
+        self.conn.commit()
+        self.commit_every = commit_every
+        self._pending = 0
+    
+    def all_ids(self) -> frozenset:
+        """저장된 articleid 전체 (워커 프로세스에 넘길 읽기 전용 집합)"""
+        return frozenset(row[0] for row in self.conn.execute('SELECT article_id FROM seen'))
+    
+    def max_ts(self):
+        """가장 최근 기록 시각 (없으면 None)"""
+        return self.conn.execute('SELECT MAX(ts) FROM seen').fetchone()[0]
+    
+    def contains(self, article_id: str) -> bool:
+        row = self.conn.execute('SELECT 1 FROM seen WHERE article_id=? LIMIT 1', (article_id,)).fetchone()
+        return row is not None
+    
+    def add(self, article_id: str, ts: str):
+        self.conn.execute('INSERT OR IGNORE INTO seen(article_id, ts) VALUES (?, ?)', (article_id, ts))
+        self._pending += 1
+        # fsync 비용 분산을 위해 일정 개수마다 커밋
+        if self._pending >= self.commit_every:
+            self.flush()
+    
+    def add_many(self, rows):
+        self.conn.executemany('INSERT OR IGNORE INTO seen(article_id, ts) VALUES (?, ?)', rows)
+        self.flush()
+    
+    def flush(self):
+        self.conn.commit()
+        self._pending = 0
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+class _RateLimiter:
+    """슬라이딩 윈도우 rate limiter - window초 동안 최대 capacity회 호출"""
+    
+    def __init__(self, capacity: int = 3, window: float = 1.0):
+        self.capacity = capacity
+        self.window = window
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰이 생길 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.capacity:
+                    self._calls.append(now)
+                    return
+                wait = self.window - (now - self._calls[0])
+            time.sleep(wait)
+
+
+NOTION_API_URL = 'https://api.notion.com/v1'
+NOTION_VERSION = '2022-06-28'
+
+
 class NotionDatabase:
     """노션 데이터베이스 핸들러"""
     
     def __init__(self):
-        self.client = Client(auth=os.getenv('NOTION_TOKEN'))
+        self.token = os.getenv('NOTION_TOKEN')
+        self.client = Client(auth=self.token)
         self.database_id = os.getenv('NOTION_DATABASE_ID')
+        
+        # 노션 API 공용 rate limiter (초당 3회)
+        self._limiter = _RateLimiter(capacity=3, window=1.0)
+        
+        # DB 스키마는 실행 중 고정이므로 제목 필드/속성 타입을 한 번만 확인
+        self._title_field = os.getenv('NOTION_TITLE_FIELD', 'Name')
+        self._property_types = {}
+        try:
+            schema = self._call(self.client.databases.retrieve, database_id=self.database_id)
+            self._property_types = {name: prop['type'] for name, prop in schema['properties'].items()}
+            for name, prop_type in self._property_types.items():
+                if prop_type == 'title':
+                    self._title_field = name
+                    break
+        except Exception as e:
+            logging.warning(f"⚠️ 노션 DB 스키마 조회 실패, 기본 제목 필드 사용: {e}")
+        
+        # 게시물마다 같은 값인 속성은 미리 만들어 두고 복사해서 사용
+        self._base_properties_template = {
+            "uploaded": {"checkbox": False}
+        }
+        
+        # 로컬 캐시를 마지막 기록 이후 노션 변경분으로만 동기화
+        self.seen = _SeenCache()
+        try:
+            self.seen.add_many(self.load_recent_article_ids(since=self.seen.max_ts()))
+        except Exception as e:
+            logging.warning(f"⚠️ 중복 캐시 동기화 실패: {e}")
+    
+    def _call(self, fn, *args, **kwargs):
+        """노션 API 호출 - rate limiter 통과 후 실행, 429 응답 시 Retry-After(없으면 지수 백오프) 대기 후 재시도"""
+        for attempt in range(5):
+            self._limiter.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except APIResponseError as e:
+                if e.status != 429 or attempt == 4:
+                    raise
+                retry_after = float(e.headers.get('Retry-After', 2 ** attempt))
+                logging.warning(f"⏸️ 노션 rate limit, {retry_after}초 대기")
+                time.sleep(retry_after)
+    
+    def load_recent_article_ids(self, since=None) -> List[tuple]:
+        """since 이후 생성된 노션 페이지의 (articleid, 생성시각) 목록"""
+        query = {"database_id": self.database_id, "page_size": 100}
+        if since:
+            query["filter"] = {
+                "timestamp": "created_time",
+                "created_time": {"on_or_after": since}
+            }
+        
+        rows = []
+        cursor = None
+        while True:
+            if cursor:
+                query["start_cursor"] = cursor
+            response = self._call(self.client.databases.query, **query)
+            
+            for page in response['results']:
+                url = (page['properties'].get('URL') or {}).get('url') or ""
+                match = _ARTICLE_ID_RE.search(url)
+                if match:
+                    rows.append((match.group(1), page['created_time']))
+            
+            if not response.get('has_more'):
+                break
+            cursor = response['next_cursor']
+        
+        logging.info(f"📥 노션에서 {len(rows)}개 articleid 동기화")
+        return rows
     
     def check_duplicate(self, url: str) -> bool:
         """URL로 중복 체크"""
         try:
             # URL에서 articleid 추출
-            article_id = ""
-            if 'articleid=' in url:
-                article_id = url.split('articleid=')[1].split('&')[0]
+            match = _ARTICLE_ID_RE.search(url)
+            article_id = match.group(1) if match else ""
             
             if article_id:
-                # articleid로 정확한 중복 체크
-                response = self.client.databases.query(
-                    database_id=self.database_id,
-                    filter={
-                        "property": "URL",
-                        "url": {
-                            "contains": f"articleid={article_id}"
-                        }
-                    }
-                )
+                # articleid는 로컬 캐시로 확인 (네트워크 왕복 없음)
+                return self.seen.contains(article_id)
             else:
                 # articleid가 없으면 전체 URL로 체크
-                response = self.client.databases.query(
+                response = self._call(
+                    self.client.databases.query,
                     database_id=self.database_id,
                     filter={
                         "property": "URL",
@@ -582,89 +800,131 @@ class NotionDatabase:
             logging.debug(f"중복 체크 실패: {e}")
             return False
     
-    def save_article(self, article: Dict) -> bool:
-        """게시물 저장"""
-        try:
-            # URL로 중복 체크
-            if self.check_duplicate(article['url']):
-                logging.info(f"⏭️ 중복 게시물 건너뛰기: {article['title'][:30]}...")
-                return False
-            
-            # 노션 DB 저장
-            properties = {}
-            
-            # 제목 필드
-            title_field = os.getenv('NOTION_TITLE_FIELD', 'Name')
-            title_text = article.get('title', '').strip() or f"게시물 - {datetime.now().strftime('%Y%m%d%H%M%S')}"
-            
-            # 여러 필드명 시도
-            for field_name in [title_field, '새 페이지', 'Name', '이름', '제목', 'Title']:
-                try:
-                    properties[field_name] = {
-                        "title": [{"text": {"content": title_text}}]
-                    }
-                    break
-                except:
-                    continue
-            
-            # 다른 필드들
-            if article.get('url'):
-                properties["URL"] = {"url": article['url']}
-            
-            if article.get('author'):
-                properties["작성자"] = {
-                    "rich_text": [{"text": {"content": article['author']}}]
-                }
-            
-            if article.get('date'):
-                properties["작성일"] = {
-                    "rich_text": [{"text": {"content": article['date']}}]
-                }
-            
-            if article.get('cafe_name'):
-                try:
-                    properties["카페명"] = {
-                        "select": {"name": article['cafe_name']}
-                    }
-                except:
-                    properties["카페명"] = {
-                        "rich_text": [{"text": {"content": article['cafe_name']}}]
-                    }
-            
-            # 내용
-            content = article.get('content', '').strip()[:2000]
-            if not content:
-                content = "(내용 없음)"
-            
-            properties["내용"] = {
-                "rich_text": [{"text": {"content": content}}]
+    def _build_properties(self, article: Dict):
+        """게시물 -> 노션 properties (제목 텍스트도 함께 반환)"""
+        properties = self._base_properties_template.copy()
+        
+        # 제목 필드
+        title_text = article.get('title', '').strip() or f"게시물 - {datetime.now().strftime('%Y%m%d%H%M%S')}"
+        properties[self._title_field] = {
+            "title": [{"text": {"content": title_text}}]
+        }
+        
+        # 다른 필드들
+        if article.get('url'):
+            properties["URL"] = {"url": article['url']}
+        
+        if article.get('author'):
+            properties["작성자"] = {
+                "rich_text": [{"text": {"content": article['author']}}]
             }
-            
-            # 크롤링 일시
-            try:
-                properties["크롤링 일시"] = {
-                    "date": {"start": datetime.now().isoformat()}
-                }
-            except:
-                properties["크롤링 일시"] = {
-                    "rich_text": [{"text": {"content": datetime.now().isoformat()}}]
+        
+        if article.get('date'):
+            properties["작성일"] = {
+                "rich_text": [{"text": {"content": article['date']}}]
+            }
+        
+        if article.get('cafe_name'):
+            if self._property_types.get("카페명", "select") == "select":
+                properties["카페명"] = {"select": {"name": article['cafe_name']}}
+            else:
+                properties["카페명"] = {
+                    "rich_text": [{"text": {"content": article['cafe_name']}}]
                 }
+        
+        # 내용
+        content = article.get('content', '').strip()[:2000]
+        if not content:
+            content = "(내용 없음)"
+        
+        properties["내용"] = {
+            "rich_text": [{"text": {"content": content}}]
+        }
+        
+        # 크롤링 일시
+        now = datetime.now().isoformat()
+        if self._property_types.get("크롤링 일시", "date") == "date":
+            properties["크롤링 일시"] = {"date": {"start": now}}
+        else:
+            properties["크롤링 일시"] = {
+                "rich_text": [{"text": {"content": now}}]
+            }
+        
+        return properties, title_text
+    
+    def _remember(self, article: Dict, page: Dict):
+        """저장된 게시물의 articleid를 로컬 캐시에 기록"""
+        match = _ARTICLE_ID_RE.search(article.get('url', ''))
+        if match:
+            self.seen.add(match.group(1), page['created_time'])
+    
+    def save_many(self, articles: List[Dict]) -> int:
+        """게시물 여러 개를 동시에 저장 (카페 단위로 한 번 호출), 저장된 개수 반환"""
+        if not articles:
+            return 0
+        return asyncio.run(self._save_many_async(articles))
+    
+    async def _save_many_async(self, articles: List[Dict]) -> int:
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Notion-Version": NOTION_VERSION
+        }
+        # 노션 rate limit(약 3 req/s)에 맞춰 동시 요청 3개로 제한
+        semaphore = asyncio.Semaphore(3)
+        
+        async with httpx.AsyncClient(
+            http2=H2_AVAILABLE,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            timeout=30
+        ) as client:
+            
+            async def create(article):
+                try:
+                    properties, title_text = self._build_properties(article)
+                    payload = {"parent": {"database_id": self.database_id}, "properties": properties}
+                    async with semaphore:
+                        for attempt in range(5):
+                            await asyncio.to_thread(self._limiter.acquire)
+                            response = await client.post(f"{NOTION_API_URL}/pages", json=payload)
+                            if response.status_code != 429 or attempt == 4:
+                                break
+                            retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+                            logging.warning(f"⏸️ 노션 rate limit, {retry_after}초 대기")
+                            await asyncio.sleep(retry_after)
+                    response.raise_for_status()
+                    self._remember(article, response.json())
+                    logging.info(f"✅ 노션 저장 성공: {title_text[:30]}...")
+                    return True
+                except Exception as e:
+                    logging.error(f"❌ 노션 저장 실패: {e}")
+                    return False
             
-            # uploaded 체크박스
-            properties["uploaded"] = {"checkbox": False}
-            
-            # 페이지 생성
-            page = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
-            )
-            
-            logging.info(f"✅ 노션 저장 성공: {title_text[:30]}...")
-            return True
-            
-        except Exception as e:
-            logging.error(f"❌ 노션 저장 실패: {e}")
-            return False
+            results = await asyncio.gather(*(create(article) for article in articles))
+        
+        return sum(results)
+    
+    def close(self):
+        """로컬 캐시 정리"""
+        self.seen.close()
+
+
+def _crawl_cafe_worker(cafe: Dict, seen_ids: frozenset) -> List[Dict]:
+    """카페 하나를 별도 프로세스에서 크롤링 (자체 크롬 + 로그인), 결과는 dict 목록으로 반환
+    
+    노션/seen.db에는 접근하지 않음 - 중복 판단은 부모가 넘겨준 seen_ids로, 저장은 부모 프로세스에서
+    """
+    crawler = NaverCafeCrawler()
+    
+    try:
+        if not crawler.login_naver():
+            raise Exception("로그인 실패")
+        
+        logging.info(f"\n📍 {cafe['name']} 크롤링 시작...")
+        return crawler.crawl_cafe(cafe, seen_ids)
+    
+    finally:
+        crawler.close()
 
 
 def main():
@@ -709,40 +969,48 @@ def main():
         logging.error("❌ 크롤링할 카페가 설정되지 않았습니다!")
         sys.exit(1)
     
-    # 크롤러 초기화
-    crawler = NaverCafeCrawler()
+    # 노션 핸들러 초기화 (부모 프로세스에서만 - 중복 캐시 동기화도 여기서 한 번)
     notion = NotionDatabase()
     
     try:
-        # 네이버 로그인
-        if not crawler.login_naver():
-            raise Exception("로그인 실패")
-        
         total_saved = 0
+        failed = []
+        seen_ids = notion.seen.all_ids()
         
-        # 각 카페 크롤링
-        for cafe in cafes:
-            logging.info(f"\n📍 {cafe['name']} 크롤링 시작...")
-            articles = crawler.crawl_cafe(cafe)
-            
-            # 노션에 저장
-            cafe_saved = 0
-            for article in articles:
-                if notion.save_article(article):
-                    cafe_saved += 1
-                    total_saved += 1
+        # 카페별로 프로세스를 나눠 병렬 크롤링 (카페마다 독립된 크롬), 끝난 카페부터 저장
+        with ProcessPoolExecutor(max_workers=min(len(cafes), 2)) as executor:
+            futures = {executor.submit(_crawl_cafe_worker, cafe, seen_ids): cafe for cafe in cafes}
             
-            logging.info(f"✅ {cafe['name']}: {len(articles)}개 크롤링, {cafe_saved}개 새로 저장")
-            time.sleep(2)
+            for future in as_completed(futures):
+                cafe = futures[future]
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    # 한 카페 실패가 다른 카페 저장을 막지 않도록 개별 처리
+                    logging.error(f"❌ {cafe['name']} 크롤링 실패: {e}")
+                    failed.append(cafe['name'])
+                    continue
+                
+                # articleid 없는 게시물만 URL로 노션 중복 확인
+                articles = [a for a in articles if a['article_id'] or not notion.check_duplicate(a['url'])]
+                
+                # 노션에 저장 (카페 단위 동시 저장)
+                cafe_saved = notion.save_many(articles)
+                total_saved += cafe_saved
+                
+                logging.info(f"✅ {cafe['name']}: {len(articles)}개 크롤링, {cafe_saved}개 새로 저장")
         
         logging.info(f"\n🎉 크롤링 완료! 총 {total_saved}개 새 게시물 저장")
+        if failed:
+            logging.error(f"❌ 실패한 카페: {', '.join(failed)}")
+            sys.exit(1)
         
     except Exception as e:
         logging.error(f"❌ 크롤링 실패: {e}")
         sys.exit(1)
     
     finally:
-        crawler.close()
+        notion.close()
 
 
 if __name__ == "__main__":
@@ -6,13 +6,26 @@
 
 import os
 import sys
+import re
+import asyncio
 import json
 import time
+import queue
+import sqlite3
+import atexit
+import threading
+import multiprocessing
 import logging
+import logging.handlers
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import hashlib
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
 
 # Selenium imports
 from selenium import webdriver
@@ -23,31 +36,287 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
 # Notion imports
-from notion_client import Client
+from notion_client import Client, APIResponseError
+
+# 본문 HTML 파서 (없으면 Selenium으로만 본문 추출)
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# HTTP/2 지원 (h2 패키지가 있을 때만)
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 # 환경변수 로드
 load_dotenv()
 
 # 로깅 설정
+# 로그는 큐에 넣기만 하고 콘솔/파일 출력은 별도 스레드(QueueListener)에서 처리
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('crawler.log', encoding='utf-8')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('crawler.log', encoding='utf-8')
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# 게시물 ID / 작성일(YYYY.MM.DD. 또는 YY.MM.DD.) 패턴
+_ARTICLE_ID_RE = re.compile(r'articleid=(\d+)')
+_CLUB_ID_RE = re.compile(r'clubid=(\d+)')
+_DATE_RE = re.compile(r'(\d{2,4})\.(\d{1,2})\.(\d{1,2})')
+
+# 본문 정리 시 제외할 메뉴/네비게이션 줄
+_SKIP_RE = re.compile(r'로그인|메뉴|목록|이전글|다음글', re.IGNORECASE)
+
+# 자동화 탐지 우회 스크립트 (드라이버 생성 시 한 번만 등록)
+_STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+"""
+
+# 게시판 목록 행 필드 일괄 추출 스크립트 (행/필드마다 WebDriver 왕복하지 않도록)
+_ROW_EXTRACT_JS = """
+function firstText(row, sels) {
+    for (var i = 0; i < sels.length; i++) {
+        var el = row.querySelector(sels[i]);
+        var text = el ? (el.innerText || el.textContent || '').trim() : '';
+        if (text) return text;
+    }
+    return '';
+}
+
+var candidates = arguments[1] || [];
+
+return Array.from(document.querySelectorAll(arguments[0])).map(function(r) {
+    var skin = '';
+    for (var c = 0; c < candidates.length; c++) {
+        if (r.matches(candidates[c])) { skin = candidates[c]; break; }
+    }
+    var title = '';
+    var link = '';
+    var linkSels = ['a.article', 'td.td_article a', '.inner_list a', 'a'];
+    for (var i = 0; i < linkSels.length; i++) {
+        var a = r.querySelector(linkSels[i]) || (r.matches(linkSels[i]) ? r : null);
+        if (!a) continue;
+        title = (a.innerText || a.textContent || '').trim();
+        link = a.href || '';
+        if (title) break;
+    }
+    return {
+        skin: skin,
+        cls: String(r.className || ''),
+        has_text: (r.innerText || '').trim().length > 0,
+        title: title,
+        link: link,
+        author: firstText(r, ['td.td_name a', '.td_name', '.nick', '.p-nick']),
+        date: firstText(r, ['td.td_date', '.td_date', '.date']),
+        views: firstText(r, ['td.td_view', '.td_view', '.view'])
+    };
+});
+"""
+
+# 본문 추출에 불필요한 리소스 (이미지/폰트/CSS/미디어)
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp',
+    '*.woff*', '*.css', '*.mp4', '*.svg'
+]
+
+# 본문 추출 스크립트 - 에디터별 선택자를 순서대로 시도해 첫 번째 결과 반환 (없으면 body)
+# CDP Runtime.evaluate로 최상위 문서에서 실행되므로 cafe_main iframe 문서를 직접 참조
+# 텍스트는 줄 단위 배열로 돌려줘 Python에서 다시 split하지 않도록 함
+_EXTRACT_JS = """
+(function() {
+    var frame = document.querySelector('iframe#cafe_main');
+    var doc = (frame && frame.contentDocument) || document;
+    var selectors = [
+        '.se-main-container', '.ContentRenderer', '#postViewArea', '.NHN_Writeform_Main',
+        '#content-area', '.post_ct', '#tbody', 'td.view', '.view_content'
+    ];
+    var source = 'body';
+    var container = doc.body;
+    for (var i = 0; i < selectors.length; i++) {
+        var elem = doc.querySelector(selectors[i]);
+        if (elem && (elem.innerText || '').trim().length > 30) {
+            source = selectors[i];
+            container = elem;
+            break;
+        }
+    }
+    
+    var images = [];
+    var imgs = container.querySelectorAll('img[src], img[data-src]');
+    for (var j = 0; j < imgs.length; j++) {
+        var src = imgs[j].getAttribute('data-src') || imgs[j].getAttribute('src');
+        if (src && !/emoticon|sticker|icon/.test(src)) images.push(src);
+    }
+    
+    var texts = (container.innerText || container.textContent || '').split('\\n')
+        .map(function(t) { return t.trim(); })
+        .filter(function(t) { return t.length > 0; });
+    
+    return {source: source, texts: texts, images: images};
+})()
+"""
+
+# 게시물 본문 요청용 공용 세션 (로그인 후 Selenium 쿠키를 복사해 사용)
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# 게시물 상세 JSON API (렌더링 없이 제목/작성자/본문 HTML을 한 번에 받음)
+_ARTICLE_API_URL = "https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}"
+_ARTICLE_CONCURRENCY = 10
+
+
+def _is_seen(url: str, seen_ids, seen_urls) -> bool:
+    """이미 저장된 게시물인지 확인 (articleid가 있으면 articleid로, 없으면 전체 URL로)"""
+    match = _ARTICLE_ID_RE.search(url)
+    if match:
+        return match.group(1) in seen_ids
+    return url in seen_urls
+
+
+def _cap(text: str, limit: int = 2000) -> str:
+    """노션 Rich Text 제한(2000자)에 맞춰 자르기 (잘린 경우 말줄임표, 짧으면 그대로)"""
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+
+def _parse_content_html(html: str) -> str:
+    """본문 HTML에서 텍스트와 이미지 URL 추출 (selectolax 없으면 빈 문자열)"""
+    if not html or not SELECTOLAX_AVAILABLE:
+        return ""
+    
+    tree = HTMLParser(html)
+    container = tree.css_first('.se-main-container, #postViewArea') or tree.body
+    if not container:
+        return ""
+    
+    result = []
+    text = container.text(separator='\n', strip=True)
+    if text:
+        result.append(text)
+    for img in container.css('img'):
+        src = img.attributes.get('data-src') or img.attributes.get('src')
+        if src and not any(skip in src for skip in ('emoticon', 'sticker', 'icon')):
+            result.append(f'[이미지] {src}')
+    
+    content = '\n\n'.join(result)
+    return _cap(content) if len(content) > 30 else ""
+
+
+async def fetch_article(client: httpx.AsyncClient, sem: asyncio.Semaphore, data: Dict):
+    """게시물 상세 JSON을 받아 data의 본문(및 비어 있는 작성자/작성일)을 채움"""
+    club_match = _CLUB_ID_RE.search(data['url'])
+    if not club_match or not data.get('article_id'):
+        return
+    
+    api_url = _ARTICLE_API_URL.format(club_id=club_match.group(1), article_id=data['article_id'])
+    async with sem:
+        try:
+            response = await client.get(api_url)
+            article = response.json()['result']['article']
+        except Exception as e:
+            logging.debug("게시물 API 요청 오류: %s", e)
+            return
+    
+    data['content'] = _parse_content_html(article.get('contentHtml', ''))
+    writer = article.get('writer') or {}
+    if data.get('author') in (None, '', 'Unknown') and writer.get('nick'):
+        data['author'] = writer['nick']
+    timestamp = article.get('writeDate')
+    if not data.get('date') and timestamp:
+        data['date'] = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d')
+
+
+async def fetch_articles(pending: List[Dict]):
+    """로그인 쿠키로 게시물 상세 API를 동시에 최대 10개씩 요청"""
+    sem = asyncio.Semaphore(_ARTICLE_CONCURRENCY)
+    async with httpx.AsyncClient(
+        cookies={c.name: c.value for c in session.cookies},
+        headers=dict(session.headers),
+        http2=H2_AVAILABLE,
+        timeout=15
+    ) as client:
+        await asyncio.gather(*[fetch_article(client, sem, data) for data in pending])
 
 class NaverCafeCrawler:
     """네이버 카페 크롤러"""
     
-    def __init__(self):
+    def __init__(self, worker_id: int = 0):
         self.driver = None
         self.wait = None
+        self.worker_id = worker_id
+        self.setup_cache()
+        self._skin_cache = self.load_skins()
         self.setup_driver()
+    
+    @classmethod
+    def crawl_one(cls, cafe_config: Dict, worker_id: int = 0,
+                  seen_ids: frozenset = frozenset(), seen_urls: frozenset = frozenset()) -> List[Dict]:
+        """카페 하나를 전용 크롬으로 크롤링 (생성 -> 로그인 -> 크롤링 -> 종료)"""
+        crawler = cls(worker_id)
+        try:
+            if not crawler.login_naver():
+                raise Exception("로그인 실패")
+            crawler.export_cookies()
+            
+            logging.info(f"\n📍 {cafe_config['name']} 크롤링 시작...")
+            return crawler.crawl_cafe(cafe_config, seen_ids, seen_urls)
+        finally:
+            crawler.close()
         
+    def setup_cache(self):
+        """추출한 본문 디스크 캐시 (재실행 시 같은 게시물 재추출 방지)"""
+        os.makedirs('.cache', exist_ok=True)
+        self.cache = sqlite3.connect('.cache/articles.db', timeout=10)
+        self.cache.execute('PRAGMA journal_mode=WAL')
+        self.cache.execute('PRAGMA synchronous=NORMAL')
+        self.cache.execute('CREATE TABLE IF NOT EXISTS art(url TEXT PRIMARY KEY, content TEXT, ts INTEGER)')
+        # 카페별로 확인된 목록 행 선택자 (다음 실행부터 바로 사용)
+        self.cache.execute('CREATE TABLE IF NOT EXISTS skin(club_id TEXT PRIMARY KEY, skin TEXT)')
+        self.cache.commit()
+    
+    def cached_content(self, url: str) -> str:
+        """7일 이내에 추출한 본문 (없으면 빈 문자열)"""
+        row = self.cache.execute(
+            'SELECT content FROM art WHERE url=? AND ts>?', (url, int(time.time()) - 86400 * 7)
+        ).fetchone()
+        return row[0] if row else ""
+    
+    def store_content(self, url: str, content: str):
+        self.cache.execute(
+            'INSERT OR REPLACE INTO art(url, content, ts) VALUES (?, ?, ?)', (url, content, int(time.time()))
+        )
+        self.cache.commit()
+    
+    def load_skins(self) -> Dict[str, Dict]:
+        """club_id -> 목록 행 선택자 캐시 읽기"""
+        return {club_id: json.loads(skin) for club_id, skin in self.cache.execute('SELECT club_id, skin FROM skin')}
+    
+    def save_skin(self, club_id: str, skin: Dict):
+        """club_id 한 행만 갱신 (워커 프로세스끼리는 sqlite 잠금으로 직렬화)"""
+        self._skin_cache[club_id] = skin
+        self.cache.execute(
+            'INSERT OR REPLACE INTO skin(club_id, skin) VALUES (?, ?)', (club_id, json.dumps(skin, ensure_ascii=False))
+        )
+        self.cache.commit()
+    
     def setup_driver(self):
         """Selenium 드라이버 설정"""
+        # 워커마다 시작 시점을 조금씩 어긋나게 (동시 요청 몰림 방지)
+        time.sleep(0.1 * self.worker_id)
+        
         options = Options()
         
         # GitHub Actions 환경에서는 헤드리스 모드 필수
@@ -60,13 +329,38 @@ class NaverCafeCrawler:
         # 기본 옵션
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        # 사이트별 렌더러 프로세스 분리 끄기 (프로세스 수/메모리 절감)
+        options.add_argument('--disable-features=IsolateOrigins,site-per-process')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
+        # DOMContentLoaded 시점에 driver.get 반환 (필요한 요소는 WebDriverWait로 대기)
+        options.page_load_strategy = 'eager'
+        
+        # 이미지/CSS/폰트/알림 비활성화 (본문 추출에는 텍스트와 img src 문자열만 필요)
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        
         try:
             self.driver = webdriver.Chrome(options=options)
             self.wait = WebDriverWait(self.driver, 10)
+            
+            # 자동화 탐지 우회 (이후 모든 문서에 적용, 로그인 재시도 시 중복 등록 방지)
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _STEALTH_JS})
+            
+            # 이미지/폰트/CSS/미디어 요청 차단
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logging.warning(f"⚠️ 리소스 차단 설정 실패: {e}")
+            
             logging.info("✅ 크롬 드라이버 초기화 성공")
         except Exception as e:
             logging.error(f"❌ 드라이버 초기화 실패: {e}")
@@ -75,23 +369,8 @@ class NaverCafeCrawler:
     def login_naver(self):
         """네이버 로그인 - 자동화 탐지 우회 강화"""
         try:
-            # 자동화 탐지 우회 설정
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['ko-KR', 'ko']
-                    });
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                '''
-            })
-            
             self.driver.get('https://nid.naver.com/nidlogin.login')
-            time.sleep(3)
+            self.wait.until(EC.presence_of_element_located((By.ID, 'id')))
             
             # ID 입력 (JavaScript로 직접 값 설정)
             id_input = self.driver.find_element(By.ID, 'id')
@@ -100,7 +379,6 @@ class NaverCafeCrawler:
                 arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
                 arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
             """, id_input, os.getenv('NAVER_ID'))
-            time.sleep(2)  # 입력 후 대기
             
             # PW 입력
             pw_input = self.driver.find_element(By.ID, 'pw')
@@ -109,7 +387,6 @@ class NaverCafeCrawler:
                 arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
                 arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
             """, pw_input, os.getenv('NAVER_PW'))
-            time.sleep(2)
             
             # 로그인 상태 유지 체크 (선택사항)
             try:
@@ -123,8 +400,13 @@ class NaverCafeCrawler:
             login_btn = self.driver.find_element(By.ID, 'log.login')
             self.driver.execute_script("arguments[0].click();", login_btn)
             
-            # 로그인 완료 대기 (더 긴 시간)
-            time.sleep(10)
+            # 로그인 완료 대기 (로그인 페이지를 벗어나는 즉시 진행)
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    lambda d: 'nidlogin.login' not in d.current_url
+                )
+            except:
+                pass
             
             # 로그인 성공 확인 (여러 방법)
             current_url = self.driver.current_url
@@ -135,11 +417,14 @@ class NaverCafeCrawler:
                 
                 # 추가 확인: 로그인 상태 체크
                 self.driver.get('https://naver.com')
-                time.sleep(2)
                 
                 try:
                     # 로그인된 사용자 요소 찾기
-                    login_info = self.driver.find_element(By.CSS_SELECTOR, '.MyView-module__my_menu___eF4ct, .account_info, .user_info')
+                    login_info = WebDriverWait(self.driver, 15).until(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, '.MyView-module__my_menu___eF4ct, .account_info, .user_info')
+                        )
+                    )
                     logging.info("✅ 로그인 상태 확인 완료")
                     return True
                 except:
@@ -162,8 +447,20 @@ class NaverCafeCrawler:
                 pass
             return False
     
-    def crawl_cafe(self, cafe_config: Dict) -> List[Dict]:
-        """카페 게시물 크롤링"""
+    def export_cookies(self):
+        """로그인된 브라우저 쿠키를 공용 requests 세션으로 복사"""
+        try:
+            session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+            session.headers['Referer'] = 'https://cafe.naver.com/'
+            for c in self.driver.get_cookies():
+                session.cookies.set(c['name'], c['value'], domain=c['domain'])
+            logging.info("✅ 로그인 쿠키를 HTTP 세션에 복사")
+        except Exception as e:
+            logging.warning(f"⚠️ 쿠키 복사 실패: {e}")
+    
+    def crawl_cafe(self, cafe_config: Dict,
+                   seen_ids: frozenset = frozenset(), seen_urls: frozenset = frozenset()) -> List[Dict]:
+        """카페 게시물 크롤링 (seen_ids/seen_urls: 부모 프로세스가 미리 조회한 저장된 게시물)"""
         results = []
         
         try:
@@ -172,627 +469,554 @@ class NaverCafeCrawler:
                 logging.error(f"카페 설정이 올바르지 않습니다: {cafe_config}")
                 return results
             
-            # 카페 게시판 URL로 이동
+            # 카페 게시판 URL
             board_url = f"{cafe_config['url']}/ArticleList.nhn?search.clubid={cafe_config['club_id']}&search.menuid={cafe_config['board_id']}"
-            logging.info(f"📍 URL 접속: {board_url}")
-            self.driver.get(board_url)
-            time.sleep(3)
-            
-            # iframe 전환
-            try:
-                self.driver.switch_to.frame('cafe_main')
-                time.sleep(1)
-            except:
-                logging.warning("iframe 전환 실패, 직접 접근 시도")
-            
-            # 여러 선택자 시도 (네이버 카페 구조가 다양함)
-            selectors = [
-                'div.article-board table tbody tr',  # 구형 카페
-                'ul.article-movie-sub li',  # 영화형
-                'div.ArticleListItem',  # 새형 카페
-                'tr[class*="board-list"]',  # 일반 리스트
-                'div.inner_list > a'  # 모바일형
-            ]
             
-            articles = []
-            for selector in selectors:
-                try:
-                    articles = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if articles:
-                        logging.info(f"✅ 게시물 발견: {selector} ({len(articles)}개)")
-                        break
-                except:
-                    continue
+            # 목록은 JSON API 한 번으로, 실패 시 브라우저로 읽기
+            rows = self.fetch_article_list_api(cafe_config, board_url)
+            if rows is None:
+                rows = self.read_board_rows(board_url, cafe_config['club_id'])
             
-            if not articles:
-                logging.warning("❌ 게시물을 찾을 수 없습니다. HTML 구조 확인 필요")
-                # HTML 디버깅 정보
-                try:
-                    page_source = self.driver.page_source[:500]
-                    logging.debug(f"Page HTML: {page_source}")
-                except:
-                    pass
+            if not rows:
                 return results
             
-            # 실제 게시물만 필터링 (공지사항 제외)
-            actual_articles = []
-            for article in articles:
-                try:
-                    # 공지사항 클래스 체크
-                    class_attr = article.get_attribute('class') or ''
-                    if 'notice' in class_attr.lower() or '공지' in class_attr:
-                        continue
-                    # 빈 행 제외
-                    if not article.text.strip():
-                        continue
-                    actual_articles.append(article)
-                except:
-                    actual_articles.append(article)
-            
-            logging.info(f"📊 공지 제외 실제 게시물: {len(actual_articles)}개")
-            
             # 최대 4개씩만 처리
             max_articles = 4
             processed_count = 0
             new_articles_found = 0
             
+            # 이미 저장된 게시물은 부모 프로세스가 미리 조회해 넘겨준 집합에서 중복 체크
+            # (워커는 노션에 접속하지 않음 - 최종 중복 확인은 부모의 저장 단계에서)
+            # 크롤링 시각은 카페 단위로 한 번만 계산
+            now_iso = datetime.now().isoformat()
+            
             # 더 많은 게시물 확인 (새 게시물 4개 찾을 때까지)
-            for idx, article in enumerate(actual_articles[:20], 1):  # 최신 20개 확인
+            for idx, row in enumerate(rows[:20], 1):  # 최신 20개 확인
                 if processed_count >= max_articles:
                     logging.info(f"✅ 최대 처리 개수({max_articles}개) 도달")
                     break
                     
                 try:
-                    logging.debug(f"처리 중: {processed_count + 1}/{max_articles}")
-                    
-                    # 제목 찾기 (여러 방법 시도)
-                    title = ""
-                    link = ""
-                    
-                    # 방법 1: a.article
-                    try:
-                        title_elem = article.find_element(By.CSS_SELECTOR, 'a.article')
-                        title = title_elem.text.strip()
-                        link = title_elem.get_attribute('href')
-                    except:
-                        pass
-                    
-                    # 방법 2: td.td_article
-                    if not title:
-                        try:
-                            title_elem = article.find_element(By.CSS_SELECTOR, 'td.td_article a')
-                            title = title_elem.text.strip()
-                            link = title_elem.get_attribute('href')
-                        except:
-                            pass
-                    
-                    # 방법 3: class="inner_list"
-                    if not title:
-                        try:
-                            title_elem = article.find_element(By.CSS_SELECTOR, '.inner_list a')
-                            title = title_elem.text.strip()
-                            link = title_elem.get_attribute('href')
-                        except:
-                            pass
-                    
-                    # 방법 4: 직접 a 태그
-                    if not title:
-                        try:
-                            title_elem = article.find_element(By.TAG_NAME, 'a')
-                            title = title_elem.text.strip()
-                            link = title_elem.get_attribute('href')
-                        except:
-                            continue
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 공지사항 제외
-                    if '공지' in title or 'notice' in str(article.get_attribute('class')):
-                        continue
-                    
-                    # 작성자
-                    author = "Unknown"
-                    for author_selector in ['td.td_name a', '.td_name', '.nick', '.p-nick']:
-                        try:
-                            author = article.find_element(By.CSS_SELECTOR, author_selector).text.strip()
-                            if author:
-                                break
-                        except:
-                            pass
-                    
-                    # 작성일
-                    date_str = ""
-                    for date_selector in ['td.td_date', '.td_date', '.date']:
-                        try:
-                            date_str = article.find_element(By.CSS_SELECTOR, date_selector).text.strip()
-                            if date_str:
-                                break
-                        except:
-                            pass
-                    
-                    # 날짜 형식 변환 (YYYY.MM.DD. → YYYY-MM-DD)
-                    if date_str:
-                        # "2025.08.25." 형식을 "2025-08-25"로 변환
-                        date_str = date_str.replace('.', '-').rstrip('-')
-                        if len(date_str.split('-')) == 3:
-                            year, month, day = date_str.split('-')
-                            # 2자리 연도 처리
-                            if len(year) == 2:
-                                year = '20' + year
-                            date = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        else:
-                            date = datetime.now().strftime('%Y-%m-%d')
-                    else:
-                        date = datetime.now().strftime('%Y-%m-%d')
-                    
-                    # 조회수
-                    views = "0"
-                    for view_selector in ['td.td_view', '.td_view', '.view']:
-                        try:
-                            views = article.find_element(By.CSS_SELECTOR, view_selector).text.strip()
-                            if views:
-                                break
-                        except:
-                            pass
+                    title = row['title']
+                    link = row['link']
                     
                     # 게시물 ID 추출
-                    article_id = link.split('articleid=')[-1].split('&')[0] if 'articleid=' in link else ""
+                    match = _ARTICLE_ID_RE.search(link)
+                    article_id = match.group(1) if match else ""
                     
                     # URL로 중복 체크 (크롤링 전에 확인)
-                    if link:
-                        # 이미 노션에 있는지 먼저 체크
-                        try:
-                            notion_check = NotionDatabase()
-                            if notion_check.check_duplicate(link):
-                                logging.info(f"⏭️ [{idx:02d}] 이미 저장된 게시물: {title[:30]}...")
-                                continue
-                            else:
-                                new_articles_found += 1
-                                logging.info(f"✨ [{new_articles_found:02d}] 새 게시물 발견: {title[:30]}...")
-                        except Exception as e:
-                            logging.debug(f"중복 체크 중 오류: {e}")
-                            # 오류 시에도 계속 진행
-                            new_articles_found += 1
-                    
-                    # 상세 내용 크롤링
-                    logging.info(f"📖 내용 크롤링 중: {title[:30]}...")
-                    content = self.get_article_content(link)
-                    logging.info(f"📝 내용 길이: {len(content)} 글자")
+                    if _is_seen(link, seen_ids, seen_urls):
+                        logging.info(f"⏭️ [{idx:02d}] 이미 저장된 게시물: {title[:30]}...")
+                        continue
+                    new_articles_found += 1
+                    logging.info(f"✨ [{new_articles_found:02d}] 새 게시물 발견: {title[:30]}...")
                     
-                    # 데이터 구성
+                    # 데이터 구성 (본문은 목록을 다 본 뒤 병렬로 가져옴)
                     data = {
                         'title': title,
-                        'author': author,
-                        'date': date,
-                        'views': views,
+                        'author': row['author'],
+                        'date': row['date'],
+                        'views': row['views'],
                         'url': link,
                         'article_id': article_id,
-                        'content': content,
+                        'content': "",
                         'cafe_name': cafe_config['name'],
                         'board_name': cafe_config['board_name'],
-                        'crawled_at': datetime.now().isoformat(),
-                        'hash': hashlib.md5(f"{title}{link}".encode()).hexdigest()
+                        'crawled_at': now_iso,
+                        'hash': hashlib.blake2b(f"{title}{link}".encode(), digest_size=16).hexdigest()
                     }
                     
-                    # 디버깅 정보
-                    logging.debug(f"데이터 구성 완료:")
-                    logging.debug(f"  - 제목: {data['title'][:50]}")
-                    logging.debug(f"  - 내용: {data['content'][:100]}...")
-                    
                     results.append(data)
                     processed_count += 1
-                    logging.info(f"📄 [{processed_count:02d}/{max_articles}] 크롤링: {title[:30]}...")
-                    
-                    # 요청 간격
-                    time.sleep(1)
+                    logging.info(f"📄 [{processed_count:02d}/{max_articles}] 목록 수집: {title[:30]}...")
                     
                 except Exception as e:
                     logging.error(f"게시물 크롤링 오류: {e}")
                     continue
             
-            self.driver.switch_to.default_content()
+            # 상세 내용 크롤링 - HTTP로 병렬 요청, 실패한 것만 Selenium으로
+            self.fill_contents(results)
             
         except Exception as e:
             logging.error(f"카페 크롤링 오류: {e}")
         
         return results
     
+    def fetch_article_list_api(self, cafe_config: Dict, board_url: str):
+        """카페 JSON API로 게시물 목록 조회 (실패 시 None)"""
+        api_url = (
+            "https://apis.naver.com/cafe-web/cafe2/ArticleListV2dot1.json"
+            f"?search.clubid={cafe_config['club_id']}&search.menuid={cafe_config['board_id']}"
+            "&search.page=1&search.perPage=20"
+        )
+        try:
+            r = session.get(api_url, headers={'Referer': board_url}, timeout=15)
+            items = r.json()['message']['result']['articleList']
+        except Exception as e:
+            logging.warning(f"⚠️ 목록 API 조회 실패, 브라우저로 시도: {e}")
+            return None
+        
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        rows = []
+        for item in items:
+            title = (item.get('subject') or '').strip()
+            if not title or '공지' in title:
+                continue
+            timestamp = item.get('writeDateTimestamp')
+            rows.append({
+                'title': title,
+                'link': f"https://cafe.naver.com/ArticleRead.nhn?clubid={cafe_config['club_id']}&articleid={item['articleId']}",
+                'author': item.get('writerNickname') or "Unknown",
+                'date': datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d') if timestamp else today_str,
+                'views': str(item.get('readCount', 0))
+            })
+        
+        logging.info(f"✅ 목록 API로 게시물 {len(rows)}개 조회")
+        return rows
+    
+    def read_board_rows(self, board_url: str, club_id: str = None) -> List[Dict]:
+        """브라우저로 게시판 목록을 읽어 행 정보 추출 (공지 제외, 최신 20개)"""
+        logging.info(f"📍 URL 접속: {board_url}")
+        self.driver.get(board_url)
+        
+        # iframe 전환 (준비되는 즉시)
+        try:
+            WebDriverWait(self.driver, 15).until(
+                EC.frame_to_be_available_and_switch_to_it('cafe_main')
+            )
+        except:
+            logging.warning("iframe 전환 실패, 직접 접근 시도")
+        
+        try:
+            # 여러 선택자 시도 (네이버 카페 구조가 다양함)
+            selectors = [
+                'div.article-board table tbody tr',  # 구형 카페
+                'ul.article-movie-sub li',  # 영화형
+                'div.ArticleListItem',  # 새형 카페
+                'tr[class*="board-list"]',  # 일반 리스트
+                'div.inner_list > a'  # 모바일형
+            ]
+            
+            # 이 카페에서 이미 확인된 행 선택자가 있으면 그것만 사용
+            articles = []
+            skin = self._skin_cache.get(club_id) if club_id else None
+            if skin:
+                try:
+                    articles = self.driver.execute_script(_ROW_EXTRACT_JS, skin['row_sel'])
+                except Exception as e:
+                    logging.debug("캐시된 행 선택자 실패: %s", e)
+            
+            # 없으면 모든 레이아웃 선택자를 합친 한 번의 JavaScript 호출로 수집
+            # (한 페이지에는 한 가지 레이아웃만 존재)
+            if not articles:
+                try:
+                    articles = self.driver.execute_script(_ROW_EXTRACT_JS, ', '.join(selectors), selectors)
+                    if articles and club_id and articles[0]['skin']:
+                        self.save_skin(club_id, {'row_sel': articles[0]['skin']})
+                except Exception as e:
+                    logging.warning(f"게시물 목록 추출 실패: {e}")
+            
+            if articles:
+                logging.info(f"✅ 게시물 발견: {len(articles)}개")
+            
+            if not articles:
+                logging.warning("❌ 게시물을 찾을 수 없습니다. HTML 구조 확인 필요")
+                # HTML 디버깅 정보 (DEBUG일 때만 page_source 요청)
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    try:
+                        page_source = self.driver.page_source[:500]
+                        logging.debug("Page HTML: %s", page_source)
+                    except:
+                        pass
+                return []
+            
+            # 실제 게시물만 필터링 (공지사항, 빈 행 제외) - 스크립트가 돌려준 class/제목으로 판단
+            actual_articles = []
+            for article in articles:
+                cls = article['cls']
+                if 'notice' in cls.lower() or '공지' in cls or '공지' in article['title']:
+                    continue
+                if article['has_text']:
+                    actual_articles.append(article)
+            
+            logging.info(f"📊 공지 제외 실제 게시물: {len(actual_articles)}개")
+            
+            today_str = datetime.now().strftime('%Y-%m-%d')
+            rows = []
+            for article in actual_articles[:20]:
+                title = article['title']
+                link = article['link']
+                if not title or not link:
+                    continue
+                
+                # 날짜 형식 변환 (YYYY.MM.DD. → YYYY-MM-DD, 2자리 연도는 20YY)
+                m = _DATE_RE.search(article['date'])
+                if m:
+                    year = m[1] if len(m[1]) == 4 else '20' + m[1][-2:]
+                    date = f"{year}-{m[2].zfill(2)}-{m[3].zfill(2)}"
+                else:
+                    date = today_str
+                
+                rows.append({
+                    'title': title,
+                    'link': link,
+                    'author': article['author'] or "Unknown",
+                    'date': date,
+                    'views': article['views'] or "0"
+                })
+            
+            return rows
+        
+        finally:
+            self.driver.switch_to.default_content()
+    
+    def fill_contents(self, results: List[Dict]):
+        """게시물 본문을 상세 JSON API로 동시에 가져와 채움"""
+        if not results:
+            return
+        
+        # 이전 실행에서 이미 추출한 본문은 캐시에서 바로 사용
+        for data in results:
+            data['content'] = self.cached_content(data['url'])
+        pending = [data for data in results if not data['content']]
+        if len(pending) < len(results):
+            logging.info(f"💾 캐시에서 본문 {len(results) - len(pending)}개 재사용")
+        
+        if pending:
+            try:
+                asyncio.run(fetch_articles(pending))
+            except Exception as e:
+                logging.warning(f"⚠️ 게시물 API 일괄 요청 실패: {e}")
+        
+        # 드라이버는 스레드 안전하지 않으므로 폴백은 순차 처리
+        for data in pending:
+            if not data['content']:
+                logging.info(f"📖 Selenium으로 내용 크롤링 중: {data['title'][:30]}...")
+                data['content'] = self.get_article_content(data['url'])
+            if data['content'] and data['content'] != "(본문 내용을 가져올 수 없습니다)":
+                self.store_content(data['url'], data['content'])
+            logging.info(f"📝 내용 길이: {len(data['content'])} 글자 - {data['title'][:30]}")
+    
     def get_article_content(self, url: str) -> str:
         """게시물 상세 내용 가져오기 - 최종 완성 버전"""
         try:
-            # 현재 창 핸들 저장
-            original_window = self.driver.current_window_handle
-            
-            # 새 탭에서 게시물 열기
-            self.driver.execute_script(f"window.open('{url}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            # 같은 탭에서 게시물 열기 (탭 생성/전환 비용 없음)
+            self.driver.switch_to.default_content()
+            self.driver.get(url)
             
-            # 페이지 완전히 로딩 대기
+            # iframe으로 전환 (네이버 카페는 반드시 iframe 사용, 준비되는 즉시)
             logging.info(f"📄 게시물 페이지 로딩 중...")
-            time.sleep(10)  # 충분한 로딩 시간
-            
-            # iframe으로 전환 (네이버 카페는 반드시 iframe 사용)
             iframe_success = False
             try:
-                self.driver.switch_to.frame('cafe_main')
+                WebDriverWait(self.driver, 15).until(
+                    EC.frame_to_be_available_and_switch_to_it('cafe_main')
+                )
                 logging.info("✅ iframe 전환 성공")
                 iframe_success = True
             except Exception as e:
                 logging.warning(f"⚠️ iframe 전환 실패: {e}")
                 # iframe 없이도 시도
             
-            # 내용 추출 - 완전 새로운 접근
-            content = ""
+            # 본문 컨테이너 등장 대기
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, '.se-main-container, .ContentRenderer, #postViewArea')
+                    )
+                )
+            except Exception:
+                logging.warning("⚠️ 본문 컨테이너 대기 타임아웃, 그대로 추출 시도")
             
-            # 우선 가장 정확한 방법: se-main-container 찾기
+            # 내용 추출 - 선택자 순회와 이미지 수집을 CDP 호출 한 번으로 처리 (줄/이미지 배열로 받음)
+            lines = []
             try:
-                # JavaScript로 직접 추출 (가장 안정적)
-                content = self.driver.execute_script("""
-                    // 디버깅 로그
-                    console.log('내용 추출 시작...');
-                    
-                    // 1. SmartEditor ONE (최신 에디터)
-                    var container = document.querySelector('.se-main-container');
-                    if (container) {
-                        console.log('SmartEditor ONE 발견!');
-                        var result = [];
-                        
-                        // 모든 섹션 순회
-                        var sections = container.querySelectorAll('.se-section');
-                        sections.forEach(function(section) {
-                            // 텍스트 섹션
-                            var textParas = section.querySelectorAll('.se-text-paragraph');
-                            textParas.forEach(function(para) {
-                                var text = para.innerText || para.textContent;
-                                if (text && text.trim()) {
-                                    result.push(text.trim());
-                                }
-                            });
-                            
-                            // 이미지 섹션
-                            var images = section.querySelectorAll('img.se-image-resource');
-                            images.forEach(function(img) {
-                                var src = img.getAttribute('data-src') || img.getAttribute('src');
-                                if (src) {
-                                    result.push('[이미지] ' + src);
-                                }
-                            });
-                        });
-                        
-                        if (result.length === 0) {
-                            // 섹션이 없으면 전체에서 찾기
-                            var allText = container.innerText || container.textContent;
-                            if (allText) result.push(allText.trim());
-                            
-                            // 이미지 전체 찾기
-                            var allImages = container.querySelectorAll('img[src]');
-                            allImages.forEach(function(img) {
-                                var src = img.getAttribute('data-src') || img.getAttribute('src');
-                                if (src && !src.includes('cafe_main')) {
-                                    result.push('[이미지] ' + src);
-                                }
-                            });
-                        }
-                        
-                        return result.join('\\n\\n');
-                    }
-                    
-                    // 2. ContentRenderer (중간 버전)
-                    var content = document.querySelector('.ContentRenderer');
-                    if (content) {
-                        console.log('ContentRenderer 발견!');
-                        return content.innerText;
-                    }
-                    
-                    // 3. 구형 에디터
-                    var oldEditor = document.querySelector('#postViewArea, .NHN_Writeform_Main');
-                    if (oldEditor) {
-                        console.log('구형 에디터 발견!');
-                        return oldEditor.innerText;
-                    }
-                    
-                    // 4. 기타 선택자
-                    var others = document.querySelector('#tbody, #content-area, .post_ct, .view_content');
-                    if (others) {
-                        console.log('기타 영역 발견!');
-                        return others.innerText;
-                    }
-                    
-                    console.log('내용을 찾을 수 없음');
-                    return '';
-                """)
-                    
-                
-                if content:
-                    logging.info(f"✅ JavaScript로 내용 추출 성공: {len(content)}자")
-                else:
-                    logging.warning("⚠️ JavaScript 추출 실패, Selenium으로 재시도")
-                    
+                result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                    'expression': _EXTRACT_JS,
+                    'returnByValue': True,
+                    'awaitPromise': False
+                })
+                data = result.get('result', {}).get('value')
+                if data and data['texts']:
+                    lines = data['texts'] + ['[이미지] ' + src for src in data['images']]
+                    logging.info(f"✅ {data['source']}에서 내용 추출: {len(data['texts'])}줄, 이미지 {len(data['images'])}개")
             except Exception as js_error:
                 logging.error(f"JavaScript 실행 오류: {js_error}")
             
-            # JavaScript 실패 시 Selenium으로 재시도
-            if not content:
-                    content = self.driver.execute_script("""
-                        var elem = document.querySelector('.ContentRenderer');
-                        if (!elem) return '';
-                        
-                        var result = [];
-                        var text = elem.innerText || elem.textContent;
-                        if (text) result.push(text.trim());
-                        
-                        // ContentRenderer 내 이미지도 추출
-                        var images = elem.querySelectorAll('img[src]');
-                        for (var i = 0; i < images.length; i++) {
-                            var src = images[i].getAttribute('data-src') || images[i].getAttribute('src');
-                            if (src) result.push('[이미지] ' + src);
-                        }
-                        
-                        return result.join('\\n\\n');
-                    """)
-                    
-                    if content and len(content) > 30:
-                        logging.info(f"✅ ContentRenderer에서 내용 추출 (이미지 포함): {len(content)}자")
-                        self.driver.close()
-                        self.driver.switch_to.window(original_window)
-                        return content[:2000]
-                    
-                    # 방법 3: 일반 게시글 영역 - 이미지 URL 포함
-                    content = self.driver.execute_script("""
-                        var selectors = [
-                            '#postViewArea',
-                            '#content-area',
-                            '.post_ct',
-                            '#tbody',
-                            '.NHN_Writeform_Main',
-                            'div[class*="view_content"]',
-                            '.article_viewer',
-                            '.board-view-content'
-                        ];
-                        
-                        for (var i = 0; i < selectors.length; i++) {
-                            var elem = document.querySelector(selectors[i]);
-                            if (elem && elem.innerText && elem.innerText.length > 30) {
-                                var result = [elem.innerText.trim()];
-                                
-                                // 해당 영역 내 이미지도 추출
-                                var images = elem.querySelectorAll('img[src]');
-                                for (var j = 0; j < images.length; j++) {
-                                    var src = images[j].getAttribute('data-src') || images[j].getAttribute('src');
-                                    if (src) result.push('[이미지] ' + src);
-                                }
-                                
-                                return result.join('\\n\\n');
-                            }
-                        }
-                        return '';
-                    """)
-                    
-                    if content and len(content) > 30:
-                        logging.info(f"✅ 일반 선택자에서 내용 추출 (이미지 포함): {len(content)}자")
-                        self.driver.close()
-                        self.driver.switch_to.window(original_window)
-                        return content[:2000]
-                    
-                    # 방법 4: 사용자 제공 HTML 구조 기반 추출 (h3.title_text와 se-main-container)
-                    content = self.driver.execute_script("""
-                        // 먼저 제목 확인 (디버깅용)
-                        var title = document.querySelector('h3.title_text');
-                        if (title) {
-                            console.log('제목 찾음:', title.innerText);
-                        }
-                        
-                        // 본문 컨테이너 찾기
-                        var container = document.querySelector('.se-main-container') || 
-                                       document.querySelector('.ContentRenderer') ||
-                                       document.querySelector('#postViewArea');
-                        
-                        if (!container) {
-                            // 폴백: 전체 본문 영역 찾기
-                            container = document.querySelector('td.view') ||
-                                       document.querySelector('div.view_content') ||
-                                       document.querySelector('div#content-area');
-                        }
-                        
-                        if (container) {
-                            var result = [];
-                            
-                            // 텍스트 추출
-                            var textNodes = container.querySelectorAll('.se-text-paragraph, p, div');
-                            for (var i = 0; i < textNodes.length; i++) {
-                                var text = textNodes[i].innerText || textNodes[i].textContent;
-                                if (text && text.trim() && text.length > 10) {
-                                    // 댓글, 메뉴 등 제외
-                                    if (!text.includes('로그인') && !text.includes('메뉴') && !text.includes('댓글')) {
-                                        result.push(text.trim());
-                                    }
-                                }
-                            }
-                            
-                            // 이미지 URL 추출
-                            var images = container.querySelectorAll('img.se-image-resource, img[src]');
-                            for (var j = 0; j < images.length; j++) {
-                                var src = images[j].getAttribute('data-src') || 
-                                         images[j].getAttribute('src') ||
-                                         images[j].getAttribute('data-lazy-src');
-                                if (src && !src.includes('emoticon') && !src.includes('sticker')) {
-                                    result.push('[이미지] ' + src);
-                                }
-                            }
-                            
-                            return result.join('\\n\\n');
-                        }
-                        
-                        return '';
-                    """)
-                    
-                    if content and len(content) > 30:
-                        logging.info(f"✅ 텍스트 노드 수집으로 내용 추출: {len(content)}자")
-                        
-                except Exception as js_error:
-                    logging.error(f"JavaScript 실행 오류: {js_error}")
-                    
-                    # JavaScript 실패 시 Selenium으로 시도 (이미지 포함)
-                    selectors = [
-                        'div.se-main-container',
-                        'div.ContentRenderer', 
-                        '#postViewArea',
-                        '#content-area',
-                        'td.view',
-                        '#tbody'
-                    ]
-                    
-                    for selector in selectors:
-                        try:
-                            elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            content_parts = []
-                            
-                            # 텍스트 추출
-                            text = elem.text.strip()
-                            if text:
-                                content_parts.append(text)
-                            
-                            # 이미지 URL 추출
-                            try:
-                                images = elem.find_elements(By.CSS_SELECTOR, 'img[src], img[data-src]')
-                                for img in images:
-                                    src = img.get_attribute('data-src') or img.get_attribute('src')
-                                    if src and not any(skip in src for skip in ['emoticon', 'sticker', 'icon']):
-                                        content_parts.append(f'[이미지] {src}')
-                            except Exception as img_error:
-                                logging.debug(f"이미지 추출 중 오류: {img_error}")
-                            
-                            content = '\n\n'.join(content_parts)
-                            
-                            if content and len(content) > 30:
-                                logging.info(f"✅ Selenium으로 내용 추출 (이미지 포함): {selector} ({len(content)}자)")
-                                break
-                        except:
-                            continue
-                
-            except Exception as iframe_error:
-                logging.error(f"iframe 처리 오류: {iframe_error}")
-                # iframe 없이 시도 (이미지 URL 포함)
-                content = self.driver.execute_script("""
-                    var result = [];
-                    
-                    // 본문 텍스트 추출
-                    var bodyText = document.body.innerText || document.body.textContent;
-                    if (bodyText) result.push(bodyText);
-                    
-                    // 모든 이미지 URL 추출
-                    var images = document.querySelectorAll('img[src], img[data-src]');
-                    for (var i = 0; i < images.length; i++) {
-                        var src = images[i].getAttribute('data-src') || images[i].getAttribute('src');
-                        if (src && !src.includes('emoticon')) {
-                            result.push('[이미지] ' + src);
-                        }
-                    }
-                    
-                    return result.join('\\n\\n');
-                """)
-            
-            # 탭 닫기
-            self.driver.close()
-            self.driver.switch_to.window(original_window)
+            # 폴백: page_source를 한 번만 받아 프로세스 안에서 파싱
+            if not lines and SELECTOLAX_AVAILABLE:
+                try:
+                    tree = HTMLParser(self.driver.page_source)
+                    node = tree.css_first('.se-main-container, .ContentRenderer, #postViewArea')
+                    if node:
+                        lines = node.text(separator='\n', strip=True).split('\n')
+                        for img in node.css('img.se-image-resource, img[src]'):
+                            src = img.attributes.get('data-src') or img.attributes.get('src')
+                            if src:
+                                lines.append(f'[이미지] {src}')
+                        logging.info(f"✅ page_source 파싱으로 내용 추출: {len(lines)}줄")
+                except Exception as parse_error:
+                    logging.debug("page_source 파싱 오류: %s", parse_error)
             
             # 내용 검증 및 정리
-            if content and len(content.strip()) > 30:
-                # 불필요한 공백 정리
-                lines = content.split('\n')
-                cleaned_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not any(skip in line.lower() for skip in ['로그인', '메뉴', '목록', '이전글', '다음글']):
-                        cleaned_lines.append(line)
-                
+            if sum(len(line) for line in lines) > 30:
+                # 불필요한 공백/메뉴 줄 정리 (키워드는 정규식 한 번으로 검사)
+                cleaned_lines = [
+                    s for s in (line.strip() for line in lines)
+                    if s and not _SKIP_RE.search(s)
+                ]
                 content = '\n'.join(cleaned_lines)
                 
-                # 이미지 URL 개수 로깅
-                image_count = content.count('[이미지]')
+                # 이미지 URL 개수 로깅 (본문 문자열을 다시 훑지 않고 정리된 줄에서 집계)
+                image_count = sum(1 for line in cleaned_lines if line.startswith('[이미지]'))
                 if image_count > 0:
                     logging.info(f"📷 {image_count}개 이미지 URL 포함")
                 
-                return content[:2000]
+                return _cap(content)
             else:
-                logging.warning(f"⚠️ 내용 추출 실패 또는 너무 짧음 (길이: {len(content) if content else 0}) - URL: {url}")
-                # 디버깅: 현재 페이지 HTML 일부 출력
-                try:
-                    page_html = self.driver.page_source[:500]
-                    logging.debug(f"페이지 HTML 샘플: {page_html}")
-                except:
-                    pass
+                logging.warning(f"⚠️ 내용 추출 실패 또는 너무 짧음 (줄 수: {len(lines)}) - URL: {url}")
+                # 디버깅: 현재 페이지 HTML 일부 출력 (DEBUG일 때만)
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    try:
+                        page_html = self.driver.page_source[:500]
+                        logging.debug("페이지 HTML 샘플: %s", page_html)
+                    except:
+                        pass
                 return "(본문 내용을 가져올 수 없습니다)"
                 
         except Exception as e:
             logging.error(f"게시물 내용 크롤링 실패: {e}")
+            return ""
+        
+        finally:
             try:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+                self.driver.switch_to.default_content()
             except:
                 pass
-            return ""
     
     def close(self):
         """드라이버 종료"""
+        self.cache.close()
         if self.driver:
             self.driver.quit()
             logging.info("✅ 드라이버 종료")
 
 
+# 게시물마다 모양이 같은 블록 조각은 한 번만 만들어 재사용 (요청 직렬화 시 읽기만 함)
+_DIVIDER_BLOCK = {"object": "block", "type": "divider", "divider": {}}
+_PARA_BREAK = {"type": "text", "text": {"content": "\n\n"}}
+
+
+def _text_block(block_type: str, rich_text: List[Dict]) -> Dict:
+    return {"object": "block", "type": block_type, block_type: {"rich_text": rich_text}}
+
+
+def _make_blocks(title: str, info: str, body_paras: List[str], url: str) -> List[Dict]:
+    """노션 페이지 본문 블록 (제목, 정보, 구분선, 본문 한 단락, 원본 링크)"""
+    blocks = [
+        _text_block("heading_1", [{"type": "text", "text": {"content": title}}]),
+        _text_block("paragraph", [{"type": "text", "text": {"content": info}}]),
+        _DIVIDER_BLOCK
+    ]
+    
+    # 본문 - 단락마다 블록을 만들지 않고 한 블록의 rich_text에 줄바꿈으로 이어 붙임
+    if body_paras:
+        rich_text = []
+        for para in body_paras:
+            if rich_text:
+                rich_text.append(_PARA_BREAK)
+            rich_text.append({"type": "text", "text": {"content": para}})
+        blocks.append(_text_block("paragraph", rich_text))
+    
+    blocks.append(_text_block("paragraph", [{
+        "type": "text",
+        "text": {"content": "🔗 원본 게시물 보기", "link": {"url": url}}
+    }]))
+    return blocks
+
+
+class _RateLimiter:
+    """슬라이딩 윈도우 rate limiter - window초 동안 최대 capacity회 호출"""
+    
+    def __init__(self, capacity: int = 3, window: float = 1.0):
+        self.capacity = capacity
+        self.window = window
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰이 생길 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.capacity:
+                    self._calls.append(now)
+                    return
+                wait = self.window - (now - self._calls[0])
+            time.sleep(wait)
+
+
 class NotionDatabase:
     """노션 데이터베이스 핸들러"""
     
     def __init__(self):
-        self.client = Client(auth=os.getenv('NOTION_TOKEN'))
+        # 연결을 재사용하는 httpx 클라이언트 하나로 모든 요청 처리
+        self.client = Client(
+            auth=os.getenv('NOTION_TOKEN'),
+            client=httpx.Client(
+                http2=H2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=32),
+                timeout=30
+            )
+        )
         self.database_id = os.getenv('NOTION_DATABASE_ID')
-    
-    def check_duplicate(self, url: str) -> bool:
-        """URL로 중복 체크"""
+        
+        # 백그라운드 저장 큐 (크롤링과 업로드를 겹쳐서 진행)
+        self.write_q = queue.Queue(maxsize=32)
+        self.saved_counts = {}
+        self._writers = []
+        self._counts_lock = threading.Lock()
+        
+        # 노션 API 공용 rate limiter (초당 3회, 저장 스레드 전체 공유)
+        self._limiter = _RateLimiter(capacity=3, window=1.0)
+        
+        # DB 스키마는 실행 중 고정이므로 제목 필드/속성 타입을 한 번만 확인
+        self.title_prop = os.getenv('NOTION_TITLE_FIELD', '새 페이지')
+        self.property_types = {}
         try:
-            # URL에서 articleid 추출
-            article_id = ""
-            if 'articleid=' in url:
-                article_id = url.split('articleid=')[1].split('&')[0]
-            
-            if article_id:
-                # articleid로 정확한 중복 체크
-                response = self.client.databases.query(
-                    database_id=self.database_id,
-                    filter={
-                        "property": "URL",
-                        "url": {
-                            "contains": f"articleid={article_id}"
-                        }
-                    }
-                )
-            else:
-                # articleid가 없으면 전체 URL로 체크
-                response = self.client.databases.query(
-                    database_id=self.database_id,
-                    filter={
-                        "property": "URL",
-                        "url": {
-                            "equals": url
-                        }
-                    }
-                )
+            schema = self._call(self.client.databases.retrieve, database_id=self.database_id)
+            self.property_types = {name: prop['type'] for name, prop in schema['properties'].items()}
+            self.title_prop = next(
+                (name for name, prop_type in self.property_types.items() if prop_type == 'title'),
+                self.title_prop
+            )
+        except Exception as e:
+            logging.warning(f"⚠️ 노션 DB 스키마 조회 실패, 기본 제목 필드 사용: {e}")
+        
+        # 이미 저장된 articleid/URL (prefetch_existing_ids에서 한 번에 채움)
+        self._seen_ids = None
+        self._seen_urls = set()
+        self._seen_lock = threading.RLock()
+    
+    def _call(self, fn, *args, **kwargs):
+        """노션 API 호출 - rate limiter 통과 후 실행, 429 응답 시 Retry-After(없으면 지수 백오프) 대기 후 재시도"""
+        for attempt in range(5):
+            self._limiter.acquire()
+            try:
+                return fn(*args, **kwargs)
+            except APIResponseError as e:
+                if e.status != 429 or attempt == 4:
+                    raise
+                retry_after = float(e.headers.get('Retry-After', 2 ** attempt))
+                logging.warning(f"⏸️ 노션 rate limit, {retry_after}초 대기")
+                time.sleep(retry_after)
+    
+    def enqueue(self, article: Dict):
+        """저장할 게시물을 큐에 넣음 (첫 호출 시 저장 스레드 8개 시작)"""
+        if not self._writers:
+            for _ in range(8):
+                writer = threading.Thread(target=self._notion_writer, daemon=True)
+                writer.start()
+                self._writers.append(writer)
+        self.write_q.put(article)
+    
+    def _notion_writer(self):
+        while True:
+            article = self.write_q.get()
+            try:
+                if self.save_article(article):
+                    cafe_name = article.get('cafe_name', '')
+                    with self._counts_lock:
+                        self.saved_counts[cafe_name] = self.saved_counts.get(cafe_name, 0) + 1
+            finally:
+                self.write_q.task_done()
+    
+    def flush(self):
+        """큐에 쌓인 게시물이 모두 저장될 때까지 대기"""
+        self.write_q.join()
+    
+    def fetch_existing_urls(self, cafe_config: Dict = None) -> set:
+        """노션에 저장된 게시물 URL 전체를 페이지 단위(100개)로 조회"""
+        query = {"database_id": self.database_id, "page_size": 100}
+        if cafe_config and cafe_config.get('name'):
+            query["filter"] = {
+                "property": "카페명",
+                "select": {"equals": cafe_config['name']}
+            }
+        
+        urls = set()
+        cursor = None
+        while True:
+            if cursor:
+                query["start_cursor"] = cursor
+            try:
+                response = self._call(self.client.databases.query, **query)
+            except Exception as e:
+                if "filter" not in query:
+                    raise
+                # 카페명이 select 필드가 아니면 필터 없이 전체 조회
+                logging.debug("카페명 필터 조회 실패, 전체 조회: %s", e)
+                query.pop("filter")
+                query.pop("start_cursor", None)
+                urls.clear()
+                cursor = None
+                continue
             
-            is_duplicate = len(response['results']) > 0
-            if is_duplicate:
-                logging.debug(f"중복 확인: {url[:50]}...")
-            return is_duplicate
+            for page in response['results']:
+                url = (page['properties'].get('URL') or {}).get('url')
+                if url:
+                    urls.add(url)
             
+            if not response.get('has_more'):
+                break
+            cursor = response['next_cursor']
+        
+        logging.info(f"📥 기존 게시물 URL {len(urls)}개 로드")
+        return urls
+    
+    def prefetch_existing_ids(self):
+        """저장된 게시물 URL을 한 번에 조회해 articleid 집합으로 보관"""
+        try:
+            urls = self.fetch_existing_urls()
         except Exception as e:
-            logging.debug(f"중복 체크 실패: {e}")
-            return False
+            logging.warning(f"⚠️ 기존 게시물 조회 실패: {e}")
+            urls = set()
+        
+        with self._seen_lock:
+            self._seen_urls = urls
+            self._seen_ids = {m.group(1) for m in map(_ARTICLE_ID_RE.search, urls) if m}
+    
+    def check_duplicate(self, url: str) -> bool:
+        """URL로 중복 체크 (미리 조회한 집합에서 확인)"""
+        if self._seen_ids is None:
+            self.prefetch_existing_ids()
+        
+        return _is_seen(url, self._seen_ids, self._seen_urls)
+    
+    def seen_snapshot(self):
+        """워커 프로세스에 넘길 저장된 articleid/URL 집합 (읽기 전용 복사본)"""
+        if self._seen_ids is None:
+            self.prefetch_existing_ids()
+        with self._seen_lock:
+            return frozenset(self._seen_ids), frozenset(self._seen_urls)
+    
+    def _mark_saved(self, url: str) -> bool:
+        """저장할 게시물을 집합에 등록 (이미 있으면 False)"""
+        with self._seen_lock:
+            if self.check_duplicate(url):
+                return False
+            match = _ARTICLE_ID_RE.search(url)
+            if match:
+                self._seen_ids.add(match.group(1))
+            self._seen_urls.add(url)
+            return True
     
     def save_article(self, article: Dict) -> bool:
         """게시물 저장"""
         try:
-            # URL로 중복 체크
-            if self.check_duplicate(article['url']):
+            # URL로 중복 체크 (동시에 저장 중인 같은 게시물도 함께 걸러냄)
+            if not self._mark_saved(article['url']):
                 logging.info(f"⏭️ 중복 게시물 건너뛰기: {article['title'][:30]}...")
                 return False
             
@@ -800,35 +1024,18 @@ class NotionDatabase:
             # 필드 타입을 정확히 맞춰야 함
             properties = {}
             
-            # 제목 필드 - 환경변수로 설정 가능, 기본값은 "새 페이지"
-            # 노션의 기본 Title 필드명은 언어 설정에 따라 다름
-            title_field = os.getenv('NOTION_TITLE_FIELD', '새 페이지')
-            
             # 제목이 비어있지 않도록 확인
             title_text = article.get('title', '').strip()
             if not title_text:
                 title_text = f"게시물 - {datetime.now().strftime('%Y%m%d%H%M%S')}"
             
             logging.info(f"📝 노션 저장 시작: 제목={title_text[:30]}...")
-            logging.debug(f"📄 내용 미리보기: {article.get('content', '')[:100]}...")
-            
-            # 가능한 Title 필드명들 시도
-            title_fields_to_try = [title_field, '새 페이지', 'Name', '이름', '제목', 'Title']
-            title_set = False
-            
-            for field_name in title_fields_to_try:
-                try:
-                    properties[field_name] = {
-                        "title": [{"text": {"content": title_text}}]
-                    }
-                    title_set = True
-                    logging.debug(f"제목 필드 설정 성공: {field_name}")
-                    break
-                except:
-                    continue
+            logging.debug("📄 내용 미리보기: %.100s...", article.get('content', ''))
             
-            if not title_set:
-                logging.error("제목 필드를 설정할 수 없습니다")
+            # 제목 필드 - 스키마에서 확인한 title 타입 속성
+            properties[self.title_prop] = {
+                "title": [{"text": {"content": title_text}}]
+            }
             
             # URL 필드
             if article.get('url'):
@@ -848,14 +1055,13 @@ class NotionDatabase:
                     "rich_text": [{"text": {"content": article['date']}}]
                 }
             
-            # 카페명 (Select)
+            # 카페명 (Select, 스키마가 텍스트면 Rich Text)
             if article.get('cafe_name'):
-                try:
+                if self.property_types.get("카페명", "select") == "select":
                     properties["카페명"] = {
                         "select": {"name": article['cafe_name']}
                     }
-                except:
-                    # Select 필드가 없으면 텍스트로
+                else:
                     properties["카페명"] = {
                         "rich_text": [{"text": {"content": article['cafe_name']}}]
                     }
@@ -867,21 +1073,20 @@ class NotionDatabase:
                 content = "(내용을 불러오는 중...)"
                 logging.warning(f"내용이 비어있음: {title_text}")
             
-            # 노션 Rich Text 제한 (2000자)
-            content = content[:2000]
+            # 노션 Rich Text 제한 (2000자) - 한 번만 잘라서 아래 블록에도 그대로 사용
+            content = _cap(content)
             
             # 내용 필드 설정
             properties["내용"] = {
                 "rich_text": [{"text": {"content": content}}]
             }
             
-            # 크롤링 일시 (Date)
-            try:
+            # 크롤링 일시 (Date, 스키마가 텍스트면 Rich Text)
+            if self.property_types.get("크롤링 일시", "date") == "date":
                 properties["크롤링 일시"] = {
                     "date": {"start": datetime.now().isoformat()}
                 }
-            except:
-                # Date 필드가 없으면 텍스트로
+            else:
                 properties["크롤링 일시"] = {
                     "rich_text": [{"text": {"content": datetime.now().isoformat()}}]
                 }
@@ -891,87 +1096,24 @@ class NotionDatabase:
                 "checkbox": False
             }
             
-            # 노션 페이지 생성
-            page = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties
+            # 페이지 본문 블록 (페이지 생성 요청에 함께 포함)
+            body_paras = []
+            if content and content != "내용을 가져올 수 없습니다.":
+                body_paras = [para.strip() for para in content.split('\n\n') if para.strip()][:10]  # 최대 10개 단락
+            blocks = _make_blocks(
+                title_text,
+                f"📅 작성일: {article.get('date', 'N/A')}\n👤 작성자: {article.get('author', 'Unknown')}\n📊 조회수: {article.get('views', '0')}",
+                body_paras,
+                article.get('url', '')
             )
             
-            # 페이지 내용 추가 (블록으로)
-            try:
-                # 페이지 본문에 상세 내용 추가
-                blocks = []
-                
-                # 제목 블록
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_1",
-                    "heading_1": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {"content": title_text}
-                        }]
-                    }
-                })
-                
-                # 정보 블록
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {"content": f"📅 작성일: {article.get('date', 'N/A')}\n👤 작성자: {article.get('author', 'Unknown')}\n📊 조회수: {article.get('views', '0')}"}
-                        }]
-                    }
-                })
-                
-                # 구분선
-                blocks.append({
-                    "object": "block",
-                    "type": "divider",
-                    "divider": {}
-                })
-                
-                # 본문 내용
-                if content and content != "내용을 가져올 수 없습니다.":
-                    # 내용을 단락으로 나누기
-                    paragraphs = content.split('\n\n')
-                    for para in paragraphs[:10]:  # 최대 10개 단락
-                        if para.strip():
-                            blocks.append({
-                                "object": "block",
-                                "type": "paragraph",
-                                "paragraph": {
-                                    "rich_text": [{
-                                        "type": "text",
-                                        "text": {"content": para.strip()[:2000]}
-                                    }]
-                                }
-                            })
-                
-                # 원본 링크
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {
-                                "content": "🔗 원본 게시물 보기",
-                                "link": {"url": article.get('url', '')}
-                            }
-                        }]
-                    }
-                })
-                
-                # 블록 추가
-                self.client.blocks.children.append(
-                    block_id=page["id"],
-                    children=blocks
-                )
-            except Exception as e:
-                logging.debug(f"페이지 내용 추가 중 오류 (무시): {e}")
+            # 노션 페이지 생성 (속성과 본문 블록을 한 번의 요청으로)
+            self._call(
+                self.client.pages.create,
+                parent={"database_id": self.database_id},
+                properties=properties,
+                children=blocks
+            )
             
             logging.info(f"✅ 노션 저장 성공: {title_text[:30]}...")
             return True
@@ -981,6 +1123,24 @@ class NotionDatabase:
             return False
 
 
+# 프로세스 전체에서 공유하는 노션 핸들러 (TLS 연결/커넥션 풀 재사용)
+_NOTION: Optional[NotionDatabase] = None
+_notion_lock = threading.Lock()
+
+
+def get_notion() -> NotionDatabase:
+    global _NOTION
+    with _notion_lock:
+        _NOTION = _NOTION or NotionDatabase()
+    return _NOTION
+
+
+def crawl_one_cafe(cafe_config: Dict, worker_id: int = 0,
+                   seen_ids: frozenset = frozenset(), seen_urls: frozenset = frozenset()) -> List[Dict]:
+    """워커 프로세스 진입점 - 프로세스마다 자기 크롬으로 카페 하나를 크롤링"""
+    return NaverCafeCrawler.crawl_one(cafe_config, worker_id, seen_ids, seen_urls)
+
+
 def main():
     """메인 실행 함수"""
     logging.info("="*60)
@@ -1026,40 +1186,56 @@ def main():
         logging.error("CAFE1_URL, CAFE1_CLUB_ID, CAFE1_BOARD_ID")
         sys.exit(1)
     
-    # 크롤러 초기화
-    crawler = NaverCafeCrawler()
-    notion = NotionDatabase()
+    notion = get_notion()
+    failed = []
+    crawled_counts = {}
     
     try:
-        # 네이버 로그인
-        if not crawler.login_naver():
-            raise Exception("로그인 실패")
-        
-        total_saved = 0
+        # 저장된 게시물 ID를 한 번에 받아 두고 이후 중복 체크는 메모리에서
+        notion.prefetch_existing_ids()
+        seen_ids, seen_urls = notion.seen_snapshot()
         
-        # 각 카페 크롤링
-        for cafe in cafes:
-            logging.info(f"\n📍 {cafe['name']} 크롤링 시작...")
-            articles = crawler.crawl_cafe(cafe)
-            
-            # 노션에 저장
-            cafe_saved = 0
-            for article in articles:
-                if notion.save_article(article):
-                    cafe_saved += 1
-                    total_saved += 1
-            
-            logging.info(f"✅ {cafe['name']}: {len(articles)}개 크롤링, {cafe_saved}개 새로 저장")
-            time.sleep(2)
-        
-        logging.info(f"\n🎉 크롤링 완료! 총 {total_saved}개 새 게시물 저장")
+        # 카페별 프로세스에서 크롬을 하나씩 띄워 동시에 크롤링, 끝난 카페부터 바로 노션 저장 큐에 넣음
+        # (spawn: 자식 프로세스가 로그 리스너/세션을 새로 만들도록 fork 대신 사용)
+        with ProcessPoolExecutor(
+            max_workers=min(len(cafes), 4),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            futures = {
+                executor.submit(crawl_one_cafe, cafe, worker_id, seen_ids, seen_urls): cafe
+                for worker_id, cafe in enumerate(cafes)
+            }
+            for future in as_completed(futures):
+                cafe = futures[future]
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    # 한 카페가 실패해도 나머지 카페 결과는 계속 저장
+                    logging.error(f"❌ {cafe['name']} 크롤링 실패: {e}")
+                    failed.append(cafe['name'])
+                    continue
+                crawled_counts[cafe['name']] = len(articles)
+                for article in articles:
+                    notion.enqueue(article)
         
     except Exception as e:
         logging.error(f"❌ 크롤링 실패: {e}")
-        sys.exit(1)
-    
+        failed.append('main')
+        
     finally:
-        crawler.close()
+        # 큐에 남은 저장 작업 완료 대기 (데몬 저장 스레드가 종료와 함께 사라지기 전에)
+        notion.flush()
+    
+    for cafe in cafes:
+        cafe_saved = notion.saved_counts.get(cafe['name'], 0)
+        logging.info(f"✅ {cafe['name']}: {crawled_counts.get(cafe['name'], 0)}개 크롤링, {cafe_saved}개 새로 저장")
+    total_saved = sum(notion.saved_counts.values())
+    
+    logging.info(f"\n🎉 크롤링 완료! 총 {total_saved}개 새 게시물 저장")
+    
+    if failed:
+        logging.error(f"❌ 실패한 작업: {', '.join(failed)}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
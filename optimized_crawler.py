@@ -5,27 +5,73 @@ Based on proven production techniques
 """
 
 import os
+import re
+import asyncio
 import sys
 import time
-import pickle
+import json
 import logging
 import random
+from collections import deque
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
+import requests
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from notion_client import Client
+from selenium.common.exceptions import TimeoutException
+from notion_client import AsyncClient, APIResponseError
 from dotenv import load_dotenv
 
+# Optional fast JSON encoder for the JSONL log (falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast HTML parser for article bodies
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 load_dotenv()
 
+# Post links on a board list page (userDisplay=50)
+POST_LINK_SELECTOR = '#main-area table tbody tr td.td_article a.article'
+
+# Collect every board row (title/url/author/date) in a single WebDriver call
+BOARD_ROWS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function(a) {
+    var tr = a.closest('tr');
+    var name = tr && tr.querySelector('.td_name');
+    var date = tr && tr.querySelector('.td_date');
+    return {
+        title: (a.innerText || '').trim(),
+        url: a.href,
+        author: name ? name.innerText.trim() : '',
+        date: date ? date.innerText.trim() : ''
+    };
+});
+"""
+
+# Fill an input and fire the events the login form listens for
+SET_VALUE_JS = """
+arguments[0].value = arguments[1];
+arguments[0].dispatchEvent(new Event('input', { bubbles: true }));
+arguments[0].dispatchEvent(new Event('change', { bubbles: true }));
+"""
+
+ARTICLE_API_URL = "https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}"
+ARTICLE_READ_URL = "https://cafe.naver.com/ArticleRead.nhn?clubid={club_id}&articleid={article_id}"
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -33,15 +79,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _AsyncRateLimiter:
+    """Sliding-window rate limiter for asyncio - at most capacity calls per window seconds"""
+    
+    def __init__(self, capacity: int = 3, window: float = 1.0):
+        self.capacity = capacity
+        self.window = window
+        self._calls = deque()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self):
+        """Wait until a slot in the current window is free"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.capacity:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self._calls[0]))
+
+
 class OptimizedCrawler:
     """Production-ready crawler with memory management and stability features"""
     
     def __init__(self):
         self.driver = None
+        self.session = None
         self.data = []
         self.processed_urls = set()
-        self.checkpoint_file = "checkpoint.pkl"
-        self.data_file = "crawl_data.pkl"
+        self.data_file = "crawl_data.jsonl"
+        
+        # Append-only log: one JSON line per extracted post
+        self._jsonl = open(self.data_file, 'ab')
         
     def open_browser(self) -> webdriver.Chrome:
         """Open browser with optimized settings"""
@@ -71,8 +142,17 @@ class OptimizedCrawler:
         # User agent
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
+        # Skip images/CSS/fonts (only text and img src attributes are used)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.page_load_strategy = 'eager'
+        
         driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(10)  # Default wait time
+        driver.implicitly_wait(0)  # Explicit WebDriverWait only where needed
         
         # Anti-detection script
         driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
@@ -102,20 +182,14 @@ class OptimizedCrawler:
                 EC.presence_of_element_located((By.ID, "id"))
             )
             
-            # Type ID and PW slowly to avoid detection
+            # Set ID and PW with one script call per field (no per-key round-trips)
             id_input = self.driver.find_element(By.ID, "id")
-            for char in os.getenv('NAVER_ID'):
-                id_input.send_keys(char)
-                time.sleep(random.uniform(0.1, 0.2))
-                
-            time.sleep(1)
+            self.driver.execute_script(SET_VALUE_JS, id_input, os.getenv('NAVER_ID'))
+            time.sleep(0.5)
             
             pw_input = self.driver.find_element(By.ID, "pw")
-            for char in os.getenv('NAVER_PW'):
-                pw_input.send_keys(char)
-                time.sleep(random.uniform(0.1, 0.2))
-                
-            time.sleep(1)
+            self.driver.execute_script(SET_VALUE_JS, pw_input, os.getenv('NAVER_PW'))
+            time.sleep(0.5)
             
             # Click login
             login_btn = self.driver.find_element(By.ID, "log.login")
@@ -141,77 +215,47 @@ class OptimizedCrawler:
         params = f"?search.clubid={club_id}&search.menuid={board_id}&userDisplay=50&search.page={page}"
         return base_url + params
         
-    def extract_post_in_new_tab(self, post_element) -> Dict:
-        """Extract post data by opening in new tab"""
-        data = {}
+    def open_session(self):
+        """Copy the logged-in browser cookies into a requests session"""
+        cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+        self.session = requests.Session()
+        self.session.cookies.update(cookies)
+        self.session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        
+    def fetch_post(self, club_id: str, article_id: str) -> Dict:
+        """Fetch a single post from the article JSON API (no browser rendering)"""
+        api_url = ARTICLE_API_URL.format(club_id=club_id, article_id=article_id)
+        cafe_url = ARTICLE_READ_URL.format(club_id=club_id, article_id=article_id)
         
         try:
-            # Open in new tab (Ctrl+Enter)
-            post_element.send_keys(Keys.CONTROL + "\n")
-            time.sleep(1)
-            
-            # Switch to new tab
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            time.sleep(2)
-            
-            # Switch to iframe if exists
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.frame_to_be_available_and_switch_to_it("cafe_main")
-                )
-            except:
-                pass
-                
-            # Extract data
-            try:
-                data['url'] = self.driver.current_url
-                data['title'] = self.driver.find_element(By.CLASS_NAME, 'title_text').text
-                data['author'] = self.driver.find_element(By.CLASS_NAME, 'nickname').text
-                data['date'] = self.driver.find_element(By.CLASS_NAME, 'date').text
-                
-                # Try multiple content selectors
-                content_selectors = [
-                    '.se-main-container',
-                    '.ContentRenderer',
-                    '#postViewArea',
-                    '.article_viewer',
-                    '#content-area'
-                ]
-                
-                content = ""
-                for selector in content_selectors:
-                    try:
-                        elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        content = elem.text
-                        if content and len(content) > 20:
-                            break
-                    except:
-                        continue
-                        
-                data['content'] = content[:2000] if content else "Content not found"
-                
-            except Exception as e:
-                logger.debug(f"Data extraction error: {e}")
-                
+            resp = self.session.get(api_url, headers={'Referer': cafe_url}, timeout=15)
+            article = resp.json()['result']['article']
         except Exception as e:
-            logger.error(f"Tab handling error: {e}")
+            logger.debug(f"Article API error ({article_id}): {e}")
+            return {}
             
-        finally:
-            # Close tab and return to main
-            try:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-                # Switch back to iframe in main window
-                try:
-                    self.driver.switch_to.frame("cafe_main")
-                except:
-                    pass
-            except:
-                pass
+        content = article.get('contentHtml', '')
+        if SELECTOLAX_AVAILABLE:
+            tree = HTMLParser(content)
+            node = tree.css_first('.se-main-container, #postViewArea') or tree.body
+            if node:
+                parts = [node.text(separator='\n', strip=True)]
+                for img in node.css('img'):
+                    src = img.attributes.get('data-src') or img.attributes.get('src')
+                    if src:
+                        parts.append(f'[Image] {src}')
+                content = '\n\n'.join(p for p in parts if p)
                 
-        return data
+        timestamp = article.get('writeDate')
+        return {
+            'url': cafe_url,
+            'title': article.get('subject', ''),
+            'author': (article.get('writer') or {}).get('nick', ''),
+            'date': datetime.fromtimestamp(timestamp / 1000).strftime('%Y.%m.%d. %H:%M') if timestamp else '',
+            'content': content[:2000] if content else "Content not found"
+        }
         
-    def crawl_board_page(self, club_id: str, board_id: str, page: int) -> List[Dict]:
+    def crawl_board_page(self, club_id: str, board_id: str, page: int, cafe_name: str = '') -> List[Dict]:
         """Crawl a single board page with 50 posts"""
         page_data = []
         
@@ -219,9 +263,8 @@ class OptimizedCrawler:
             # Navigate to board page
             url = self.build_board_url(club_id, board_id, page)
             self.driver.get(url)
-            time.sleep(3)
             
-            # Switch to iframe
+            # Switch to iframe (as soon as it is ready)
             try:
                 WebDriverWait(self.driver, 10).until(
                     EC.frame_to_be_available_and_switch_to_it("cafe_main")
@@ -229,31 +272,53 @@ class OptimizedCrawler:
             except:
                 logger.warning("No iframe found, continuing...")
                 
-            # Find all post links (up to 50)
-            for i in range(1, 51):
-                try:
-                    # XPath for each post
-                    xpath = f'//*[@id="main-area"]/div[4]/table/tbody/tr[{i}]/td[1]/div[2]/div/a[1]'
-                    post_element = self.driver.find_element(By.XPATH, xpath)
+            # Collect article ids from the list (up to 50) in one call, then fetch each via API
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, POST_LINK_SELECTOR))
+                )
+            except TimeoutException:
+                logger.warning("No posts found on this page")
+                
+            # Scrape all row records in one script call
+            try:
+                rows = self.driver.execute_script(BOARD_ROWS_JS, POST_LINK_SELECTOR) or []
+            except Exception as e:
+                logger.debug(f"Row script failed: {e}")
+                rows = []
+                
+            # Fallback: parse the list HTML in-process (one page_source call)
+            if not rows and SELECTOLAX_AVAILABLE:
+                tree = HTMLParser(self.driver.page_source)
+                rows = [{'url': a.attributes.get('href') or ''} for a in tree.css(POST_LINK_SELECTOR)]
+                
+            article_ids = []
+            for row in rows[:50]:
+                match = re.search(r'articleid=(\d+)', row.get('url') or '')
+                if match:
+                    article_ids.append(match.group(1))
                     
-                    # Extract in new tab
-                    post_data = self.extract_post_in_new_tab(post_element)
+            for article_id in article_ids:
+                # Skip already processed posts before the API call and the delay
+                if ARTICLE_READ_URL.format(club_id=club_id, article_id=article_id) in self.processed_urls:
+                    continue
+                    
+                try:
+                    post_data = self.fetch_post(club_id, article_id)
                     
                     if post_data and post_data.get('url'):
-                        # Check if already processed
-                        if post_data['url'] not in self.processed_urls:
-                            page_data.append(post_data)
-                            self.processed_urls.add(post_data['url'])
-                            logger.info(f"✅ Extracted: {post_data.get('title', 'Unknown')[:30]}...")
-                            
+                        post_data['cafe_name'] = cafe_name
+                        post_data['crawled_at'] = datetime.now().isoformat()
+                        page_data.append(post_data)
+                        self.processed_urls.add(post_data['url'])
+                        self.append_post(post_data)
+                        logger.info(f"✅ Extracted: {post_data.get('title', 'Unknown')[:30]}...")
+                        
                     # Random delay between posts
                     time.sleep(random.uniform(0.5, 1.5))
                     
-                except NoSuchElementException:
-                    # No more posts on this page
-                    break
                 except Exception as e:
-                    logger.debug(f"Post {i} extraction failed: {e}")
+                    logger.debug(f"Post {article_id} extraction failed: {e}")
                     continue
                     
         except Exception as e:
@@ -261,52 +326,47 @@ class OptimizedCrawler:
             
         return page_data
         
-    def save_checkpoint(self):
-        """Save current progress"""
-        checkpoint = {
-            'data': self.data,
-            'processed_urls': self.processed_urls,
-            'timestamp': datetime.now().isoformat()
-        }
+    def append_post(self, post: Dict):
+        """Append one post to the JSONL log and fsync it"""
+        if ORJSON_AVAILABLE:
+            self._jsonl.write(orjson.dumps(post))
+        else:
+            self._jsonl.write(json.dumps(post, ensure_ascii=False).encode('utf-8'))
+        self._jsonl.write(b'\n')
+        self._jsonl.flush()
+        os.fsync(self._jsonl.fileno())
         
-        with open(self.checkpoint_file, 'wb') as f:
-            pickle.dump(checkpoint, f)
-            
+    def save_checkpoint(self):
+        """Flush the JSONL log (posts are already written as they are extracted)"""
+        self._jsonl.flush()
+        os.fsync(self._jsonl.fileno())
         logger.info(f"💾 Checkpoint saved: {len(self.data)} posts")
         
     def load_checkpoint(self) -> bool:
-        """Load previous progress if exists"""
-        if os.path.exists(self.checkpoint_file):
-            try:
-                with open(self.checkpoint_file, 'rb') as f:
-                    checkpoint = pickle.load(f)
-                    
-                self.data = checkpoint.get('data', [])
-                self.processed_urls = checkpoint.get('processed_urls', set())
-                
-                logger.info(f"📥 Loaded checkpoint: {len(self.data)} posts")
-                return True
-            except Exception as e:
-                logger.error(f"Checkpoint load failed: {e}")
-                
-        return False
-        
-    def restart_browser(self):
-        """Restart browser to prevent memory leaks"""
-        logger.info("🔄 Restarting browser to clear memory...")
-        
-        if self.driver:
-            self.driver.quit()
+        """Replay previously extracted posts from the JSONL log"""
+        if not os.path.exists(self.data_file):
+            return False
             
-        time.sleep(2)
-        self.driver = self.open_browser()
-        time.sleep(2)
-        
-        # Re-login
-        self.naver_login()
-        time.sleep(2)
+        self.data = []
+        self.processed_urls = set()
         
-        logger.info("✅ Browser restarted successfully")
+        try:
+            with open(self.data_file, 'rb') as f:
+                for line in f:
+                    try:
+                        post = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+                    except ValueError:
+                        # Partially written last line from a crash
+                        continue
+                    self.processed_urls.add(post['url'])
+                    self.data.append(post)
+                    
+            logger.info(f"📥 Loaded checkpoint: {len(self.data)} posts")
+            return bool(self.data)
+        except Exception as e:
+            logger.error(f"Checkpoint load failed: {e}")
+            
+        return False
         
     def crawl_cafe(self, cafe_config: Dict, max_pages: int = 100):
         """Main crawling function with memory management"""
@@ -322,20 +382,13 @@ class OptimizedCrawler:
         if not self.driver:
             self.driver = self.open_browser()
             self.naver_login()
+            self.open_session()
             
-        pages_since_restart = 0
-        
         for page in range(1, max_pages + 1):
             logger.info(f"📄 Crawling page {page}/{max_pages}")
             
-            # Crawl page
-            page_data = self.crawl_board_page(club_id, board_id, page)
-            
-            # Add cafe info to each post
-            for post in page_data:
-                post['cafe_name'] = cafe_name
-                post['crawled_at'] = datetime.now().isoformat()
-                
+            # Crawl page (each post is appended to the JSONL log as it is extracted)
+            page_data = self.crawl_board_page(club_id, board_id, page, cafe_name)
             self.data.extend(page_data)
             
             # Check if we should stop (old posts)
@@ -345,24 +398,9 @@ class OptimizedCrawler:
                     logger.info(f"⏹️ Reached 2020 posts, stopping...")
                     break
                     
-            pages_since_restart += 1
-            
-            # Save checkpoint and restart browser every 2 pages (100 posts)
-            if pages_since_restart >= 2:
-                self.save_checkpoint()
-                self.restart_browser()
-                pages_since_restart = 0
-                
             # Random delay between pages
             time.sleep(random.uniform(2, 4))
             
-        # Final save
-        self.save_checkpoint()
-        
-        # Save as pickle
-        with open(self.data_file, 'wb') as f:
-            pickle.dump(self.data, f)
-            
         logger.info(f"✅ Crawling complete: {len(self.data)} posts")
         
         return self.data
@@ -374,17 +412,40 @@ class OptimizedCrawler:
             return
             
         try:
-            notion = Client(auth=os.getenv('NOTION_TOKEN'))
-            database_id = os.getenv('NOTION_DATABASE_ID')
+            success_count = asyncio.run(self._save_to_notion_async())
+            logger.info(f"✅ Saved {success_count}/{len(self.data)} posts to Notion")
             
-            success_count = 0
+        except Exception as e:
+            logger.error(f"Notion connection failed: {e}")
             
-            for post in self.data:
+    async def _save_to_notion_async(self) -> int:
+        """Create all pages concurrently, rate-limited to 3 req/s with 429 retries (Notion rate limit)"""
+        notion = AsyncClient(auth=os.getenv('NOTION_TOKEN'))
+        database_id = os.getenv('NOTION_DATABASE_ID')
+        title_field = os.getenv('NOTION_TITLE_FIELD', 'Title')
+        sem = asyncio.Semaphore(3)
+        limiter = _AsyncRateLimiter(capacity=3, window=1.0)
+        
+        async def create_page(**kwargs):
+            """pages.create through the limiter, retrying 429s after Retry-After (or exponential backoff)"""
+            for attempt in range(5):
+                await limiter.acquire()
                 try:
-                    notion.pages.create(
+                    return await notion.pages.create(**kwargs)
+                except APIResponseError as e:
+                    if e.status != 429 or attempt == 4:
+                        raise
+                    retry_after = float(e.headers.get('Retry-After', 2 ** attempt))
+                    logger.warning(f"⏸️ Notion rate limited, waiting {retry_after}s")
+                    await asyncio.sleep(retry_after)
+        
+        async def save_one(post: Dict) -> bool:
+            async with sem:
+                try:
+                    await create_page(
                         parent={'database_id': database_id},
                         properties={
-                            os.getenv('NOTION_TITLE_FIELD', 'Title'): {
+                            title_field: {
                                 'title': [{'text': {'content': post.get('title', 'Untitled')}}]
                             }
                         },
@@ -398,20 +459,22 @@ class OptimizedCrawler:
                             }
                         ]
                     )
-                    
-                    success_count += 1
-                    time.sleep(0.5)  # Rate limiting
+                    return True
                     
                 except Exception as e:
                     logger.error(f"Failed to save post: {e}")
+                    return False
                     
-            logger.info(f"✅ Saved {success_count}/{len(self.data)} posts to Notion")
-            
-        except Exception as e:
-            logger.error(f"Notion connection failed: {e}")
+        try:
+            results = await asyncio.gather(*[save_one(post) for post in self.data])
+        finally:
+            await notion.aclose()
             
+        return sum(results)
+        
     def cleanup(self):
         """Clean up resources"""
+        self._jsonl.close()
         if self.driver:
             self.driver.quit()
             logger.info("✅ Browser closed")
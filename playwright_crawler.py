@@ -5,185 +5,392 @@ Playwright has better anti-detection than Selenium
 """
 
 import os
+import re
+import time
 import asyncio
+import json
 import logging
 from playwright.async_api import async_playwright
 from datetime import datetime
+from pathlib import Path
 import random
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Environment read once at import
+NAVER_ID = os.getenv('NAVER_ID')
+NAVER_PW = os.getenv('NAVER_PW')
+HEADLESS = os.getenv('GITHUB_ACTIONS') == 'true'
+
+# Pre-resolved browser binary (skips Playwright's lookup when set)
+CHROMIUM_PATH = os.getenv('PLAYWRIGHT_CHROMIUM_PATH') or None
+
+LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
+# Saved login session (live auth cookies) - kept in the user cache dir, outside the repo
+STATE_PATH = os.getenv('NAVER_STATE_PATH') or os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'newcrawling', 'naver_state.json'
+)
+
+# Stealth scripts added to every page of a pooled context
+# (webdriver flag, plugins, languages, permissions, window.chrome - minified, read once at import)
+STEALTH_JS = Path(__file__).with_name('stealth.min.js').read_text(encoding='utf-8')
+
+# Login finished: auth cookie visible, or redirected off the nid login host
+LOGGED_IN_JS = "() => document.cookie.includes('NID_AUT') || location.hostname !== 'nid.naver.com'"
+
+# Article anchors on the mobile cafe board
+ARTICLE_LINK_SELECTOR = 'a[href*="/articles/"]'
+
+# The crawler only reads anchors, so these are never needed
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+# Analytics/tracker hosts (pure telemetry, they only stretch page loads)
+BLOCKED_URL_RE = re.compile(r'(wcs|nelo|wlog|googletagmanager|doubleclick|google-analytics|facebook|hotjar)\.')
+
+
+async def block_heavy_resources(route):
+    """Abort image/font/media/stylesheet and tracker requests; let documents, scripts and XHR through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def parse_article_list(payload, club_id):
+    """Article rows (href/title) from a cafe article-list JSON response"""
+    if not isinstance(payload, dict):
+        return []
+    result = (payload.get('message') or payload).get('result') or {}
+    
+    rows = []
+    for item in result.get('articleList') or []:
+        item = item.get('item', item)
+        article_id = item.get('articleId')
+        title = item.get('subject')
+        if article_id and title:
+            rows.append({
+                'href': f'https://m.cafe.naver.com/ca-fe/web/cafes/{club_id}/articles/{article_id}',
+                'title': title
+            })
+    return rows
+
+
+class BrowserPool:
+    """One long-lived browser with reusable contexts, checked out per cafe
+    
+    Contexts (a few MB each) are the unit of parallelism, not extra browser launches.
+    """
+    
+    def __init__(self, size=1, max_pages_per_context=50, state_path=STATE_PATH, state_max_age=12 * 3600):
+        self.size = size
+        self.max_pages_per_context = max_pages_per_context
+        self.state_path = state_path
+        self.state_max_age = state_max_age
+        self._playwright = None
+        self._browser = None
+        self._pool = asyncio.Queue()
+        self._sem = asyncio.Semaphore(size)
+        self._uses = {}
+        self._pages = {}
+        
+        # Transfer stats (from Content-Length) to confirm resource blocking works
+        self.responses = 0
+        self.bytes_received = 0
+        
+    async def start(self, initializer=None):
+        """Launch the browser once, warm up the session if needed and pre-create the contexts"""
+        self._playwright = await async_playwright().start()
+        
+        # Launch browser with stealth settings
+        self._browser = await self._playwright.chromium.launch(
+            headless=HEADLESS,
+            args=list(LAUNCH_ARGS),
+            executable_path=CHROMIUM_PATH
+        )
+        
+        if self.has_fresh_state():
+            logger.info(f"♻️ Reusing saved session from {self.state_path}")
+        elif initializer:
+            await self.initialize_once(initializer)
+            
+        for _ in range(self.size):
+            await self._pool.put(await self._new_context())
+            
+        logger.info(f"✅ Browser pool started ({self.size} contexts)")
+        
+    def has_fresh_state(self):
+        return (
+            os.path.exists(self.state_path)
+            and time.time() - os.path.getmtime(self.state_path) < self.state_max_age
+        )
+        
+    async def initialize_once(self, initializer):
+        """Run login/warm-up once on a seed context and save its cookies for every context"""
+        context = await self._new_context(use_state=False)
+        try:
+            await initializer(self.page_for(context))
+            self._save_state(await context.storage_state())
+            logger.info(f"💾 Session saved to {self.state_path}")
+        finally:
+            await self._close_context(context)
+            
+    def _save_state(self, state):
+        """Write the session file owner-only (0600), its directory 0700"""
+        os.makedirs(os.path.dirname(self.state_path) or '.', mode=0o700, exist_ok=True)
+        fd = os.open(self.state_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # also tighten a file left over from an older run
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            
+    async def _new_context(self, use_state=True):
+        # Create context with anti-detection settings (and the saved login session)
+        context = await self._browser.new_context(
+            storage_state=self.state_path if use_state and os.path.exists(self.state_path) else None,
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+            locale='ko-KR',
+            timezone_id='Asia/Seoul',
+            # Extra headers
+            extra_http_headers={
+                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+            }
+        )
+        
+        await self.configure_context(context)
+        
+        # One long-lived tab per context; crawls navigate it instead of opening new pages
+        self._pages[context] = await context.new_page()
+        self._uses[context] = 0
+        return context
+        
+    def page_for(self, context):
+        """The context's reusable page"""
+        return self._pages[context]
+        
+    async def _close_context(self, context):
+        self._uses.pop(context, None)
+        self._pages.pop(context, None)
+        await context.close()
+        
+    async def configure_context(self, context):
+        """Per-context setup: stealth script, resource blocking, transfer stats"""
+        # Add stealth scripts to every page
+        await context.add_init_script(STEALTH_JS)
+        
+        # Skip images/fonts/media/CSS and count what is still transferred
+        await context.route('**/*', block_heavy_resources)
+        context.on('response', self._count_response)
+        
+    def _count_response(self, response):
+        self.responses += 1
+        self.bytes_received += int(response.headers.get('content-length') or 0)
+        
+    async def acquire(self):
+        """Check out a context (waits while all are in use)"""
+        await self._sem.acquire()
+        return await self._pool.get()
+        
+    async def release(self, context):
+        """Return a context, replacing it once its page has served max_pages_per_context crawls"""
+        try:
+            self._uses[context] += 1
+            if self._uses[context] >= self.max_pages_per_context:
+                # Recycle to avoid Chrome memory creep
+                await self._close_context(context)
+                context = await self._new_context()
+            await self._pool.put(context)
+        finally:
+            self._sem.release()
+            
+    async def close(self):
+        """Close all contexts, the browser and Playwright (safe on a partly started pool)"""
+        while not self._pool.empty():
+            await self._close_context(self._pool.get_nowait())
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+            
+        logger.info(f"📊 {self.responses} responses, ~{self.bytes_received // 1024} KB transferred")
+
+
 class PlaywrightCrawler:
     """Crawler using Playwright for better evasion"""
     
+    def __init__(self, pool):
+        self.pool = pool
+        
     async def crawl(self, cafe_config):
-        """Main crawling function using Playwright"""
-        async with async_playwright() as p:
-            # Launch browser with stealth settings
-            browser = await p.chromium.launch(
-                headless=os.getenv('GITHUB_ACTIONS') == 'true',
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                ]
-            )
+        """Main crawling function using a pooled browser context"""
+        context = await self.pool.acquire()
+        page = self.pool.page_for(context)
+        
+        try:
+            # Extract articles (login and session warm-up already ran once in BrowserPool.start)
+            articles = await self.extract_articles(page, cafe_config)
             
-            # Create context with anti-detection settings
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
-                locale='ko-KR',
-                timezone_id='Asia/Seoul',
-                # Extra headers
-                extra_http_headers={
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-                }
-            )
+            return articles
             
-            # Add stealth scripts to every page
-            await context.add_init_script("""
-                // Override navigator.webdriver
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Mock plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Mock languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['ko-KR', 'ko', 'en-US', 'en']
-                });
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Add chrome object
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {}
-                };
-            """)
+        except Exception as e:
+            logger.error(f"Crawling failed: {e}")
+            # Take screenshot for debugging
+            await page.screenshot(path="error_screenshot.png")
+            return []
             
-            page = await context.new_page()
+        finally:
+            await self.pool.release(context)
             
-            try:
-                # Login
-                await self.login_with_playwright(page)
-                
-                # Build session gradually
-                await self.build_session(page, cafe_config['club_id'])
-                
-                # Extract articles
-                articles = await self.extract_articles(page, cafe_config)
-                
-                return articles
-                
-            except Exception as e:
-                logger.error(f"Crawling failed: {e}")
-                # Take screenshot for debugging
-                await page.screenshot(path="error_screenshot.png")
-                return []
-                
-            finally:
-                await browser.close()
-                
+    async def warm_up(self, page, club_id):
+        """Login + gradual session build, run once per process on the pool's seed context"""
+        await self.login_with_playwright(page)
+        await self.build_session(page, club_id)
+        
     async def login_with_playwright(self, page):
         """Login using Playwright with human-like behavior"""
-        await page.goto('https://nid.naver.com/nidlogin.login')
-        await page.wait_for_load_state('networkidle')
-        
-        # Type slowly like a human
-        await page.fill('#id', os.getenv('NAVER_ID'), timeout=30000)
-        await asyncio.sleep(random.uniform(0.5, 1.5))
+        await page.goto('https://nid.naver.com/nidlogin.login', wait_until='domcontentloaded')
         
-        await page.fill('#pw', os.getenv('NAVER_PW'), timeout=30000)
-        await asyncio.sleep(random.uniform(0.5, 1.5))
+        # Fill both fields at once; one short jitter before submitting
+        await page.fill('#id', NAVER_ID, timeout=30000)
+        await page.fill('#pw', NAVER_PW, timeout=30000)
+        await asyncio.sleep(random.uniform(0.2, 0.5))
         
-        # Click login
-        await page.click('#log\\.login')
-        
-        # Wait for navigation
-        await page.wait_for_load_state('networkidle')
-        await asyncio.sleep(5)
+        # Click login and wait for the resulting navigation in one step (no click/wait race)
+        async with page.expect_navigation(wait_until='domcontentloaded', timeout=15000):
+            await page.click('#log\\.login')
+            
+        # Returns as soon as the auth cookie is set or we leave the login host
+        await page.wait_for_function(LOGGED_IN_JS, timeout=15000)
         
         logger.info("✅ Login completed")
         
     async def build_session(self, page, club_id):
-        """Build session gradually"""
-        # Visit Naver main
-        await page.goto('https://www.naver.com')
-        await asyncio.sleep(random.uniform(2, 4))
-        
-        # Visit cafe main
-        await page.goto('https://cafe.naver.com')
-        await asyncio.sleep(random.uniform(2, 4))
-        
-        # Visit specific cafe
-        await page.goto(f'https://cafe.naver.com/ca-fe/cafes/{club_id}')
-        await asyncio.sleep(random.uniform(2, 4))
+        """Visit the cafe once so its cookies land in the saved session"""
+        # naver.com / cafe.naver.com only set cookies the cafe page sets again
+        await page.goto(f'https://cafe.naver.com/ca-fe/cafes/{club_id}', wait_until='domcontentloaded')
         
         logger.info("✅ Session built")
         
     async def extract_articles(self, page, cafe_config):
         """Extract articles using multiple strategies"""
-        articles = []
+        club_id = cafe_config['club_id']
         
         # Try mobile version first (usually less protected)
-        mobile_url = f"https://m.cafe.naver.com/ca-fe/{cafe_config['club_id']}?menuId={cafe_config['board_id']}"
+        mobile_url = f"https://m.cafe.naver.com/ca-fe/{club_id}?menuId={cafe_config['board_id']}"
         
-        await page.goto(mobile_url)
-        await page.wait_for_load_state('networkidle')
+        # Read the article-list XHR JSON as it arrives instead of waiting for the DOM
+        payloads = []
+        article_event = asyncio.Event()
         
-        # Extract article links
-        links = await page.query_selector_all('a[href*="/articles/"]')
-        
-        for link in links[:10]:
+        async def handle(resp):
+            if 'articlelist' in resp.url.lower() and resp.request.resource_type in ('xhr', 'fetch'):
+                try:
+                    payloads.append(await resp.json())
+                    article_event.set()
+                except Exception as e:
+                    logger.debug(f"Article list response not JSON: {e}")
+                    
+        page.on('response', handle)
+        try:
+            await page.goto(mobile_url, wait_until='commit')
             try:
-                href = await link.get_attribute('href')
-                title = await link.inner_text()
-                
-                articles.append({
-                    'title': title,
-                    'url': href,
-                    'date': datetime.now().strftime('%Y-%m-%d')
-                })
-            except:
-                continue
-                
+                await asyncio.wait_for(article_event.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                logger.info("No article list XHR seen, falling back to DOM")
+        finally:
+            page.remove_listener('response', handle)
+            
+        rows = [row for payload in payloads for row in parse_article_list(payload, club_id)][:10]
+        
+        if not rows:
+            # Bind the article-link locator once; reuse it for waiting and any further passes
+            articles_loc = page.locator(ARTICLE_LINK_SELECTOR)
+            await articles_loc.first.wait_for(timeout=10000)
+            
+            # Extract article links in a single evaluate (no per-link round trips)
+            rows = await articles_loc.evaluate_all(
+                '(els) => els.slice(0, 10).map(a => ({href: a.getAttribute("href"), title: a.innerText}))'
+            )
+        
+        # Keep only complete rows (no exceptions / per-item awaits)
+        today = datetime.now().strftime('%Y-%m-%d')
+        articles = [
+            {'title': row['title'].strip(), 'url': row['href'], 'date': today}
+            for row in rows
+            if row.get('href') and (row.get('title') or '').strip()
+        ]
+        
         logger.info(f"✅ Extracted {len(articles)} articles")
         return articles
 
 
 async def main():
     """Main function"""
-    crawler = PlaywrightCrawler()
-    
-    cafe_config = {
-        'name': os.getenv('CAFE1_NAME'),
-        'club_id': os.getenv('CAFE1_CLUB_ID'),
-        'board_id': os.getenv('CAFE1_BOARD_ID')
-    }
+    # Cafe configurations (CAFE1_*, CAFE2_*, ...)
+    cafe_configs = []
+    n = 1
+    while os.getenv(f'CAFE{n}_CLUB_ID'):
+        cafe_configs.append({
+            'name': os.getenv(f'CAFE{n}_NAME'),
+            'club_id': os.getenv(f'CAFE{n}_CLUB_ID'),
+            'board_id': os.getenv(f'CAFE{n}_BOARD_ID')
+        })
+        n += 1
+        
+    if not cafe_configs:
+        logger.error("❌ No cafes configured (CAFE1_CLUB_ID, ...)")
+        return
+        
+    # Fail fast before launching anything if a fresh login would be impossible
+    if not (NAVER_ID and NAVER_PW):
+        logger.error("❌ NAVER_ID / NAVER_PW are not set")
+        return
+        
+    concurrency = min(len(cafe_configs), int(os.getenv('CRAWL_CONCURRENCY', '5'))) or 1
+    pool = BrowserPool(size=concurrency)
+    crawler = PlaywrightCrawler(pool)
     
-    articles = await crawler.crawl(cafe_config)
+    sem = asyncio.Semaphore(concurrency)
     
-    for article in articles:
-        print(f"- {article['title']}")
+    async def bounded(cfg):
+        async with sem:
+            return await crawler.crawl(cfg)
+            
+    try:
+        # Log in and warm up once; every context shares the saved session
+        try:
+            await pool.start(initializer=lambda page: crawler.warm_up(page, cafe_configs[0]['club_id']))
+        except Exception as e:
+            logger.error(f"❌ Browser start / login failed: {e}")
+            return
+            
+        # One failed cafe must not cancel the others
+        results = await asyncio.gather(*[bounded(c) for c in cafe_configs], return_exceptions=True)
+    finally:
+        await pool.close()
+        
+    total = 0
+    for cfg, articles in zip(cafe_configs, results):
+        if isinstance(articles, Exception):
+            logger.error(f"❌ {cfg['name']} failed: {articles}")
+            continue
+        print(f"\n[{cfg['name']}]")
+        for article in articles:
+            print(f"- {article['title']}")
+        total += len(articles)
         
-    print(f"\nTotal: {len(articles)} articles")
+    print(f"\nTotal: {total} articles")
 
 
 if __name__ == '__main__':
-    asyncio.run(main()
\ No newline at end of file
+    asyncio.run(main())
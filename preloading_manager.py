@@ -11,17 +11,321 @@ Requirements 2.1, 2.2, 2.3을 완전히 구현:
 
 import time
 import logging
+import threading
+import weakref
 import os
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException, JavascriptException
 
 from content_extraction_models import PreloadingManagerInterface, ExtractionConfig
 
 
+# 브라우저에서 실행할 JavaScript 함수 본문 (arguments로 인자를 받음)
+_JS_WAIT_ALL = """
+    var timeoutMs = arguments[0], checkIdle = arguments[1];
+    var callback = arguments[arguments.length - 1];
+    var started = Date.now();
+
+    function noRecentResources() {
+        if (!checkIdle) {
+            return true; // CDP networkIdle 이벤트로 별도 확인
+        }
+        if (typeof window.performance === 'undefined' || !window.performance.getEntriesByType) {
+            return true; // Performance API 미지원 시 통과
+        }
+        // 최근 1초 판정에는 마지막 몇 개의 리소스만 필요하므로 스캔 범위를 제한
+        var all = window.performance.getEntriesByType('resource');
+        var resources = all.slice(Math.max(0, all.length - 32));
+        var now = window.performance.now();
+        return !resources.some(function(resource) {
+            return resource.responseEnd > (now - 1000);
+        });
+    }
+
+    function check() {
+        var timing = window.performance && window.performance.timing;
+        var state = {
+            ready: document.readyState === 'complete',
+            jquery: typeof jQuery === 'undefined' || jQuery.active === 0,
+            loaded: !timing || timing.loadEventEnd > 0,
+            // 에디터가 감지되거나 네비게이션 후 5초 이상 경과
+            editor: document.querySelector('.se-main-container, .ContentRenderer, #postViewArea, #content-area, #tbody') !== null ||
+                    (timing && (Date.now() - timing.navigationStart) > 5000),
+            idle: noRecentResources()
+        };
+        state.ok = state.ready && state.jquery && state.loaded && !!state.editor && state.idle;
+        return state;
+    }
+
+    function waitAll() {
+        var state = check();
+        if (state.ok || Date.now() - started >= timeoutMs) {
+            clearInterval(timer);
+            if (state.ok && checkIdle && window.performance && window.performance.clearResourceTimings) {
+                window.performance.clearResourceTimings(); // 리소스 타이밍 버퍼 증가 방지
+            }
+            callback(state);
+        }
+    }
+
+    var timer = setInterval(waitAll, 100);
+    waitAll();
+"""
+
+_JS_DOM_QUIET = """
+    var quietMs = arguments[0], maxMs = arguments[1];
+    var callback = arguments[arguments.length - 1];
+    var finished = false, quietTimer = null, capTimer = null, observer = null;
+
+    function done(result) {
+        if (finished) return;
+        finished = true;
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        if (observer) observer.disconnect();
+        callback(result);
+    }
+
+    var root = document.body || document.documentElement;
+    if (!root || typeof MutationObserver === 'undefined') {
+        done(true);
+        return;
+    }
+
+    observer = new MutationObserver(function() {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(function() { done(true); }, quietMs);
+    });
+    observer.observe(root, {subtree: true, childList: true, attributes: true});
+
+    quietTimer = setTimeout(function() { done(true); }, quietMs);
+    capTimer = setTimeout(function() { done(false); }, maxMs);
+"""
+
+_JS_SCROLL_INFO = """
+    return {
+        originalY: window.pageYOffset,
+        originalX: window.pageXOffset,
+        bodyHeight: document.body.scrollHeight,
+        windowHeight: window.innerHeight,
+        bodyWidth: document.body.scrollWidth,
+        windowWidth: window.innerWidth,
+        url: location.href,
+        imageCount: document.images.length
+    };
+"""
+
+_JS_SCROLL_SEQUENCE = """
+    // 각 위치에서 최대 pause ms 대기하되, 로드 완료된 이미지 수가 두 번 연속 그대로면 다음 위치로 이동
+    var positions = arguments[0], pause = arguments[1], horizontal = arguments[2];
+    var callback = arguments[arguments.length - 1];
+
+    function completedImages() {
+        var images = document.images, count = 0;
+        for (var k = 0; k < images.length; k++) {
+            if (images[k].complete) count++;
+        }
+        return count;
+    }
+
+    function settle(next) {
+        var deadline = Date.now() + pause, prev = -1, stable = 0;
+        (function tick() {
+            var count = completedImages();
+            stable = (count === prev) ? stable + 1 : 0;
+            prev = count;
+            if (stable >= 2 || Date.now() >= deadline) {
+                requestAnimationFrame(next);
+            } else {
+                setTimeout(tick, 100);
+            }
+        })();
+    }
+
+    (function step(i) {
+        if (i >= positions.length) return callback();
+        if (horizontal) {
+            window.scrollTo(positions[i], window.pageYOffset);
+        } else {
+            window.scrollTo(0, positions[i]);
+        }
+        settle(function() { step(i + 1); });
+    })(0);
+"""
+
+_JS_NAVER_LAZY = """
+    // lazy 이미지가 하나도 없으면 전체 DOM 스캔 생략
+    if (!document.querySelector('.se-image-resource[data-src], img[data-lazy-src], img[data-original], img[loading="lazy"]')) {
+        return false;
+    }
+
+    // SmartEditor 3.0 이미지 lazy loading
+    var se3Images = document.querySelectorAll('.se-image-resource[data-src]');
+    se3Images.forEach(function(img) {
+        if (img.dataset.src && !img.src) {
+            img.src = img.dataset.src;
+        }
+    });
+
+    // SmartEditor 2.0 이미지 lazy loading
+    var se2Images = document.querySelectorAll('img[data-lazy-src]');
+    se2Images.forEach(function(img) {
+        if (img.dataset.lazySrc && !img.src) {
+            img.src = img.dataset.lazySrc;
+        }
+    });
+
+    // 일반적인 lazy loading 이미지
+    var lazyImages = document.querySelectorAll('img[data-original], img[loading="lazy"]');
+    lazyImages.forEach(function(img) {
+        if (img.dataset.original && !img.src) {
+            img.src = img.dataset.original;
+        }
+    });
+    return true;
+"""
+
+_JS_IMAGE_LAZY = """
+    var images = document.querySelectorAll(
+        "img[data-src], img[data-lazy-src], img[data-original], img[loading='lazy']");
+    images.forEach(function(img) {
+        img.loading = 'eager';
+        var src = img.dataset.src || img.dataset.lazySrc || img.dataset.original;
+        if (src && !img.src) {
+            img.src = src;
+        }
+    });
+
+    // scroll/resize 이벤트에 의존하는 lazy loading 라이브러리 깨우기
+    window.dispatchEvent(new Event('scroll'));
+    window.dispatchEvent(new Event('resize'));
+
+    // 레이아웃을 한 번만 강제로 갱신
+    void document.body.offsetHeight;
+    return images.length;
+"""
+
+_JS_CONTENT_LOADED = """
+    // SmartEditor 3.0 / 2.0 / 일반 에디터를 한 번의 탐색으로 찾은 뒤 종류별로 판정
+    var el = document.querySelector('.se-main-container, .ContentRenderer, #postViewArea, #content-area, #tbody');
+    if (!el) {
+        return false;
+    }
+
+    // 바깥 컨테이너가 먼저 매칭된 경우에도 SmartEditor 3.0 기준을 우선 적용
+    var se3 = el.matches('.se-main-container') ? el : el.querySelector('.se-main-container');
+    if (se3) {
+        return se3.querySelectorAll('.se-module-text, .se-text-paragraph').length > 0;
+    }
+
+    return el.innerHTML.length > 100;
+"""
+
+_JS_PERF_METRICS = """
+    // Navigation Timing Level 2: navigationStart 기준 상대 시간(ms)
+    if (typeof window.performance === 'undefined' || !window.performance.getEntriesByType) {
+        return null;
+    }
+
+    var nav = window.performance.getEntriesByType('navigation')[0];
+    if (!nav) {
+        return null;
+    }
+
+    return {
+        domainLookup: nav.domainLookupEnd - nav.domainLookupStart,
+        connect: nav.connectEnd - nav.connectStart,
+        ttfb: nav.responseStart - nav.requestStart,
+        domReady: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        type: nav.type,
+        redirectCount: nav.redirectCount
+    };
+"""
+
+_JS_AJAX_IDLE = """
+    // jQuery AJAX 확인
+    if (typeof jQuery !== 'undefined' && jQuery.active !== undefined) {
+        if (jQuery.active > 0) return false;
+    }
+
+    // XMLHttpRequest 확인 (간단한 방법)
+    if (typeof window.activeXHRs !== 'undefined') {
+        return window.activeXHRs === 0;
+    }
+
+    // Fetch API 확인은 복잡하므로 기본적으로 통과
+    return true;
+"""
+
+_JS_ELEMENTS_PRESENT = """
+    // 모든 선택자(requireAll=false면 하나라도)가 나타나거나 제한 시간이 지날 때까지 80ms 간격으로 확인
+    var selectors = arguments[0], deadline = Date.now() + arguments[1];
+    var requireAll = arguments[2] !== false;
+    var callback = arguments[arguments.length - 1];
+
+    function check() {
+        var results = {}, allFound = true, anyFound = false;
+        selectors.forEach(function(selector) {
+            results[selector] = document.querySelector(selector) !== null;
+            if (results[selector]) anyFound = true;
+            else allFound = false;
+        });
+        if ((requireAll ? allFound : anyFound) || Date.now() > deadline) {
+            clearInterval(timer);
+            callback(results);
+        }
+    }
+
+    var timer = setInterval(check, 80);
+    check();
+"""
+
+_JS_POLL = """
+    // window.__pm[predicate]()가 참이 될 때까지 브라우저 안에서 80ms 간격으로 확인
+    var predicate = window.__pm[arguments[0]], deadline = Date.now() + arguments[1];
+    var callback = arguments[arguments.length - 1];
+    var timer = setInterval(function() {
+        try {
+            if (predicate()) {
+                clearInterval(timer);
+                callback(true);
+            } else if (Date.now() > deadline) {
+                clearInterval(timer);
+                callback(false);
+            }
+        } catch (e) {
+            clearInterval(timer);
+            callback(false);
+        }
+    }, 80);
+"""
+
+# window.__pm 에 한 번 설치한 뒤 이름으로 호출하는 스크립트들 (문서/프레임마다 1회 파싱)
+_PM_FUNCTIONS = {
+    'waitAll': _JS_WAIT_ALL,
+    'domQuiet': _JS_DOM_QUIET,
+    'scrollInfo': _JS_SCROLL_INFO,
+    'scrollSequence': _JS_SCROLL_SEQUENCE,
+    'naverLazy': _JS_NAVER_LAZY,
+    'imageLazy': _JS_IMAGE_LAZY,
+    'contentLoaded': _JS_CONTENT_LOADED,
+    'perfMetrics': _JS_PERF_METRICS,
+    'ajaxIdle': _JS_AJAX_IDLE,
+    'poll': _JS_POLL,
+    'elementsPresent': _JS_ELEMENTS_PRESENT,
+}
+
+_JS_INSTALL_PM = "window.__pm = window.__pm || {};" + "".join(
+    f"window.__pm.{name} = function() {{\n{body}\n}};\n" for name, body in _PM_FUNCTIONS.items()
+)
+
+
 class PreloadingManager(PreloadingManagerInterface):
     """
     동적 콘텐츠 로딩 대기 및 관리를 담당하는 클래스
@@ -32,6 +336,10 @@ class PreloadingManager(PreloadingManagerInterface):
     - 페이지 스크롤을 통한 lazy loading 콘텐츠 활성화
     """
     
+    # 드라이버별 매니저 (CDP 리스너/Page 도메인 설정을 드라이버당 한 번만)
+    _instances = weakref.WeakKeyDictionary()
+    _instances_lock = threading.Lock()
+    
     def __init__(self, driver, config: Optional[ExtractionConfig] = None):
         """
         PreloadingManager 초기화
@@ -43,6 +351,113 @@ class PreloadingManager(PreloadingManagerInterface):
         self.driver = driver
         self.config = config or ExtractionConfig()
         self.logger = logging.getLogger(__name__)
+        self._net_idle_evt = self._enable_network_idle_events()
+        self._last_lazy_sig = None  # 마지막으로 lazy loading을 처리한 페이지 상태 (url, 높이, 이미지 수)
+    
+    @classmethod
+    def for_driver(cls, driver, config: Optional[ExtractionConfig] = None) -> 'PreloadingManager':
+        """
+        드라이버에 연결된 매니저를 반환 (없으면 생성)
+        
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            config: 추출 설정 (None이면 기존 매니저 설정 유지)
+            
+        Returns:
+            PreloadingManager: 드라이버당 하나인 매니저
+        """
+        with cls._instances_lock:
+            manager = cls._instances.get(driver)
+            if manager is None:
+                manager = cls._instances[driver] = cls(driver, config)
+            elif config is not None:
+                manager.config = config
+            return manager
+    
+    @classmethod
+    def preload_many(cls, driver_url_pairs: List[Tuple[Any, str]],
+                     config: Optional[ExtractionConfig] = None) -> List[bool]:
+        """
+        여러 드라이버(탭/브라우저)에서 적응형 대기 전략을 동시에 실행합니다.
+        
+        Args:
+            driver_url_pairs: (WebDriver, 이미 이동한 페이지 URL) 목록 - 드라이버마다 독립된 세션이어야 함
+            config: 추출 설정 (None일 경우 기본값 사용)
+            
+        Returns:
+            List[bool]: driver_url_pairs와 같은 순서의 적응형 대기 성공 여부
+        """
+        if not driver_url_pairs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=len(driver_url_pairs)) as executor:
+            futures = [
+                executor.submit(cls.for_driver(driver, config).adaptive_wait_strategy, url)
+                for driver, url in driver_url_pairs
+            ]
+            return [future.result() for future in futures]
+    
+    def _enable_network_idle_events(self) -> Optional[threading.Event]:
+        """
+        CDP lifecycle 이벤트로 networkIdle 신호를 받을 Event 설정
+        
+        Returns:
+            Optional[threading.Event]: CDP 리스너를 지원하지 않는 드라이버면 None (JS 폴링 사용)
+        """
+        add_listener = getattr(self.driver, 'add_cdp_listener', None)
+        if not callable(add_listener) or not hasattr(self.driver, 'execute_cdp_cmd'):
+            return None
+        
+        net_idle_evt = threading.Event()
+        
+        try:
+            self.driver.execute_cdp_cmd('Page.enable', {})
+            self.driver.execute_cdp_cmd('Page.setLifecycleEventsEnabled', {'enabled': True})
+            
+            # 최상위 문서의 이벤트만 사용 (광고/cafe_main 등 하위 프레임 이벤트는 무시)
+            main_frame_id = self.driver.execute_cdp_cmd('Page.getFrameTree', {})['frameTree']['frame']['id']
+            
+            def on_lifecycle(message):
+                params = message.get('params', {})
+                if params.get('frameId') != main_frame_id:
+                    return
+                if params.get('name') == 'init':
+                    net_idle_evt.clear()  # 새 문서 로딩 시작
+                elif params.get('name') == 'networkIdle':
+                    net_idle_evt.set()
+            
+            # undetected-chromedriver는 enable_cdp_events 없이 생성되면 False 반환 (이벤트 미수신)
+            if not add_listener('Page.lifecycleEvent', on_lifecycle):
+                self.logger.debug("⚠️ CDP 이벤트 수신 비활성 드라이버, JS 폴링 사용")
+                return None
+            
+            # lifecycle 이벤트는 재전송되지 않으므로 이미 로드된 페이지면 idle 상태로 시작
+            if self.driver.execute_script('return document.readyState') == 'complete':
+                net_idle_evt.set()
+            
+            self.logger.debug("✅ CDP networkIdle 이벤트 수신 설정")
+            return net_idle_evt
+        except Exception as e:
+            self.logger.debug(f"⚠️ CDP lifecycle 이벤트 설정 실패, JS 폴링 사용: {e}")
+            return None
+    
+    def _pm_call(self, name: str, *args) -> Any:
+        """window.__pm 에 설치된 스크립트 함수를 이름으로 호출 (미설치 문서면 설치 후 재시도)"""
+        script = f"return window.__pm.{name}.apply(null, arguments);"
+        try:
+            return self.driver.execute_script(script, *args)
+        except JavascriptException:
+            self.driver.execute_script(_JS_INSTALL_PM)
+            return self.driver.execute_script(script, *args)
+    
+    def _pm_call_async(self, name: str, *args) -> Any:
+        """_pm_call의 execute_async_script 버전 (마지막 인자로 콜백이 전달됨)"""
+        script = f"window.__pm.{name}.apply(null, arguments);"
+        try:
+            return self.driver.execute_async_script(script, *args)
+        except JavascriptException:
+            self.driver.execute_script(_JS_INSTALL_PM)
+            return self.driver.execute_async_script(script, *args)
     
     def wait_for_complete_loading(self, timeout: int = 30) -> bool:
         """
@@ -62,32 +477,27 @@ class PreloadingManager(PreloadingManagerInterface):
         """
         try:
             self.logger.info(f"⏳ 페이지 완전 로딩 대기 시작 (최대 {timeout}초)")
-            start_time = time.time()
             
-            # 1단계: document.readyState가 'complete'가 될 때까지 대기
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            # 1~3단계: readyState, jQuery, load 이벤트, 카페 에디터 (CDP 미지원 시 네트워크 idle 포함)를
+            # 브라우저 안에서 100ms 간격으로 한 번에 확인 (WebDriver 왕복 1회)
+            self.driver.set_script_timeout(timeout + 5)
+            state = self._pm_call_async('waitAll', timeout * 1000, self._net_idle_evt is None)
+
+            if not state['ready']:
+                self.logger.warning(f"⚠️ 페이지 로딩 대기 타임아웃: document.readyState 미완료 ({timeout}초)")
+                return False
             self.logger.info("✅ document.readyState = 'complete' 확인")
+            if not state['ok']:
+                pending = [key for key in ('jquery', 'loaded', 'editor', 'idle') if not state.get(key)]
+                self.logger.debug(f"⚠️ 일부 로딩 조건 미충족 상태로 진행: {pending}")
             
-            # 2단계: JavaScript 라이브러리 로딩 완료 대기
-            self._wait_for_javascript_libraries(timeout=min(10, timeout//3))
-            
-            # 3단계: 네이버 카페 특화 스크립트 로딩 대기
-            self._wait_for_naver_cafe_scripts(timeout=min(10, timeout//3))
-            
-            # 4단계: 네트워크 요청 완료 대기
-            self._wait_for_network_idle(timeout=min(5, timeout//6))
-            
-            # 5단계: Requirements 2.2 구현 - iframe 전환 후 최소 3초 추가 대기
-            remaining_time = timeout - (time.time() - start_time)
-            if remaining_time > 3:
-                self.logger.info("⏳ iframe 전환 후 동적 콘텐츠 로딩을 위한 추가 대기 (3초)")
-                time.sleep(3)
-            else:
-                self.logger.warning(f"⚠️ 타임아웃 임박으로 추가 대기 시간 단축: {max(1, remaining_time)}초")
-                time.sleep(max(1, remaining_time))
-            
+            # 4단계: CDP를 지원하면 브라우저의 networkIdle 이벤트로 네트워크 idle 확인
+            if self._net_idle_evt is not None:
+                self._wait_for_network_idle(timeout=min(5, timeout//6))
+
+            # 5단계: Requirements 2.2 구현 - 고정 3초 대기 대신 DOM 변경이 잠잠해질 때까지 대기
+            self._wait_for_dom_quiescence()
+
             self.logger.info("✅ 페이지 완전 로딩 대기 완료")
             return True
             
@@ -101,96 +511,34 @@ class PreloadingManager(PreloadingManagerInterface):
             self.logger.error(f"❌ 페이지 로딩 대기 중 예상치 못한 오류: {e}")
             return False
     
-    def _wait_for_javascript_libraries(self, timeout: int = 10) -> bool:
-        """JavaScript 라이브러리 로딩 완료 대기"""
-        try:
-            # jQuery 활성 요청 완료 대기
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("""
-                    if (typeof jQuery !== 'undefined') {
-                        return jQuery.active === 0;
-                    }
-                    return true;
-                """)
-            )
-            self.logger.debug("✅ jQuery 활성 요청 완료 확인")
-            
-            # 기타 JavaScript 라이브러리 로딩 확인
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("""
-                    // 일반적인 로딩 상태 확인
-                    var loadComplete = document.readyState === 'complete';
-                    
-                    // Performance API를 통한 로드 이벤트 확인
-                    if (typeof window.performance !== 'undefined' && window.performance.timing) {
-                        loadComplete = loadComplete && window.performance.timing.loadEventEnd > 0;
-                    }
-                    
-                    return loadComplete;
-                """)
-            )
-            self.logger.debug("✅ JavaScript 라이브러리 로딩 완료 확인")
-            return True
-            
-        except TimeoutException:
-            self.logger.debug("⚠️ JavaScript 라이브러리 로딩 대기 타임아웃")
-            return False
-    
-    def _wait_for_naver_cafe_scripts(self, timeout: int = 10) -> bool:
-        """네이버 카페 특화 스크립트 로딩 대기"""
-        try:
-            # SmartEditor 관련 스크립트 로딩 확인
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("""
-                    // SmartEditor 3.0 확인
-                    var se3Ready = document.querySelector('.se-main-container') !== null;
-                    
-                    // SmartEditor 2.0 확인  
-                    var se2Ready = document.querySelector('.ContentRenderer, #postViewArea') !== null;
-                    
-                    // 일반 에디터 확인
-                    var generalReady = document.querySelector('#content-area, #tbody') !== null;
-                    
-                    // 최소한 하나의 에디터가 감지되거나 5초 이상 경과
-                    return se3Ready || se2Ready || generalReady || 
-                           (Date.now() - window.performance.timing.navigationStart) > 5000;
-                """)
-            )
-            self.logger.debug("✅ 네이버 카페 에디터 스크립트 로딩 확인")
-            return True
-            
-        except TimeoutException:
-            self.logger.debug("⚠️ 네이버 카페 스크립트 로딩 대기 타임아웃")
-            return False
-    
     def _wait_for_network_idle(self, timeout: int = 5) -> bool:
-        """네트워크 요청 완료 대기 (Network Idle 상태)"""
-        try:
-            # 간단한 네트워크 idle 확인 (Performance API 사용)
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("""
-                    if (typeof window.performance === 'undefined' || !window.performance.getEntriesByType) {
-                        return true; // Performance API 미지원 시 통과
-                    }
-                    
-                    var resources = window.performance.getEntriesByType('resource');
-                    var now = window.performance.now();
-                    
-                    // 최근 1초 내에 완료된 리소스가 있는지 확인
-                    var recentResources = resources.filter(function(resource) {
-                        return resource.responseEnd > (now - 1000);
-                    });
-                    
-                    return recentResources.length === 0;
-                """)
-            )
+        """네트워크 요청 완료 대기 (CDP Page.lifecycleEvent 'networkIdle')"""
+        if self._net_idle_evt.wait(timeout):
             self.logger.debug("✅ 네트워크 idle 상태 확인")
             return True
-            
+        self.logger.debug("⚠️ 네트워크 idle 대기 타임아웃")
+        return False
+    
+    def _wait_for_dom_quiescence(self, quiet_ms: int = 300, max_ms: int = 3000) -> bool:
+        """
+        MutationObserver로 DOM 변경이 quiet_ms 동안 없을 때까지 대기 (최대 max_ms)
+
+        Returns:
+            bool: 최대 대기 시간 전에 DOM이 잠잠해졌는지 여부
+        """
+        try:
+            quiet = self._pm_call_async('domQuiet', quiet_ms, max_ms)
+
+            if quiet:
+                self.logger.debug("✅ DOM 변경 안정화 확인")
+            else:
+                self.logger.debug(f"⚠️ DOM 변경이 계속되어 최대 대기 시간 도달 ({max_ms}ms)")
+            return bool(quiet)
+
         except TimeoutException:
-            self.logger.debug("⚠️ 네트워크 idle 대기 타임아웃")
+            self.logger.debug("⚠️ DOM 안정화 대기 스크립트 타임아웃")
             return False
-    
+
     def trigger_lazy_loading(self) -> None:
         """
         Lazy loading 콘텐츠를 활성화합니다.
@@ -205,16 +553,13 @@ class PreloadingManager(PreloadingManagerInterface):
             self.logger.info("🔄 Lazy loading 콘텐츠 활성화 시작")
             
             # 현재 스크롤 위치 및 페이지 정보 저장
-            scroll_info = self.driver.execute_script("""
-                return {
-                    originalY: window.pageYOffset,
-                    originalX: window.pageXOffset,
-                    bodyHeight: document.body.scrollHeight,
-                    windowHeight: window.innerHeight,
-                    bodyWidth: document.body.scrollWidth,
-                    windowWidth: window.innerWidth
-                };
-            """)
+            scroll_info = self._pm_call('scrollInfo')
+            
+            # 재시도 시 페이지 높이와 이미지 수가 그대로면 스크롤/이미지 처리 생략
+            lazy_sig = (scroll_info.get('url'), scroll_info['bodyHeight'], scroll_info.get('imageCount'))
+            if lazy_sig == self._last_lazy_sig:
+                self.logger.debug("📍 페이지 변화 없음: lazy loading 재실행 생략")
+                return
             
             # 1단계: 수직 스크롤 패턴 (상 → 중간 → 하 → 상)
             self._perform_vertical_scroll_pattern(scroll_info)
@@ -239,6 +584,10 @@ class PreloadingManager(PreloadingManagerInterface):
             # 6단계: 최종 대기 (모든 lazy loading 완료 대기)
             time.sleep(1)
             
+            # 처리 후 상태를 기록해 다음 재시도에서 변화가 없으면 건너뜀
+            self._last_lazy_sig = tuple(self.driver.execute_script(
+                "return [location.href, document.body.scrollHeight, document.images.length];"))
+            
             self.logger.info("✅ Lazy loading 콘텐츠 활성화 완료")
             
         except WebDriverException as e:
@@ -264,10 +613,8 @@ class PreloadingManager(PreloadingManagerInterface):
             body_height - window_height,  # 하단
         ]
         
-        for i, position in enumerate(scroll_positions):
-            self.driver.execute_script(f"window.scrollTo(0, {position});")
-            time.sleep(self.config.scroll_pause_time)
-            self.logger.debug(f"📍 수직 스크롤 {i+1}/{len(scroll_positions)}: {position}px")
+        self._run_scroll_sequence(scroll_positions, int(self.config.scroll_pause_time * 1000))
+        self.logger.debug(f"📍 수직 스크롤 {len(scroll_positions)}단계 완료: {scroll_positions}")
     
     def _perform_horizontal_scroll_pattern(self, scroll_info: Dict[str, Any]) -> None:
         """수평 스크롤 패턴 실행 (넓은 콘텐츠가 있는 경우)"""
@@ -280,79 +627,33 @@ class PreloadingManager(PreloadingManagerInterface):
             body_width - window_width,  # 우측
         ]
         
-        for i, position in enumerate(scroll_positions):
-            self.driver.execute_script(f"window.scrollTo({position}, window.pageYOffset);")
-            time.sleep(1)
-            self.logger.debug(f"📍 수평 스크롤 {i+1}/{len(scroll_positions)}: {position}px")
+        self._run_scroll_sequence(scroll_positions, 1000, horizontal=True)
+        self.logger.debug(f"📍 수평 스크롤 {len(scroll_positions)}단계 완료: {scroll_positions}")
+
+    def _run_scroll_sequence(self, positions: List[int], pause_ms: int, horizontal: bool = False) -> None:
+        """스크롤 위치들을 브라우저 안에서 한 번에 순회 (위치마다 이미지 로딩이 안정되거나 pause_ms가 지나면 이동)"""
+        self.driver.set_script_timeout(len(positions) * pause_ms / 1000 + 5)
+        self._pm_call_async('scrollSequence', positions, pause_ms, horizontal)
     
     def _trigger_naver_cafe_lazy_loading(self) -> None:
         """네이버 카페 특화 lazy loading 트리거"""
         try:
-            # SmartEditor 이미지 lazy loading 트리거
-            self.driver.execute_script("""
-                // SmartEditor 3.0 이미지 lazy loading
-                var se3Images = document.querySelectorAll('.se-image-resource[data-src]');
-                se3Images.forEach(function(img) {
-                    if (img.dataset.src && !img.src) {
-                        img.src = img.dataset.src;
-                    }
-                });
-                
-                // SmartEditor 2.0 이미지 lazy loading
-                var se2Images = document.querySelectorAll('img[data-lazy-src]');
-                se2Images.forEach(function(img) {
-                    if (img.dataset.lazySrc && !img.src) {
-                        img.src = img.dataset.lazySrc;
-                    }
-                });
-                
-                // 일반적인 lazy loading 이미지
-                var lazyImages = document.querySelectorAll('img[data-original], img[loading="lazy"]');
-                lazyImages.forEach(function(img) {
-                    if (img.dataset.original && !img.src) {
-                        img.src = img.dataset.original;
-                    }
-                });
-            """)
+            # SmartEditor 이미지 lazy loading 트리거 (lazy 이미지가 없으면 즉시 반환)
+            if self._pm_call('naverLazy') is False:
+                self.logger.debug("📍 lazy loading 이미지 없음: 네이버 카페 트리거 생략")
+                return
             self.logger.debug("✅ 네이버 카페 특화 lazy loading 트리거 완료")
             
         except Exception as e:
             self.logger.debug(f"⚠️ 네이버 카페 lazy loading 트리거 중 오류: {e}")
     
     def _trigger_image_lazy_loading(self) -> None:
-        """이미지 lazy loading 특별 처리"""
+        """이미지 lazy loading 특별 처리 (모든 lazy 이미지를 한 번의 스크립트로 활성화)"""
         try:
-            # Intersection Observer가 있는 이미지들을 뷰포트에 노출
-            lazy_images = self.driver.find_elements(By.CSS_SELECTOR, 
-                "img[data-src], img[data-lazy-src], img[data-original], img[loading='lazy']")
+            count = self._pm_call('imageLazy')
             
-            if lazy_images:
-                self.logger.debug(f"🖼️ {len(lazy_images)}개의 lazy loading 이미지 발견")
-                
-                # 각 이미지를 뷰포트에 스크롤하여 로딩 트리거
-                for i, img in enumerate(lazy_images[:10]):  # 최대 10개만 처리 (성능 고려)
-                    try:
-                        # 이미지 위치로 스크롤
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", img)
-                        time.sleep(0.5)
-                        
-                        # 강제로 이미지 로딩 트리거
-                        self.driver.execute_script("""
-                            var img = arguments[0];
-                            if (img.dataset.src && !img.src) {
-                                img.src = img.dataset.src;
-                            } else if (img.dataset.lazySrc && !img.src) {
-                                img.src = img.dataset.lazySrc;
-                            } else if (img.dataset.original && !img.src) {
-                                img.src = img.dataset.original;
-                            }
-                        """, img)
-                        
-                    except Exception as e:
-                        self.logger.debug(f"⚠️ 이미지 {i+1} lazy loading 처리 중 오류: {e}")
-                        continue
-                
-                self.logger.debug("✅ 이미지 lazy loading 처리 완료")
+            if count:
+                self.logger.debug(f"🖼️ {count}개의 lazy loading 이미지 활성화 완료")
             
         except Exception as e:
             self.logger.debug(f"⚠️ 이미지 lazy loading 처리 중 오류: {e}")
@@ -432,28 +733,7 @@ class PreloadingManager(PreloadingManagerInterface):
         """
         try:
             # SmartEditor 관련 요소들이 로드되었는지 확인
-            smart_editor_loaded = self.driver.execute_script("""
-                // SmartEditor 3.0 확인
-                var se3 = document.querySelector('.se-main-container');
-                if (se3) {
-                    var textElements = se3.querySelectorAll('.se-module-text, .se-text-paragraph');
-                    return textElements.length > 0;
-                }
-                
-                // SmartEditor 2.0 확인
-                var se2 = document.querySelector('.ContentRenderer, #postViewArea');
-                if (se2) {
-                    return se2.innerHTML.length > 100;
-                }
-                
-                // 일반 에디터 확인
-                var general = document.querySelector('#content-area, #tbody');
-                if (general) {
-                    return general.innerHTML.length > 100;
-                }
-                
-                return false;
-            """)
+            smart_editor_loaded = self._pm_call('contentLoaded')
             
             if smart_editor_loaded:
                 self.logger.debug("✅ 동적 콘텐츠 로드 확인됨")
@@ -513,22 +793,10 @@ class PreloadingManager(PreloadingManagerInterface):
         try:
             self.logger.debug("⏳ AJAX 요청 완료 대기")
             
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("""
-                    // jQuery AJAX 확인
-                    if (typeof jQuery !== 'undefined' && jQuery.active !== undefined) {
-                        if (jQuery.active > 0) return false;
-                    }
-                    
-                    // XMLHttpRequest 확인 (간단한 방법)
-                    if (typeof window.activeXHRs !== 'undefined') {
-                        return window.activeXHRs === 0;
-                    }
-                    
-                    // Fetch API 확인은 복잡하므로 기본적으로 통과
-                    return true;
-                """)
-            )
+            self.driver.set_script_timeout(timeout + 2)
+            if not self._pm_call_async('poll', 'ajaxIdle', timeout * 1000):
+                self.logger.debug("⚠️ AJAX 완료 대기 타임아웃")
+                return False
             
             self.logger.debug("✅ AJAX 요청 완료 확인")
             return True
@@ -540,38 +808,35 @@ class PreloadingManager(PreloadingManagerInterface):
             self.logger.debug(f"❌ AJAX 완료 대기 중 오류: {e}")
             return False
     
-    def wait_for_specific_elements(self, selectors: List[str], timeout: int = 10) -> Dict[str, bool]:
+    def wait_for_specific_elements(self, selectors: List[str], timeout: int = 10,
+                                   require_all: bool = True) -> Dict[str, bool]:
         """
-        특정 요소들의 로딩 완료 대기
+        특정 요소들의 로딩 완료 대기 (모든 선택자를 브라우저 안에서 한 번에 확인)
         
         Args:
             selectors: 대기할 CSS 선택자 목록
-            timeout: 각 선택자별 최대 대기 시간 (초)
+            timeout: 전체 최대 대기 시간 (초)
+            require_all: False면 하나라도 나타나는 즉시 반환 (대체 선택자 목록용)
             
         Returns:
             Dict[str, bool]: 각 선택자별 로딩 완료 여부
         """
-        results = {}
-        
-        for selector in selectors:
-            try:
-                self.logger.debug(f"⏳ 요소 로딩 대기: {selector}")
-                
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                
-                results[selector] = True
-                self.logger.debug(f"✅ 요소 로딩 완료: {selector}")
-                
-            except TimeoutException:
-                results[selector] = False
-                self.logger.debug(f"⚠️ 요소 로딩 타임아웃: {selector}")
-            except Exception as e:
-                results[selector] = False
-                self.logger.debug(f"❌ 요소 로딩 대기 중 오류: {selector}, {e}")
-        
-        return results
+        try:
+            self.logger.debug(f"⏳ 요소 로딩 대기: {selectors}")
+            
+            self.driver.set_script_timeout(timeout + 2)
+            results = self._pm_call_async('elementsPresent', selectors, timeout * 1000, require_all)
+            
+            for selector, found in results.items():
+                if found:
+                    self.logger.debug(f"✅ 요소 로딩 완료: {selector}")
+                else:
+                    self.logger.debug(f"⚠️ 요소 로딩 타임아웃: {selector}")
+            return results
+            
+        except Exception as e:
+            self.logger.debug(f"❌ 요소 로딩 대기 중 오류: {selectors}, {e}")
+            return {selector: False for selector in selectors}
     
     def get_loading_performance_metrics(self) -> Dict[str, Any]:
         """
@@ -581,50 +846,10 @@ class PreloadingManager(PreloadingManagerInterface):
             Dict[str, Any]: 성능 메트릭 정보
         """
         try:
-            metrics = self.driver.execute_script("""
-                if (typeof window.performance === 'undefined' || !window.performance.timing) {
-                    return null;
-                }
-                
-                var timing = window.performance.timing;
-                var navigation = window.performance.navigation;
-                
-                return {
-                    // 기본 타이밍 정보
-                    navigationStart: timing.navigationStart,
-                    domainLookupStart: timing.domainLookupStart,
-                    domainLookupEnd: timing.domainLookupEnd,
-                    connectStart: timing.connectStart,
-                    connectEnd: timing.connectEnd,
-                    requestStart: timing.requestStart,
-                    responseStart: timing.responseStart,
-                    responseEnd: timing.responseEnd,
-                    domLoading: timing.domLoading,
-                    domInteractive: timing.domInteractive,
-                    domContentLoadedEventStart: timing.domContentLoadedEventStart,
-                    domContentLoadedEventEnd: timing.domContentLoadedEventEnd,
-                    domComplete: timing.domComplete,
-                    loadEventStart: timing.loadEventStart,
-                    loadEventEnd: timing.loadEventEnd,
-                    
-                    // 계산된 메트릭
-                    totalLoadTime: timing.loadEventEnd - timing.navigationStart,
-                    domReadyTime: timing.domContentLoadedEventEnd - timing.navigationStart,
-                    firstByteTime: timing.responseStart - timing.requestStart,
-                    
-                    // 네비게이션 타입
-                    navigationType: navigation.type,
-                    redirectCount: navigation.redirectCount
-                };
-            """)
+            metrics = self._pm_call('perfMetrics')
             
             if metrics:
-                # 시간을 밀리초에서 초로 변환
-                for key in ['totalLoadTime', 'domReadyTime', 'firstByteTime']:
-                    if metrics.get(key):
-                        metrics[f"{key}_seconds"] = metrics[key] / 1000
-                
-                self.logger.debug(f"📊 로딩 성능 메트릭 수집 완료: {metrics.get('totalLoadTime_seconds', 0):.2f}초")
+                self.logger.debug(f"📊 로딩 성능 메트릭 수집 완료: {metrics.get('load', 0) / 1000:.2f}초")
             
             return metrics or {}
             
@@ -673,7 +898,8 @@ class PreloadingManager(PreloadingManagerInterface):
                     '#tbody'
                 ]
                 
-                editor_results = self.wait_for_specific_elements(editor_selectors, timeout=10)
+                # 에디터는 페이지당 하나뿐이므로 처음 감지되는 즉시 진행
+                editor_results = self.wait_for_specific_elements(editor_selectors, timeout=10, require_all=False)
                 detected_editors = [sel for sel, found in editor_results.items() if found]
                 
                 if detected_editors:
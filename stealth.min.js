@@ -0,0 +1 @@
+Object.defineProperty(navigator,"webdriver",{get:()=>void 0});Object.defineProperty(navigator,"plugins",{get:()=>[1,2,3,4,5]});Object.defineProperty(navigator,"languages",{get:()=>["ko-KR","ko","en-US","en"]});const originalQuery=window.navigator.permissions.query;window.navigator.permissions.query=e=>"notifications"===e.name?Promise.resolve({state:Notification.permission}):originalQuery(e);window.chrome={runtime:{},loadTimes:function(){},csi:function(){}};
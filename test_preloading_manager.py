@@ -9,7 +9,7 @@ from unittest.mock import Mock, MagicMock, patch, call
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 
-from preloading_manager import PreloadingManager
+from preloading_manager import PreloadingManager, _JS_WAIT_ALL, _JS_DOM_QUIET, _JS_INSTALL_PM
 from content_extraction_models import ExtractionConfig
 
 
@@ -19,6 +19,7 @@ class TestPreloadingManager(unittest.TestCase):
     def setUp(self):
         """테스트 설정"""
         self.mock_driver = Mock()
+        del self.mock_driver.add_cdp_listener  # CDP 리스너 미지원 드라이버 (JS 폴링 경로)
         self.mock_config = ExtractionConfig(
             timeout_seconds=30,
             scroll_pause_time=1.0,
@@ -39,47 +40,49 @@ class TestPreloadingManager(unittest.TestCase):
         preloader = PreloadingManager(self.mock_driver, custom_config)
         self.assertEqual(preloader.config.timeout_seconds, 60)
     
-    @patch('preloading_manager.WebDriverWait')
     @patch('preloading_manager.time.sleep')
-    def test_wait_for_complete_loading_success(self, mock_sleep, mock_wait):
+    def test_wait_for_complete_loading_success(self, mock_sleep):
         """완전한 로딩 대기 성공 테스트"""
-        # Mock WebDriverWait 설정
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.return_value = True
-        
-        # Mock driver.execute_script 설정
-        self.mock_driver.execute_script.side_effect = [
-            'complete',  # document.readyState
-            True,        # jQuery.active check
-            True         # performance timing check
+        # 통합 준비 상태 확인 결과와 DOM 안정화 결과
+        self.mock_driver.execute_async_script.side_effect = [
+            {'ready': True, 'jquery': True, 'loaded': True, 'editor': True, 'idle': True, 'ok': True},
+            True
         ]
         
         result = self.preloader.wait_for_complete_loading(timeout=30)
         
         self.assertTrue(result)
-        # 3초 추가 대기 확인 (Requirements 2.2)
-        mock_sleep.assert_called_with(3)
-        # WebDriverWait 호출 확인
-        self.assertEqual(mock_wait.call_count, 3)  # 3번의 대기 단계
+        # 고정 3초 대기 대신 DOM 안정화 대기 확인 (Requirements 2.2)
+        mock_sleep.assert_not_called()
+        # 준비 상태 확인 1회 + DOM 안정화 1회
+        self.assertEqual(self.mock_driver.execute_async_script.call_count, 2)
+        self.mock_driver.execute_script.assert_not_called()
     
-    @patch('preloading_manager.WebDriverWait')
-    def test_wait_for_complete_loading_timeout(self, mock_wait):
+    def test_wait_for_complete_loading_timeout(self):
         """로딩 대기 타임아웃 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.side_effect = TimeoutException("Timeout")
+        self.mock_driver.execute_async_script.return_value = {
+            'ready': False, 'jquery': True, 'loaded': False, 'editor': False, 'idle': True, 'ok': False
+        }
         
         result = self.preloader.wait_for_complete_loading(timeout=30)
         
         self.assertFalse(result)
+        self.mock_driver.execute_async_script.assert_called_once()
     
-    @patch('preloading_manager.WebDriverWait')
-    def test_wait_for_complete_loading_webdriver_exception(self, mock_wait):
+    def test_wait_for_complete_loading_partial_conditions(self):
+        """readyState 완료 후 일부 조건 미충족 시 진행 테스트"""
+        self.mock_driver.execute_async_script.side_effect = [
+            {'ready': True, 'jquery': False, 'loaded': True, 'editor': False, 'idle': True, 'ok': False},
+            True
+        ]
+        
+        result = self.preloader.wait_for_complete_loading(timeout=30)
+        
+        self.assertTrue(result)
+    
+    def test_wait_for_complete_loading_webdriver_exception(self):
         """로딩 대기 WebDriver 예외 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.side_effect = WebDriverException("WebDriver error")
+        self.mock_driver.execute_async_script.side_effect = WebDriverException("WebDriver error")
         
         result = self.preloader.wait_for_complete_loading(timeout=30)
         
@@ -248,55 +251,61 @@ class TestPreloadingManager(unittest.TestCase):
             
             self.assertFalse(result)
     
-    @patch('preloading_manager.WebDriverWait')
-    def test_wait_for_ajax_complete_success(self, mock_wait):
+    def test_wait_for_ajax_complete_success(self):
         """AJAX 완료 대기 성공 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.return_value = True
+        self.mock_driver.execute_async_script.return_value = True
         
         result = self.preloader.wait_for_ajax_complete(timeout=10)
         
         self.assertTrue(result)
-        mock_wait_instance.until.assert_called_once()
-    
-    @patch('preloading_manager.WebDriverWait')
-    def test_wait_for_ajax_complete_timeout(self, mock_wait):
+        # 브라우저 안에서 폴링하므로 WebDriver 왕복은 1회
+        self.mock_driver.execute_async_script.assert_called_once()
+        script, predicate, timeout_ms = self.mock_driver.execute_async_script.call_args[0]
+        self.assertIn('window.__pm.poll', script)
+        self.assertEqual((predicate, timeout_ms), ('ajaxIdle', 10000))
+        self.mock_driver.set_script_timeout.assert_called_with(12)
+    
+    def test_wait_for_ajax_complete_timeout(self):
         """AJAX 완료 대기 타임아웃 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.side_effect = TimeoutException("Timeout")
+        self.mock_driver.execute_async_script.return_value = False
         
         result = self.preloader.wait_for_ajax_complete(timeout=10)
         
         self.assertFalse(result)
     
-    @patch('preloading_manager.WebDriverWait')
-    @patch('preloading_manager.EC')
-    def test_wait_for_specific_elements_success(self, mock_ec, mock_wait):
+    def test_wait_for_specific_elements_success(self):
         """특정 요소들 로딩 대기 성공 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
-        mock_wait_instance.until.return_value = Mock()  # Mock element
-        
         selectors = ['.selector1', '.selector2', '.selector3']
+        self.mock_driver.execute_async_script.return_value = {selector: True for selector in selectors}
+        
         results = self.preloader.wait_for_specific_elements(selectors, timeout=10)
         
         # 모든 선택자가 성공해야 함
         for selector in selectors:
             self.assertTrue(results[selector])
         
-        # WebDriverWait이 각 선택자마다 호출되었는지 확인
-        self.assertEqual(mock_wait_instance.until.call_count, len(selectors))
+        # 모든 선택자를 단 한 번의 스크립트 호출로 확인
+        self.mock_driver.execute_async_script.assert_called_once()
+        script, sent_selectors, timeout_ms, require_all = self.mock_driver.execute_async_script.call_args[0]
+        self.assertIn('window.__pm.elementsPresent', script)
+        self.assertEqual((sent_selectors, timeout_ms, require_all), (selectors, 10000, True))
     
-    @patch('preloading_manager.WebDriverWait')
-    @patch('preloading_manager.EC')
-    def test_wait_for_specific_elements_mixed_results(self, mock_ec, mock_wait):
+    def test_wait_for_specific_elements_any(self):
+        """require_all=False면 스크립트에 전달되어 첫 요소 감지 시 반환"""
+        self.mock_driver.execute_async_script.return_value = {'.a': True, '.b': False}
+        
+        results = self.preloader.wait_for_specific_elements(['.a', '.b'], timeout=10, require_all=False)
+        
+        self.assertEqual(results, {'.a': True, '.b': False})
+        self.assertFalse(self.mock_driver.execute_async_script.call_args[0][3])
+    
+    def test_wait_for_specific_elements_mixed_results(self):
         """특정 요소들 로딩 대기 혼합 결과 테스트"""
-        mock_wait_instance = Mock()
-        mock_wait.return_value = mock_wait_instance
         # 첫 번째는 성공, 두 번째는 타임아웃
-        mock_wait_instance.until.side_effect = [Mock(), TimeoutException("Timeout")]
+        self.mock_driver.execute_async_script.return_value = {
+            '.success-selector': True,
+            '.timeout-selector': False
+        }
         
         selectors = ['.success-selector', '.timeout-selector']
         results = self.preloader.wait_for_specific_elements(selectors, timeout=10)
@@ -304,18 +313,23 @@ class TestPreloadingManager(unittest.TestCase):
         self.assertTrue(results['.success-selector'])
         self.assertFalse(results['.timeout-selector'])
     
+    def test_wait_for_specific_elements_error(self):
+        """특정 요소들 로딩 대기 오류 시 모두 실패 처리 테스트"""
+        self.mock_driver.execute_async_script.side_effect = WebDriverException("WebDriver error")
+        
+        results = self.preloader.wait_for_specific_elements(['.a', '.b'], timeout=10)
+        
+        self.assertEqual(results, {'.a': False, '.b': False})
+    
     def test_get_loading_performance_metrics_success(self):
         """로딩 성능 메트릭 수집 성공 테스트"""
         mock_metrics = {
-            'navigationStart': 1000,
-            'loadEventEnd': 3000,
-            'domContentLoadedEventEnd': 2500,
-            'requestStart': 1200,
-            'responseStart': 1500,
-            'totalLoadTime': 2000,
-            'domReadyTime': 1500,
-            'firstByteTime': 300,
-            'navigationType': 0,
+            'domainLookup': 20,
+            'connect': 40,
+            'ttfb': 300,
+            'domReady': 1500,
+            'load': 2000,
+            'type': 'navigate',
             'redirectCount': 0
         }
         
@@ -324,10 +338,10 @@ class TestPreloadingManager(unittest.TestCase):
         result = self.preloader.get_loading_performance_metrics()
         
         self.assertIsInstance(result, dict)
-        self.assertEqual(result['totalLoadTime'], 2000)
-        self.assertEqual(result['totalLoadTime_seconds'], 2.0)
-        self.assertEqual(result['domReadyTime_seconds'], 1.5)
-        self.assertEqual(result['firstByteTime_seconds'], 0.3)
+        # Level 2 값은 이미 상대 시간(ms)이므로 그대로 반환
+        self.assertEqual(result, mock_metrics)
+        script = self.mock_driver.execute_script.call_args[0][0]
+        self.assertIn('window.__pm.perfMetrics', script)
     
     def test_get_loading_performance_metrics_no_performance_api(self):
         """Performance API 미지원 시 메트릭 수집 테스트"""
@@ -350,7 +364,8 @@ class TestPreloadingManager(unittest.TestCase):
         test_url = "https://cafe.naver.com/testcafe/articles/123456"
         
         with patch.object(self.preloader, 'wait_for_complete_loading', return_value=True), \
-             patch.object(self.preloader, 'wait_for_specific_elements', return_value={'.se-main-container': True}), \
+             patch.object(self.preloader, 'wait_for_specific_elements',
+                          return_value={'.se-main-container': True}) as mock_wait_elements, \
              patch.object(self.preloader, 'trigger_lazy_loading'), \
              patch.object(self.preloader, 'wait_for_ajax_complete', return_value=True), \
              patch.object(self.preloader, 'check_dynamic_content_loaded', return_value=True), \
@@ -359,6 +374,8 @@ class TestPreloadingManager(unittest.TestCase):
             result = self.preloader.adaptive_wait_strategy(url=test_url)
             
             self.assertTrue(result)
+            # 에디터는 하나만 있으므로 첫 감지 시 바로 진행
+            self.assertFalse(mock_wait_elements.call_args.kwargs['require_all'])
     
     def test_adaptive_wait_strategy_mobile_cafe(self):
         """적응형 대기 전략 - 모바일 카페 테스트"""
@@ -415,42 +432,45 @@ class TestPreloadingManagerIntegration(unittest.TestCase):
     def setUp(self):
         """테스트 설정"""
         self.mock_driver = Mock()
+        del self.mock_driver.add_cdp_listener
         self.preloader = PreloadingManager(self.mock_driver)
     
     def test_requirements_2_1_document_ready_state(self):
         """Requirements 2.1: document.readyState 확인 테스트"""
-        with patch('preloading_manager.WebDriverWait') as mock_wait:
-            mock_wait_instance = Mock()
-            mock_wait.return_value = mock_wait_instance
-            mock_wait_instance.until.return_value = True
-            
-            self.preloader.wait_for_complete_loading()
-            
-            # document.readyState 확인을 위한 lambda 함수가 호출되었는지 확인
-            mock_wait_instance.until.assert_called()
-            call_args = mock_wait_instance.until.call_args_list[0][0][0]
-            
-            # lambda 함수 테스트
-            self.mock_driver.execute_script.return_value = 'complete'
-            result = call_args(self.mock_driver)
-            self.assertTrue(result)
-            
-            self.mock_driver.execute_script.return_value = 'loading'
-            result = call_args(self.mock_driver)
-            self.assertFalse(result)
+        self.mock_driver.execute_async_script.side_effect = [
+            {'ready': True, 'jquery': True, 'loaded': True, 'editor': True, 'idle': True, 'ok': True},
+            True
+        ]
+        
+        self.assertTrue(self.preloader.wait_for_complete_loading(timeout=20))
+        
+        # 단일 스크립트에서 readyState를 포함한 모든 조건을 확인
+        script, timeout_ms, check_idle = self.mock_driver.execute_async_script.call_args_list[0][0]
+        self.assertIn('window.__pm.waitAll', script)
+        self.assertTrue(check_idle)  # CDP 미지원 드라이버는 JS로 네트워크 idle 확인
+        self.assertIn("document.readyState === 'complete'", _JS_WAIT_ALL)
+        self.assertIn('jQuery.active', _JS_WAIT_ALL)
+        self.assertIn('loadEventEnd', _JS_WAIT_ALL)
+        self.assertIn('setInterval(waitAll, 100)', _JS_WAIT_ALL)
+        self.assertEqual(timeout_ms, 20000)
+        self.mock_driver.set_script_timeout.assert_called_with(25)
     
     @patch('preloading_manager.time.sleep')
     def test_requirements_2_2_iframe_additional_wait(self, mock_sleep):
-        """Requirements 2.2: iframe 전환 후 3초 추가 대기 테스트"""
-        with patch('preloading_manager.WebDriverWait') as mock_wait:
-            mock_wait_instance = Mock()
-            mock_wait.return_value = mock_wait_instance
-            mock_wait_instance.until.return_value = True
-            
-            self.preloader.wait_for_complete_loading()
-            
-            # 3초 대기가 호출되었는지 확인
-            mock_sleep.assert_called_with(3)
+        """Requirements 2.2: iframe 전환 후 DOM 안정화 대기 테스트 (최대 3초)"""
+        self.mock_driver.execute_async_script.side_effect = [
+            {'ready': True, 'jquery': True, 'loaded': True, 'editor': True, 'idle': True, 'ok': True},
+            True
+        ]
+        
+        self.preloader.wait_for_complete_loading()
+        
+        # 고정 sleep 없이 MutationObserver 스크립트로 대기 (300ms 정적, 3000ms 상한)
+        mock_sleep.assert_not_called()
+        args = self.mock_driver.execute_async_script.call_args[0]
+        self.assertIn('window.__pm.domQuiet', args[0])
+        self.assertIn('MutationObserver', _JS_DOM_QUIET)
+        self.assertEqual(args[1:], (300, 3000))
     
     @patch('preloading_manager.time.sleep')
     def test_requirements_2_3_scroll_lazy_loading(self, mock_sleep):
@@ -467,8 +487,10 @@ class TestPreloadingManagerIntegration(unittest.TestCase):
         
         self.mock_driver.execute_script.side_effect = [
             scroll_info,  # 스크롤 정보
-            None, None, None, None, None,  # 수직 스크롤 패턴
+            None,  # 네이버 카페 lazy loading
+            3,     # 이미지 lazy loading
             None,  # 원래 위치로 복원
+            ['https://cafe.naver.com/a/1', 2000, 3],  # 처리 후 페이지 상태 기록
         ]
         
         # Mock find_elements for image lazy loading
@@ -478,11 +500,12 @@ class TestPreloadingManagerIntegration(unittest.TestCase):
         
         # 스크롤 정보 수집이 호출되었는지 확인
         first_call = self.mock_driver.execute_script.call_args_list[0]
-        self.assertIn('originalY', first_call[0][0])
+        self.assertIn('window.__pm.scrollInfo', first_call[0][0])
         
         # 원래 위치로 복원 호출 확인
-        restore_call = self.mock_driver.execute_script.call_args_list[-1]
+        restore_call = self.mock_driver.execute_script.call_args_list[-2]
         self.assertIn('scrollTo(0, 0)', restore_call[0][0])
+        self.assertEqual(self.preloader._last_lazy_sig, ('https://cafe.naver.com/a/1', 2000, 3))
     
     def test_new_lazy_loading_features(self):
         """새로운 lazy loading 기능들 테스트"""
@@ -516,26 +539,151 @@ class TestPreloadingManagerIntegration(unittest.TestCase):
             self.preloader._trigger_image_lazy_loading.assert_called_once()
             self.preloader._perform_horizontal_scroll_pattern.assert_called_once_with(scroll_info)
     
+    def test_network_idle_via_cdp_lifecycle_event(self):
+        """CDP Page.lifecycleEvent 기반 네트워크 idle 대기 테스트"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+            {'frameTree': {'frame': {'id': 'MAIN'}}} if cmd == 'Page.getFrameTree' else {}
+        )
+        preloader = PreloadingManager(driver)
+        
+        driver.execute_cdp_cmd.assert_any_call('Page.setLifecycleEventsEnabled', {'enabled': True})
+        event_name, listener = driver.add_cdp_listener.call_args[0]
+        self.assertEqual(event_name, 'Page.lifecycleEvent')
+        
+        # 하위 프레임(광고, cafe_main 등)의 이벤트는 무시
+        listener({'params': {'name': 'networkIdle', 'frameId': 'AD_FRAME'}})
+        self.assertFalse(preloader._wait_for_network_idle(timeout=0))
+        
+        listener({'params': {'name': 'networkIdle', 'frameId': 'MAIN'}})
+        self.assertTrue(preloader._wait_for_network_idle(timeout=0))
+        listener({'params': {'name': 'init', 'frameId': 'AD_FRAME'}})
+        self.assertTrue(preloader._wait_for_network_idle(timeout=0))
+        
+        # 새 문서 로딩이 시작되면 다시 대기 상태
+        listener({'params': {'name': 'init', 'frameId': 'MAIN'}})
+        self.assertFalse(preloader._wait_for_network_idle(timeout=0))
+        
+        # CDP 사용 시 JS 쪽 리소스 폴링은 생략
+        listener({'params': {'name': 'networkIdle', 'frameId': 'MAIN'}})
+        driver.execute_async_script.side_effect = [
+            {'ready': True, 'jquery': True, 'loaded': True, 'editor': True, 'idle': True, 'ok': True},
+            True
+        ]
+        self.assertTrue(preloader.wait_for_complete_loading(timeout=30))
+        self.assertEqual(driver.execute_async_script.call_args_list[0][0][2], False)
+    
+    def test_network_idle_seeded_for_loaded_page(self):
+        """이미 로드된 페이지에서 생성 시 networkIdle 대기 없이 통과 테스트"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+            {'frameTree': {'frame': {'id': 'MAIN'}}} if cmd == 'Page.getFrameTree' else {}
+        )
+        driver.execute_script.return_value = 'complete'
+        
+        preloader = PreloadingManager(driver)
+        
+        self.assertTrue(preloader._wait_for_network_idle(timeout=0))
+    
+    def test_network_idle_listener_not_enabled(self):
+        """add_cdp_listener가 False를 반환하면 JS 폴링 사용 테스트"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+            {'frameTree': {'frame': {'id': 'MAIN'}}} if cmd == 'Page.getFrameTree' else {}
+        )
+        driver.add_cdp_listener.return_value = False
+        
+        preloader = PreloadingManager(driver)
+        
+        self.assertIsNone(preloader._net_idle_evt)
+    
+    def test_pm_functions_installed_on_new_document(self):
+        """window.__pm 미설치 문서에서 설치 후 재호출 테스트"""
+        from selenium.common.exceptions import JavascriptException
+        self.mock_driver.execute_script.side_effect = [
+            JavascriptException("window.__pm is undefined"),
+            None,  # 설치 스크립트
+            True
+        ]
+        
+        self.assertTrue(self.preloader.check_dynamic_content_loaded())
+        
+        scripts = [c[0][0] for c in self.mock_driver.execute_script.call_args_list]
+        self.assertEqual(scripts[1], _JS_INSTALL_PM)
+        self.assertEqual(scripts[0], scripts[2])
+    
+    @patch('preloading_manager.time.sleep')
+    def test_trigger_lazy_loading_skips_unchanged_page(self, mock_sleep):
+        """페이지 변화가 없으면 lazy loading 재실행 생략 테스트"""
+        scroll_info = {
+            'originalY': 0, 'originalX': 0,
+            'bodyHeight': 2000, 'windowHeight': 800,
+            'bodyWidth': 1200, 'windowWidth': 1200,
+            'url': 'https://cafe.naver.com/a/1', 'imageCount': 4
+        }
+        
+        with patch.object(self.preloader, '_perform_vertical_scroll_pattern') as vertical, \
+             patch.object(self.preloader, '_trigger_naver_cafe_lazy_loading'), \
+             patch.object(self.preloader, '_trigger_image_lazy_loading'):
+            
+            self.mock_driver.execute_script.side_effect = [
+                scroll_info, None, ['https://cafe.naver.com/a/1', 2000, 4],  # 첫 실행
+                scroll_info,  # 재시도: 동일한 상태
+            ]
+            
+            self.preloader.trigger_lazy_loading()
+            self.preloader.trigger_lazy_loading()
+            
+            vertical.assert_called_once()
+    
+    def test_preload_many_runs_each_driver(self):
+        """여러 드라이버 동시 적응형 대기 테스트"""
+        drivers = [Mock(), Mock()]
+        for driver in drivers:
+            del driver.add_cdp_listener
+        # 같은 URL이어도 결과가 서로 덮어쓰지 않고 입력 순서대로 반환
+        url = 'https://cafe.naver.com/a/1'
+        
+        results_by_driver = {id(drivers[0]): True, id(drivers[1]): False}
+        
+        def fake_adaptive(manager, current_url):
+            return results_by_driver[id(manager.driver)]
+        
+        with patch.object(PreloadingManager, 'adaptive_wait_strategy', autospec=True, side_effect=fake_adaptive):
+            results = PreloadingManager.preload_many([(drivers[0], url), (drivers[1], url)])
+        
+        self.assertEqual(results, [True, False])
+        self.assertEqual(PreloadingManager.preload_many([]), [])
+    
+    def test_for_driver_reuses_manager(self):
+        """드라이버당 매니저 재사용 테스트 (CDP 리스너 중복 등록 방지)"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = lambda cmd, params: (
+            {'frameTree': {'frame': {'id': 'MAIN'}}} if cmd == 'Page.getFrameTree' else {}
+        )
+        
+        first = PreloadingManager.for_driver(driver)
+        second = PreloadingManager.for_driver(driver, ExtractionConfig())
+        
+        self.assertIs(first, second)
+        driver.add_cdp_listener.assert_called_once()
+    
     def test_enhanced_javascript_loading_detection(self):
         """향상된 JavaScript 로딩 감지 테스트"""
-        with patch.object(self.preloader, '_wait_for_javascript_libraries', return_value=True), \
-             patch.object(self.preloader, '_wait_for_naver_cafe_scripts', return_value=True), \
-             patch.object(self.preloader, '_wait_for_network_idle', return_value=True), \
-             patch('preloading_manager.WebDriverWait') as mock_wait, \
-             patch('preloading_manager.time.sleep'):
-            
-            mock_wait_instance = Mock()
-            mock_wait.return_value = mock_wait_instance
-            mock_wait_instance.until.return_value = True
+        with patch.object(self.preloader, '_wait_for_dom_quiescence', return_value=True):
+            self.mock_driver.execute_async_script.return_value = {
+                'ready': True, 'jquery': True, 'loaded': True, 'editor': True, 'idle': True, 'ok': True
+            }
             
             result = self.preloader.wait_for_complete_loading()
             
             self.assertTrue(result)
-            # 새로운 대기 메서드들이 호출되었는지 확인
-            self.preloader._wait_for_javascript_libraries.assert_called_once()
-            self.preloader._wait_for_naver_cafe_scripts.assert_called_once()
-            self.preloader._wait_for_network_idle.assert_called_once()
-
+            # 준비 상태 확인은 단 한 번의 WebDriver 왕복으로 끝나야 함
+            self.mock_driver.execute_async_script.assert_called_once()
+            for selector in ('.se-main-container', '.ContentRenderer', '#postViewArea', '#content-area', '#tbody'):
+                self.assertIn(selector, _JS_WAIT_ALL)
+            self.assertIn("getEntriesByType('resource')", _JS_WAIT_ALL)
+            self.preloader._wait_for_dom_quiescence.assert_called_once()
 
 if __name__ == '__main__':
     # 로깅 설정 (테스트 중 로그 출력 방지)